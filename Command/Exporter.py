@@ -23,9 +23,11 @@
 # from warnings import warn
 import logging
 import gevent
+import numpy
 from gevent.queue import Queue
 from HardwareRepository.CommandContainer import CommandObject, ChannelObject
 from .exporter import ExporterClient
+from .exporter.ExporterClient import ARRAY_SEPARATOR
 from .exporter.StandardClient import PROTOCOL
 
 __copyright__ = """ Copyright © 2019 by the MXCuBE collaboration """
@@ -33,12 +35,115 @@ __license__ = "LGPLv3+"
 
 EXPORTER_CLIENTS = {}
 
+_BOOLEANS = {"false": False, "true": True}
 
-def start_exporter(address, port, timeout=3, retries=1):
-    """Start the exporter"""
+# first characters of the strings that int() or float() can convert
+_NUMBER_START = frozenset("0123456789+-.iInN \t\n\r")
+
+
+def _split_array(value):
+    """Split an exporter array, None if the value is not an array"""
+    if not value.startswith(ARRAY_SEPARATOR):
+        return None
+    if value == ARRAY_SEPARATOR:
+        return []
+    return value.strip(ARRAY_SEPARATOR).split(ARRAY_SEPARATOR)
+
+
+def _decode_bool(value):
+    return _BOOLEANS[value]
+
+
+def _decode_float(value):
+    # the values int() can convert are guessed as int
+    try:
+        int(value)
+    except ValueError:
+        return float(value)
+    raise ValueError("Not a float: %r" % value)
+
+
+def _decode_int_list(value):
+    return list(map(int, _split_array(value)))
+
+
+def _decode_float_list(value):
+    items = _split_array(value)
+    # the arrays of ints are guessed as int lists
+    try:
+        list(map(int, items))
+    except ValueError:
+        return list(map(float, items))
+    raise ValueError("Not a float array: %r" % value[:40])
+
+
+def _guess_value(value):
+    """Convert an exporter value, guessing its type
+    Args:
+        value (str): String from the exporter
+    Returns:
+        (tuple): converted value, decoder to use for the next values of the
+                 same property or None if the type is not worth remembering.
+                 A decoder raises ValueError, KeyError or TypeError for the
+                 values of another type: it never returns a value of
+                 another type than the guessed one
+    """
+    if ARRAY_SEPARATOR in value:
+        items = _split_array(value)
+        if items is None:
+            return None, None
+        try:
+            return list(map(int, items)), _decode_int_list
+        except ValueError:
+            try:
+                return list(map(float, items)), _decode_float_list
+            except ValueError:
+                return items, None
+
+    if value in _BOOLEANS:
+        return _BOOLEANS[value], _decode_bool
+    if value[:1] in _NUMBER_START:
+        try:
+            return int(value), int
+        except ValueError:
+            try:
+                return float(value), _decode_float
+            except ValueError:
+                pass
+    return value, None
+
+
+def to_numpy_array(value, dtype):
+    """Convert an exporter array to a numpy array
+    Args:
+        value (str): String from the exporter
+        dtype: numpy data type of the elements
+    Returns:
+        (numpy.ndarray): the array
+    Raises:
+        ValueError: the value is not an array of dtype elements
+    """
+    dtype = numpy.dtype(dtype)
+    if not value.startswith(ARRAY_SEPARATOR):
+        raise ValueError("Not an exporter array: %r" % value[:40])
+    if dtype.kind in "iuf":
+        items = value.strip(ARRAY_SEPARATOR)
+        # parsed in C, without intermediate python strings
+        array = numpy.fromstring(items, dtype=dtype, sep=ARRAY_SEPARATOR)
+        # depending on the numpy version, parsing may stop at the first
+        # malformed element instead of failing
+        if array.size != (items.count(ARRAY_SEPARATOR) + 1 if items else 0):
+            raise ValueError("Malformed exporter array: %r" % value[:40])
+        return array
+    return numpy.array(_split_array(value), dtype=dtype)
+
+
+def start_exporter(address, port, timeout=3, retries=1, pipelined=False):
+    """Start the exporter. The client is shared: the arguments of the
+    first call for an address and port are used."""
     global EXPORTER_CLIENTS
     if (address, port) not in EXPORTER_CLIENTS:
-        client = Exporter(address, port, timeout)
+        client = Exporter(address, port, timeout, pipelined=pipelined)
         EXPORTER_CLIENTS[(address, port)] = client
         client.start()
         return client
@@ -69,13 +174,19 @@ class Exporter(ExporterClient.ExporterClient, object):
     STATE_FAULT = "Fault"
     STATE_UNKNOWN = "Unknown"
 
-    def __init__(self, address, port, timeout=3, retries=1):
-        super(Exporter, self).__init__(address, port, PROTOCOL.STREAM, timeout, retries)
+    def __init__(self, address, port, timeout=3, retries=1, pipelined=False):
+        super(Exporter, self).__init__(
+            address, port, PROTOCOL.STREAM, timeout, retries, pipelined
+        )
 
         self.started = False
         self.callbacks = {}
         self.events_queue = Queue()
         self.events_processing_task = None
+        # property name -> declared numpy dtype of the array elements
+        self._property_dtypes = {}
+        # property name -> decoder of the type detected on the last value
+        self._property_decoders = {}
 
     def start(self):
         """Start"""
@@ -84,19 +195,42 @@ class Exporter(ExporterClient.ExporterClient, object):
         """Stop"""
         self.disconnect()
 
-    def execute(self, *args, **kwargs):
-        """Execute"""
-        ret = ExporterClient.ExporterClient.execute(self, *args, **kwargs)
-        return self._to_python_value(ret)
+    def execute(self, method, pars=None, timeout=-1, dtype=None):
+        """Execute
+        Args:
+            method (str): Method name
+            pars (tuple): Parameters
+            timeout (float): Timeout [s]
+            dtype: numpy data type of the elements, if an array is returned
+        """
+        ret = ExporterClient.ExporterClient.execute(self, method, pars, timeout)
+        return self._to_python_value(ret, dtype=dtype)
 
     def get_state(self):
         """Read the state"""
         return self.execute("getState")
 
-    def read_property(self, *args, **kwargs):
+    def read_property(self, prop, timeout=-1):
         """Read a property"""
-        ret = ExporterClient.ExporterClient.read_property(self, *args, **kwargs)
-        return self._to_python_value(ret)
+        ret = ExporterClient.ExporterClient.read_property(self, prop, timeout)
+        return self._to_python_value(ret, prop)
+
+    def read_properties(self, props, timeout=-1):
+        """Read several properties in one burst"""
+        ret = ExporterClient.ExporterClient.read_properties(self, props, timeout)
+        return [self._to_python_value(value, prop) for prop, value in zip(props, ret)]
+
+    def set_property_dtype(self, prop, dtype):
+        """Declare the element type of an array property: its values are
+        then returned as numpy arrays
+        Args:
+            prop (str): Property name
+            dtype: numpy data type of the elements, None to remove
+        """
+        if dtype is None:
+            self._property_dtypes.pop(prop, None)
+        else:
+            self._property_dtypes[prop] = numpy.dtype(dtype)
 
     def reconnect(self):
         """Reconnect"""
@@ -112,36 +246,43 @@ class Exporter(ExporterClient.ExporterClient, object):
         if not self.events_processing_task:
             self.events_processing_task = gevent.spawn(self.process_events_from_queue)
 
-    def _to_python_value(self, value):
-        """Convert exporter value to python one
+    def _to_python_value(self, value, prop=None, dtype=None):
+        """Convert exporter value to python one.
+        Arrays of a declared dtype are returned as numpy arrays. Otherwise
+        the type is guessed (int, float, bool or str, or lists of them).
+        The numeric and boolean types guessed for a property are remembered
+        and tried first on its next values; the type is guessed again when
+        a value does not decode to the remembered type.
         Args:
             value (str): String from the exporter
+            prop (str): Name of the property the value comes from
+            dtype: numpy data type of the elements, if the value is an array
         """
         if value is None:
             return value
 
-        if "\x1f" in value:
-            value = self.parse_array(value)
+        if prop is not None:
+            dtype = self._property_dtypes.get(prop, dtype)
+        if dtype is not None and value.startswith(ARRAY_SEPARATOR):
             try:
-                value = list(map(int, value))
-            except (TypeError, ValueError):
-                try:
-                    value = list(map(float, value))
-                except (TypeError, ValueError):
-                    pass
+                return to_numpy_array(value, dtype)
+            except ValueError:
+                pass
+
+        if prop is None:
+            return _guess_value(value)[0]
+
+        decoder = self._property_decoders.get(prop)
+        if decoder is not None:
+            try:
+                return decoder(value)
+            except (KeyError, TypeError, ValueError):
+                pass
+        value, decoder = _guess_value(value)
+        if decoder is None:
+            self._property_decoders.pop(prop, None)
         else:
-            if value == "false":
-                value = False
-            elif value == "true":
-                value = True
-            else:
-                try:
-                    value = int(value)
-                except (TypeError, ValueError):
-                    try:
-                        value = float(value)
-                    except (TypeError, ValueError):
-                        pass
+            self._property_decoders[prop] = decoder
         return value
 
     def on_event(self, name, value, timestamp):
@@ -163,7 +304,7 @@ class Exporter(ExporterClient.ExporterClient, object):
 
             for cb in self.callbacks.get(name, []):
                 try:
-                    cb(self._to_python_value(value))
+                    cb(self._to_python_value(value, name))
                 except Exception:
                     msg = "Exception while executing callback {} for event {}".format(
                         cb, name
@@ -180,7 +321,10 @@ class ExporterCommand(CommandObject):
     ):
         CommandObject.__init__(self, name, username, **kwargs)
         self.command = command
-        self.__exporter = start_exporter(address, port, timeout)
+        self.dtype = kwargs.get("dtype")
+        self.__exporter = start_exporter(
+            address, port, timeout, pipelined=kwargs.get("pipelined", False)
+        )
         msg = "Attaching Exporter command: {} {}".format(address, name)
         logging.getLogger("HWR").debug(msg)
 
@@ -188,7 +332,9 @@ class ExporterCommand(CommandObject):
         self.emit("commandBeginWaitReply", (str(self.name()),))
 
         try:
-            ret = self.__exporter.execute(self.command, args, kwargs.get("timeout", -1))
+            ret = self.__exporter.execute(
+                self.command, args, kwargs.get("timeout", -1), self.dtype
+            )
         except Exception:
             self.emit("commandFailed", (-1, self.name()))
             raise
@@ -229,10 +375,14 @@ class ExporterChannel(ChannelObject):
     ):
         ChannelObject.__init__(self, name, username, **kwargs)
 
-        self.__exporter = start_exporter(address, port, timeout)
+        self.__exporter = start_exporter(
+            address, port, timeout, pipelined=kwargs.get("pipelined", False)
+        )
         self.attribute_name = attribute_name
         self.value = None
 
+        if kwargs.get("dtype"):
+            self.__exporter.set_property_dtype(attribute_name, kwargs["dtype"])
         self.__exporter.register(attribute_name, self.update)
 
         msg = "Attaching Exporter channel: {} {} ".format(address, name)
@@ -242,7 +392,8 @@ class ExporterChannel(ChannelObject):
 
     def update(self, value=None):
         """Emit signal update when value changed"""
-        value = value or self.get_value()
+        if value is None or (not isinstance(value, numpy.ndarray) and not value):
+            value = self.get_value()
         if isinstance(value, tuple):
             value = list(value)
 
@@ -21,6 +21,9 @@
 import logging
 import gevent
 import gevent.event
+import gevent.lock
+import numpy
+import time
 from gevent.queue import Queue
 from HardwareRepository.CommandContainer import (
     CommandObject,
@@ -45,6 +48,148 @@ __license__ = "LGPLv3+"
 
 log = logging.getLogger("HWR")
 
+
+class DeviceProxyPool:
+    """Process-wide pool of Tango device proxies
+
+    Gives one pinged gevent DeviceProxy per device name and client timeout,
+    one raw (synchronous) DeviceProxy per device name for the polling
+    threads and a cache of the attribute names of each device, queried
+    once. A proxy is dropped with invalidate() when the connection is
+    lost; the next request reconnects.
+
+    Attributes:
+        default_timeout (int): client timeout [ms] applied to proxies
+            requested without timeout, None to keep the Tango default
+    """
+
+    def __init__(self):
+        self.default_timeout = None
+        self._devices = {}
+        self._raw_devices = {}
+        self._attribute_names = {}
+        self._locks = {}
+        self._known_devices = set()
+        self._statistics = {
+            "hits": 0,
+            "misses": 0,
+            "reconnects": 0,
+            "connect_time": 0,
+        }
+
+    def get_device(self, device_name, timeout=None):
+        """Return a pinged gevent DeviceProxy
+
+        Args:
+            device_name (str): Tango device name
+            timeout (int): client timeout [ms]
+
+        Returns:
+            (DeviceProxy): shared proxy
+
+        Raises:
+            PyTango.DevFailed: the proxy could not be created
+            PyTango.ConnectionFailed: the device does not answer to ping
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        key = (device_name.lower(), timeout)
+
+        with self._get_lock(key):
+            device = self._devices.get(key)
+            if device is not None:
+                self._statistics["hits"] += 1
+                return device
+
+            self._statistics["misses"] += 1
+            if key in self._known_devices:
+                self._statistics["reconnects"] += 1
+
+            start_time = time.time()
+            try:
+                device = DeviceProxy(device_name)
+                device.ping()
+                if timeout is not None:
+                    device.set_timeout_millis(timeout)
+            finally:
+                self._statistics["connect_time"] += time.time() - start_time
+
+            self._devices[key] = device
+            self._known_devices.add(key)
+            return device
+
+    def get_raw_device(self, device_name):
+        """Return a synchronous DeviceProxy, for use outside of gevent
+
+        Args:
+            device_name (str): Tango device name
+
+        Returns:
+            (PyTango.DeviceProxy): shared proxy
+        """
+        key = device_name.lower()
+        device = self._raw_devices.get(key)
+        if device is None:
+            self._statistics["misses"] += 1
+            device = RawDeviceProxy(device_name)
+            self._raw_devices[key] = device
+        else:
+            self._statistics["hits"] += 1
+        return device
+
+    def get_attribute_names(self, device_name, timeout=None):
+        """Return the lower case attribute names of a device
+
+        Args:
+            device_name (str): Tango device name
+            timeout (int): client timeout [ms] of the proxy used for the query
+
+        Returns:
+            (frozenset): attribute names, queried once per device
+        """
+        key = device_name.lower()
+        attribute_names = self._attribute_names.get(key)
+        if attribute_names is None:
+            device = self.get_device(device_name, timeout)
+            attribute_names = frozenset(
+                attr.name.lower() for attr in device.attribute_list_query()
+            )
+            self._attribute_names[key] = attribute_names
+        return attribute_names
+
+    def invalidate(self, device_name):
+        """Drop the proxies and cached attributes of a device
+
+        Args:
+            device_name (str): Tango device name
+        """
+        name = device_name.lower()
+        for key in [key for key in self._devices if key[0] == name]:
+            del self._devices[key]
+        self._raw_devices.pop(name, None)
+        self._attribute_names.pop(name, None)
+
+    def get_statistics(self):
+        """Return the pool statistics
+
+        Returns:
+            (dict): number of proxies, cache hits and misses, reconnections
+                and total time spent connecting [s]
+        """
+        stats = dict(self._statistics)
+        stats["proxies"] = len(self._devices) + len(self._raw_devices)
+        return stats
+
+    def _get_lock(self, key):
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks.setdefault(key, gevent.lock.Semaphore())
+        return lock
+
+
+device_pool = DeviceProxyPool()
+
+
 class TangoCommand(CommandObject):
     def __init__(self, name, command, tangoname=None, username=None, **kwargs):
         CommandObject.__init__(self, name, username, **kwargs)
@@ -55,19 +200,16 @@ class TangoCommand(CommandObject):
 
     def init_device(self):
         try:
-            self.device = DeviceProxy(self.device_name)
+            self.device = device_pool.get_device(self.device_name)
+        except PyTango.ConnectionFailed:
+            self.device = None
+            raise ConnectionError
         except PyTango.DevFailed as traceback:
             last_error = traceback[-1]
             logging.getLogger("HWR").error(
                 "%s: %s", str(self.name()), last_error["desc"]
             )
             self.device = None
-        else:
-            try:
-                self.device.ping()
-            except PyTango.ConnectionFailed:
-                self.device = None
-                raise ConnectionError
 
     def __call__(self, *args, **kwargs):
         self.emit("commandBeginWaitReply", (str(self.name()),))
@@ -101,9 +243,13 @@ class TangoCommand(CommandObject):
         pass
 
     def set_device_timeout(self, timeout):
-        if self.device is None:
-            self.init_device()
-        self.device.set_timeout_millis(timeout)
+        # proxies are shared: use the one of the device with this timeout,
+        # never call set_timeout_millis on self.device
+        try:
+            self.device = device_pool.get_device(self.device_name, timeout)
+        except PyTango.ConnectionFailed:
+            self.device = None
+            raise ConnectionError
 
     def is_connected(self):
         return self.device is not None
@@ -133,12 +279,158 @@ class E:
         self.event = event
 
 
+def _is_equal(value, other):
+    try:
+        return bool(value == other)
+    except ValueError:
+        # arrays
+        return numpy.array_equal(value, other)
+
+
+class _TangoPollingGroup:
+    """Polled attributes of one device, read with a single read_attributes
+
+    Channels of the same device, polling period and read_as_str setting
+    share one poller. Each tick reads all attributes in one round trip,
+    compares them to the previous values in the polling thread and hands
+    only the changed ones to the channels update().
+    """
+
+    _groups = {}
+
+    @classmethod
+    def register(cls, channel):
+        """Add a polled channel to the group of its device
+
+        Args:
+            channel (TangoChannel): channel with an integer polling period
+
+        Returns:
+            (_TangoPollingGroup): group polling the channel
+        """
+        key = (channel.device_name.lower(), channel.polling, channel.read_as_str)
+        group = cls._groups.get(key)
+        if group is None:
+            group = cls(key, channel.device_name, channel.polling, channel.read_as_str)
+            cls._groups[key] = group
+        group.add(channel)
+        return group
+
+    def __init__(self, key, device_name, polling_period, read_as_str):
+        self.key = key
+        self.device_name = device_name
+        self.polling_period = polling_period
+        self.read_as_str = read_as_str
+        self.raw_device = device_pool.get_raw_device(device_name)
+        # attribute name -> list of channels
+        self.channels = {}
+        self.attribute_names = ()
+        # last read values, only accessed from the polling thread
+        self.values = {}
+        self.changes = (0, {})
+        self.poller = None
+
+    def add(self, channel):
+        self.channels.setdefault(channel.attribute_name, []).append(channel)
+        self.attribute_names = tuple(self.channels)
+        # make sure the new channel gets the current value
+        self.values.pop(channel.attribute_name, None)
+
+        if self.poller is None:
+            self.poller = Poller.poll(
+                self.poll,
+                polling_period=self.polling_period,
+                value_changed_callback=self.update,
+                error_callback=self.poll_failed,
+            )
+            self.poller.name = self.device_name
+
+    def remove(self, channel):
+        channels = self.channels.get(channel.attribute_name, [])
+        if channel in channels:
+            channels.remove(channel)
+        if not channels:
+            self.channels.pop(channel.attribute_name, None)
+            self.attribute_names = tuple(self.channels)
+        if not self.channels:
+            self.stop()
+
+    def stop(self):
+        if self._groups.get(self.key) is self:
+            del self._groups[self.key]
+        if self.poller is not None and not self.poller.is_stopped():
+            self.poller.stop()
+
+    def poll(self):
+        """Read all attributes, called from the polling thread
+
+        Returns:
+            (tuple): (generation, {attribute name: new value or DevFailed});
+                the same object is returned as long as nothing changed
+        """
+        attribute_names = self.attribute_names
+        args = (PyTango.DeviceAttribute.ExtractAs.String,) if self.read_as_str else ()
+        try:
+            attributes = self.raw_device.read_attributes(attribute_names, *args)
+        except PyTango.DevFailed:
+            # e.g. an attribute removed from the device: read them one by
+            # one, so that only the channels of the failed ones are stopped
+            attributes = []
+            for attribute_name in attribute_names:
+                try:
+                    attributes.append(
+                        self.raw_device.read_attribute(attribute_name, *args)
+                    )
+                except PyTango.DevFailed as error:
+                    attributes.append(error)
+            if all(isinstance(attribute, Exception) for attribute in attributes):
+                raise
+
+        changes = {}
+        for attribute_name, attribute in zip(attribute_names, attributes):
+            if isinstance(attribute, PyTango.DevFailed):
+                changes[attribute_name] = attribute
+                continue
+            if attribute.has_failed:
+                changes[attribute_name] = PyTango.DevFailed(
+                    *attribute.get_err_stack()
+                )
+                continue
+            value = attribute.value
+            old_value = self.values.get(attribute_name, Poller.NotInitializedValue)
+            if not _is_equal(value, old_value):
+                self.values[attribute_name] = value
+                changes[attribute_name] = value
+
+        if changes:
+            self.changes = (self.changes[0] + 1, changes)
+        return self.changes
+
+    def update(self, changes):
+        for attribute_name, value in changes[1].items():
+            for channel in list(self.channels.get(attribute_name, ())):
+                if isinstance(value, PyTango.DevFailed):
+                    # as for a single polled attribute, stop polling on error
+                    self.remove(channel)
+                    channel.poll_failed(value, self.poller.get_id())
+                else:
+                    channel.update(value)
+
+    def poll_failed(self, e, poller_id):
+        self.stop()
+        device_pool.invalidate(self.device_name)
+        for channels in list(self.channels.values()):
+            for channel in channels:
+                channel.poll_failed(e, poller_id)
+
+
 class TangoChannel(ChannelObject):
     _tangoEventsQueue = Queue()
     _eventReceivers = {}
 
     if gevent_version < [1,3,0]:
-        _tangoEventsProcessingTimer = gevent.get_hub().loop.async()
+        # 'async' is a keyword from Python 3.7
+        _tangoEventsProcessingTimer = getattr(gevent.get_hub().loop, "async")()
     else:
         _tangoEventsProcessingTimer = gevent.get_hub().loop.async_()
 
@@ -163,6 +455,7 @@ class TangoChannel(ChannelObject):
         self.value = Poller.NotInitializedValue
         self.polling = polling
         self.polling_timer = None
+        self.polling_group = None
         self.polling_events = False
         self.timeout = int(timeout)
         self.read_as_str = kwargs.get("read_as_str", False)
@@ -198,15 +491,14 @@ class TangoChannel(ChannelObject):
         # self.init_poller.stop()
 
         if isinstance(self.polling, int):
-
-            self.raw_device = RawDeviceProxy(self.device_name)
-            
-            Poller.poll(
-                self.poll,
-                polling_period=self.polling,
-                value_changed_callback=self.update,
-                error_callback=self.poll_failed,
-            )
+            if self.device is None:
+                # the attribute does not exist (already logged): polling
+                # it would fail the reads of the whole group
+                self._device_initialized.set()
+                return
+            self.polling_group = _TangoPollingGroup.register(self)
+            # shared with the polling group and the other channels of the device
+            self.raw_device = self.polling_group.raw_device
         else:
             if self.polling == "events":
                 # try to register event
@@ -228,7 +520,11 @@ class TangoChannel(ChannelObject):
 
     def init_device(self):
         try:
-            self.device = DeviceProxy(self.device_name)
+            self.device = device_pool.get_device(self.device_name, self.timeout)
+        except PyTango.ConnectionFailed:
+            self.imported = True
+            self.device = None
+            raise ConnectionError
         except PyTango.DevFailed as traceback:
             self.imported = False
             last_error = traceback[-1]
@@ -237,24 +533,18 @@ class TangoChannel(ChannelObject):
             )
         else:
             self.imported = True
-            try:
-                self.device.ping()
-            except PyTango.ConnectionFailed:
+
+            # check that the attribute exists (to avoid Abort in PyTango grrr)
+            attribute_names = device_pool.get_attribute_names(
+                self.device_name, self.timeout
+            )
+            if not self.attribute_name.lower() in attribute_names:
+                logging.getLogger("HWR").error(
+                    "no attribute %s in Tango device %s",
+                    self.attribute_name,
+                    self.device_name,
+                )
                 self.device = None
-                raise ConnectionError
-            else:
-                self.device.set_timeout_millis(self.timeout)
-
-                # check that the attribute exists (to avoid Abort in PyTango grrr)
-                if not self.attribute_name.lower() in [
-                    attr.name.lower() for attr in self.device.attribute_list_query()
-                ]:
-                    logging.getLogger("HWR").error(
-                        "no attribute %s in Tango device %s",
-                        self.attribute_name,
-                        self.device_name,
-                    )
-                    self.device = None
 
     def push_event(self, event):
         # logging.getLogger("HWR").debug("%s | attr_value=%s, event.errors=%s, quality=%s", self.name(), event.attr_value, event.errors,event.attr_value is None and "N/A" or event.attr_value.quality)
@@ -273,18 +563,6 @@ class TangoChannel(ChannelObject):
         TangoChannel._tangoEventsQueue.put(ev)
         TangoChannel._tangoEventsProcessingTimer.send()
 
-    def poll(self):
-
-        if self.read_as_str:
-            value = self.raw_device.read_attribute(
-                self.attribute_name, PyTango.DeviceAttribute.ExtractAs.String
-            ).value
-            # value = self.device.read_attribute_as_str(self.attribute_name).value
-        else:
-            value = self.raw_device.read_attribute(self.attribute_name).value
-
-        return value
-
     def poll_failed(self, e, poller_id):
         self.emit("update", None)
         """
@@ -20,9 +20,9 @@
 
 import time
 import logging
-import Queue
 import weakref
 import atexit
+from collections import deque
 
 import gevent
 import tine
@@ -33,6 +33,11 @@ from HardwareRepository.CommandContainer import CommandObject, ChannelObject
 __copyright__ = """ Copyright © 2010 - 2020 by MXCuBE Collaboration """
 __license__ = "LGPLv3+"
 
+gevent_version = list(map(int, gevent.__version__.split(".")))
+
+# Attributes whose every value is delivered (see TineChannel keep_all)
+STREAMED_ATTRIBUTES = ("dozor-pass", "ff-ssim")
+
 
 class TineCommand(CommandObject):
     def __init__(
@@ -99,38 +104,140 @@ class TineCommand(CommandObject):
         return True
 
 
-def emit_tine_channel_updates():
-    while not TineChannel.updates.empty():
-        try:
-            channel_obj_ref, value = TineChannel.updates.get()
-        except Queue.Empty:
-            break
+class TineUpdateDispatcher(object):
+    """Delivers the values received by TINE callback threads to the channels,
+    in the gevent loop
+
+    The first update after an idle period wakes the gevent hub through an
+    async watcher; all updates received until then are emitted by a single
+    greenlet. Updates are coalesced per channel (only the latest value is
+    emitted) unless the channel keeps all values.
+    """
+
+    def __init__(self):
+        # channel id -> (channel reference, value, reception time)
+        self._latest = {}
+        # channel id -> deque of (channel reference, value, reception time)
+        self._streams = {}
+        # channel ids in order of reception, one per update
+        self._pending = deque()
+        self._statistics = {}
+        self._dispatcher = None
+
+        if gevent_version < [1, 3, 0]:
+            # 'async' is a keyword from Python 3.7
+            self._async_watcher = getattr(gevent.get_hub().loop, "async")()
         else:
-            channel_object = channel_obj_ref()
-            if channel_object is not None:
-                try:
-                    channel_object.emit("update", (value,))
-                except Exception:
-                    logging.getLogger("HWR").exception(
-                        "Exception while emitting new value for channel %s",
-                        channel_object.name(),
-                    )
+            self._async_watcher = gevent.get_hub().loop.async_()
+        self._async_watcher.start(self._wake_up)
+
+    def put(self, channel, value, keep_all=False):
+        """Queue a new value of a channel, thread safe
+
+        Args:
+            channel (TineChannel): channel
+            value: new value
+            keep_all (bool): deliver this value even if a newer one arrives
+        """
+        channel_id = id(channel)
+        received = time.time()
+        self._get_statistics(channel_id, channel)["updates"] += 1
+        if keep_all:
+            stream = self._streams.get(channel_id)
+            if stream is None:
+                stream = self._streams.setdefault(channel_id, deque())
+            stream.append((weakref.ref(channel), value, received))
+        else:
+            self._latest[channel_id] = (weakref.ref(channel), value, received)
+        self._pending.append(channel_id)
+        self._async_watcher.send()
+
+    def get_statistics(self):
+        """Return the delivery statistics of the channels: updates received,
+        values emitted, values dropped by coalescing, values waiting, and
+        the delay between reception and emit, in ms
+
+        Returns:
+            (dict): channel name -> statistics
+        """
+        result = {}
+        for channel_id, stats in list(self._statistics.items()):
+            stats = dict(stats)
+            total_latency = stats.pop("total_latency")
+            stream = self._streams.get(channel_id)
+            if stream is not None:
+                stats["queue_depth"] = len(stream)
+            else:
+                stats["queue_depth"] = int(channel_id in self._latest)
+            stats["mean_latency"] = (
+                total_latency / stats["emitted"] * 1000 if stats["emitted"] else 0
+            )
+            stats["max_latency"] *= 1000
+            result[stats.pop("name")] = stats
+        return result
 
+    def _wake_up(self):
+        if self._dispatcher is None:
+            self._dispatcher = gevent.spawn(self._dispatch)
 
-def do_tine_channel_update(sleep_time):
-    while True:
-        emit_tine_channel_updates()
-        time.sleep(sleep_time)
+    def _dispatch(self):
+        try:
+            while self._pending:
+                channel_id = self._pending.popleft()
+                stream = self._streams.get(channel_id)
+                if stream is not None:
+                    while stream:
+                        self._emit(channel_id, *stream.popleft())
+                else:
+                    item = self._latest.pop(channel_id, None)
+                    if item is not None:
+                        self._emit(channel_id, *item)
+                    elif channel_id in self._statistics:
+                        # value replaced by a later one, already emitted
+                        self._statistics[channel_id]["coalesced"] += 1
+        finally:
+            self._dispatcher = None
+        if self._pending:
+            self._wake_up()
+
+    def _get_statistics(self, channel_id, channel):
+        stats = self._statistics.get(channel_id)
+        if stats is None:
+            stats = {
+                "name": channel.name(),
+                "updates": 0,
+                "emitted": 0,
+                "coalesced": 0,
+                "total_latency": 0,
+                "max_latency": 0,
+            }
+            self._statistics[channel_id] = stats
+        return stats
+
+    def _emit(self, channel_id, channel_ref, value, received):
+        channel = channel_ref()
+        if channel is None:
+            self._statistics.pop(channel_id, None)
+            self._streams.pop(channel_id, None)
+            return
+
+        latency = time.time() - received
+        stats = self._get_statistics(channel_id, channel)
+        stats["emitted"] += 1
+        stats["total_latency"] += latency
+        stats["max_latency"] = max(stats["max_latency"], latency)
+        try:
+            channel.emit("update", (value,))
+        except Exception:
+            logging.getLogger("HWR").exception(
+                "Exception while emitting new value for channel %s", channel.name()
+            )
 
 
 class TineChannel(ChannelObject):
     attach = {"timer": tine.attach, "event": tine.notify, "datachange": tine.update}
 
-    updates = Queue.Queue()
-    # updates_emitter = QtCore.QTimer()
-    # QtCore.QObject.connect(updates_emitter, QtCore.SIGNAL('timeout()'), emit_tine_channel_updates)
-    # updates_emitter.start(20)
-    updates_emitter = gevent.spawn(do_tine_channel_update, 0.1)
+    updates = TineUpdateDispatcher()
 
     def __init__(
         self, name, attribute_name, tinename=None, username=None, timeout=1000, **kwargs
@@ -141,7 +248,11 @@ class TineChannel(ChannelObject):
         self.tine_name = tinename
         self.timeout = int(timeout)
         self.value = None
-        self.old_value = None
+        self.oldvalue = None
+        # emit every value, instead of the latest one only
+        self.keep_all = kwargs.get("keep_all", attribute_name in STREAMED_ATTRIBUTES)
+        if isinstance(self.keep_all, str):
+            self.keep_all = self.keep_all.lower() in ("true", "1", "yes")
 
         self.callback_fail_counter = 0
 
@@ -224,7 +335,7 @@ class TineChannel(ChannelObject):
         self.value = value
 
         if value != self.oldvalue:
-            TineChannel.updates.put((weakref.ref(self), value))
+            TineChannel.updates.put(self, value, self.keep_all)
             self.oldvalue = value
 
     def get_value(self, force=False):
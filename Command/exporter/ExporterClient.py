@@ -176,6 +176,23 @@ class ExporterClient(StandardClient):
             pass
         return process_return
 
+    def read_properties(self, props, timeout=-1):
+        """Read several properties in one burst (see send_receive_many)
+        Args:
+            props(list): property names
+            timeout(float): Timeout for all the replies [s]
+        Returns:
+            (list): replies from the process, None for the failed reads
+        """
+        cmds = ["{} {}".format(CMD_PROPERTY_READ, prop) for prop in props]
+        process_returns = []
+        for ret in self.send_receive_many(cmds, timeout):
+            try:
+                process_returns.append(self.__process_return(ret))
+            except Exception:
+                process_returns.append(None)
+        return process_returns
+
     def read_property_as_string_array(self, prop):
         """Read a propery and convert the return value to list of strings.
         Args:
@@ -21,7 +21,9 @@
 """ ProtocolError and StandardClient implementation"""
 import sys
 import socket
+import collections
 import gevent
+import gevent.event
 import gevent.lock
 
 __copyright__ = """ Copyright © 2019 by the MXCuBE collaboration """
@@ -66,6 +68,12 @@ else:
 
 MAX_SIZE_STREAM_MSG = 500000
 
+# socket read size, large property values come in fewer chunks
+RECV_SIZE = 65536
+
+STX_BYTE = b"\x02"
+ETX_BYTE = b"\x03"
+
 
 class PROTOCOL:
     """Protocol"""
@@ -74,10 +82,85 @@ class PROTOCOL:
     STREAM = 2
 
 
-class StandardClient:
-    """Standard JLib client"""
+class FrameParser(object):
+    """Split a received byte stream in STX ... ETX delimited frames.
+
+    Chunks are searched with bytes.find and frames sliced through a
+    memoryview, instead of going through the data byte by byte. Only a
+    frame split over several chunks is copied into the buffer.
+    """
+
+    def __init__(self, max_size=MAX_SIZE_STREAM_MSG):
+        self.max_size = max_size
+        self._buffer = bytearray()
+        self._in_frame = False
 
-    def __init__(self, server_ip, server_port, protocol, timeout, retries):
+    def reset(self):
+        """Drop the partially received frame"""
+        del self._buffer[:]
+        self._in_frame = False
+
+    def feed(self, data):
+        """Parse a received chunk.
+        Args:
+            data(bytes): received data
+        Returns:
+            (list): complete frames (bytes), without STX and ETX
+        """
+        frames = []
+        view = memoryview(data)
+        pos = 0
+        size = len(data)
+
+        while pos < size:
+            if not self._in_frame:
+                start = data.find(STX_BYTE, pos)
+                if start < 0:
+                    break
+                del self._buffer[:]
+                self._in_frame = True
+                pos = start + 1
+                continue
+
+            end = data.find(ETX_BYTE, pos)
+            restart = data.find(STX_BYTE, pos, size if end < 0 else end)
+            if restart >= 0:
+                # STX before the end of the frame: start again from there
+                del self._buffer[:]
+                pos = restart + 1
+            elif end < 0:
+                self._buffer += view[pos:]
+                pos = size
+            else:
+                if self._buffer:
+                    self._buffer += view[pos:end]
+                    frames.append(bytes(self._buffer))
+                    del self._buffer[:]
+                else:
+                    frames.append(view[pos:end].tobytes())
+                self._in_frame = False
+                pos = end + 1
+
+        if len(self._buffer) > self.max_size:
+            self.reset()
+        return frames
+
+
+class StandardClient:
+    """Standard JLib client
+
+    In the default stream mode each request waits for its reply before the
+    next one is sent. In pipelined stream mode several requests can be
+    outstanding on the connection: replies, which carry no request id in
+    the stream protocol, are matched to the requests in sending order.
+    When a pipelined request times out, the following replies can no
+    longer be matched: the connection is dropped and all the requests
+    waiting for a reply fail.
+    """
+
+    def __init__(
+        self, server_ip, server_port, protocol, timeout, retries, pipelined=False
+    ):
         self.server_ip = server_ip
         self.server_port = server_port
         self.timeout = timeout
@@ -89,6 +172,10 @@ class StandardClient:
         self.receiving_greenlet = None
         self.msg_received_event = gevent.event.Event()
         self._lock = gevent.lock.Semaphore()
+        self.pipelined = pipelined and protocol == PROTOCOL.STREAM
+        # replies expected in pipelined mode, in sending order
+        self._pending_replies = collections.deque()
+        self._send_lock = gevent.lock.Semaphore()
         self.__msg_index__ = -1
         self.__sock = None
         self.__constant_local_port = True
@@ -111,6 +198,14 @@ class StandardClient:
         self._is_connected = False
         self.__sock = None
         self.received_msg = None
+        self.__fail_pending_replies()
+
+    def __fail_pending_replies(self):
+        """Abort the requests waiting for a reply in pipelined mode"""
+        while self._pending_replies:
+            self._pending_replies.popleft().set_exception(
+                SocketError("Socket error:" + str(self.error or "Disconnected"))
+            )
 
     def connect(self):
         """Socket connect"""
@@ -238,6 +333,10 @@ class StandardClient:
         Args:
             msg(str): Message
         """
+        if self.pipelined:
+            if self._pending_replies:
+                self._pending_replies.popleft().set(msg)
+            return
         self.received_msg = msg
         self.msg_received_event.set()
 
@@ -247,41 +346,24 @@ class StandardClient:
             self.on_connected()
         except Exception:
             pass
-        buffer = empty_buffer()
-        mReceivedSTX = False
+        frame_parser = FrameParser(MAX_SIZE_STREAM_MSG)
         while True:
-            ret = self.__sock.recv(4096)
+            ret = self.__sock.recv(RECV_SIZE)
             if not ret:
                 # connection reset by peer
                 self.error = "Disconnected"
                 self.__close_socket()
                 break
-            for b in ret:
-                if b == STX:
-                    buffer = empty_buffer()
-                    mReceivedSTX = True
-                elif b == ETX:
-                    if mReceivedSTX:
-                        try:
-                            # Unicode decoding exception catching,
-                            # consider errors='ignore'
-                            buffer_utf8 = buffer.decode()
-                        except UnicodeDecodeError as e:
-                            # Syntax not allowed in Python 2
-                            # raise ProtocolError from e
-                            raise ProtocolError(
-                                "UnicodeDecodeError: %s" % sys.exc_info()
-                            )
-                        self.on_message_received(buffer_utf8)
-                        mReceivedSTX = False
-                        buffer = empty_buffer()
-                else:
-                    if mReceivedSTX:
-                        buffer += _bytes([b])
-
-            if len(buffer) > MAX_SIZE_STREAM_MSG:
-                mReceivedSTX = False
-                buffer = empty_buffer()
+            for frame in frame_parser.feed(ret):
+                try:
+                    # Unicode decoding exception catching,
+                    # consider errors='ignore'
+                    buffer_utf8 = frame.decode()
+                except UnicodeDecodeError as e:
+                    # Syntax not allowed in Python 2
+                    # raise ProtocolError from e
+                    raise ProtocolError("UnicodeDecodeError: %s" % sys.exc_info())
+                self.on_message_received(buffer_utf8)
         try:
             self.on_disconnected()
         except Exception:
@@ -321,6 +403,63 @@ class StandardClient:
                 self.msg_received_event.wait()
             return self.received_msg
 
+    def __send_pipelined(self, cmds):
+        """Send commands without waiting for the previous replies.
+        Args:
+            cmds(list): commands
+        Returns:
+            (list): gevent.event.AsyncResult of the replies
+        """
+        replies = [gevent.event.AsyncResult() for _ in cmds]
+        with self._send_lock:
+            if not self.is_connected():
+                self.connect()
+            self._pending_replies.extend(replies)
+            pack = empty_buffer().join(
+                _bytes([STX]) + encode(cmd) + _bytes([ETX]) for cmd in cmds
+            )
+            try:
+                self.__sock.sendall(pack)
+            except socket.error:
+                self.error = str(sys.exc_info()[1])
+                self.disconnect()
+        return replies
+
+    def __wait_replies(self, replies, timeout):
+        """Wait for the replies of pipelined commands.
+        Args:
+            replies(list): gevent.event.AsyncResult of the replies
+            timeout(float): Timeout for all the replies [s], None to wait forever
+        Returns:
+            (list): replies
+        """
+        try:
+            with gevent.Timeout(timeout, TimeoutError):
+                return [reply.get() for reply in replies]
+        except TimeoutError:
+            with self._send_lock:
+                if not all(reply.ready() for reply in replies):
+                    self.error = "Reply timeout"
+                    self.disconnect()
+            raise
+
+    def send_receive_many(self, cmds, timeout=-1):
+        """Send commands in one burst and receive their replies.
+
+        In pipelined mode, all commands are sent before the first reply
+        is read. Otherwise they are sent one by one.
+        Args:
+            cmds(list): commands
+            timeout(float): Timeout for all the replies [s]
+        Returns:
+            (list): replies, in the order of the commands
+        """
+        if not self.pipelined:
+            return [self.send_receive(cmd, timeout) for cmd in cmds]
+        if timeout is not None and timeout < 0:
+            timeout = self.timeout
+        return self.__wait_replies(self.__send_pipelined(cmds), timeout)
+
     def send_receive(self, cmd, timeout=-1):
         """Send/receive command, locking the socket.
         Args:
@@ -328,6 +467,9 @@ class StandardClient:
         Returns:
             (str): reply form the socket
         """
+        if self.pipelined:
+            return self.send_receive_many([cmd], timeout)[0]
+
         self._lock.acquire()
         try:
             if (timeout is None) or (timeout >= 0):
@@ -0,0 +1,281 @@
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""On-disk cache of parsed configuration files
+
+XML files are stored as their recorded SAX events (node tree, properties,
+commands, channels and references), replayed into the hardware object
+handler instead of parsing. YAML files are stored as the loaded data.
+Entries are pickled, one file per configuration file, and are valid as
+long as the file modification time and size, or else its content digest,
+match. The cache directory must only be writable by trusted users.
+
+Usage from the command line:
+
+    python -m HardwareRepository.ConfigurationCache CACHE_DIR warm CONFIG_DIR ...
+    python -m HardwareRepository.ConfigurationCache CACHE_DIR invalidate [FILE ...]
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+from HardwareRepository import HardwareObjectFileParser
+
+__copyright__ = """ Copyright © 2010 - 2020 by MXCuBE Collaboration """
+__license__ = "LGPLv3+"
+
+# Change when the cached data of a file changes format
+FORMAT_VERSION = 1
+
+CACHE_EXTENSION = ".cache"
+
+
+def _get_digest(content):
+    if not isinstance(content, bytes):
+        content = content.encode("utf-8")
+    return hashlib.sha1(content).hexdigest()
+
+
+def load_yaml(file_path):
+    """Load a yaml configuration file, as HardwareRepository does"""
+    # NB imported here - HardwareRepository imports this module
+    from HardwareRepository.HardwareRepository import yaml
+
+    with open(file_path, "r") as yaml_file:
+        return yaml.load(yaml_file)
+
+
+class ConfigurationCache(object):
+    """Cache of parsed configuration files, keyed on file path
+
+    Attributes:
+        cache_directory (str): directory containing the cache entries
+    """
+
+    def __init__(self, cache_directory):
+        self.cache_directory = os.path.abspath(cache_directory)
+        self._statistics = {"hits": 0, "misses": 0, "revalidated": 0, "errors": 0}
+
+        if not os.path.isdir(self.cache_directory):
+            os.makedirs(self.cache_directory)
+
+    def get_xml_events(self, file_path, xml_string=None):
+        """Return the recorded SAX events of an XML file
+
+        Args:
+            file_path (str): XML file
+            xml_string (str): content of the file, if already read
+
+        Returns:
+            (list): events, see HardwareObjectFileParser.get_events
+        """
+        return self._get(file_path, HardwareObjectFileParser.get_events, xml_string)
+
+    def get_yaml(self, file_path):
+        """Return the loaded content of a yaml file
+
+        Args:
+            file_path (str): yaml file
+
+        Returns:
+            (dict): configuration, a new copy on each call
+        """
+        return self._get(file_path, None, None)
+
+    def warm(self, configuration_paths):
+        """Parse and cache all configuration files of some directories
+
+        Args:
+            configuration_paths (list): directories, searched recursively
+
+        Returns:
+            (int): number of files cached
+        """
+        count = 0
+        for configuration_path in configuration_paths:
+            for dir_path, _, file_names in os.walk(configuration_path):
+                for file_name in file_names:
+                    file_path = os.path.join(dir_path, file_name)
+                    extension = os.path.splitext(file_name)[1]
+                    try:
+                        if extension == ".xml":
+                            self.get_xml_events(file_path)
+                        elif extension == ".yml":
+                            self.get_yaml(file_path)
+                        else:
+                            continue
+                    except Exception:
+                        logging.getLogger("HWR").warning(
+                            "Cannot cache configuration file %s", file_path
+                        )
+                    else:
+                        count += 1
+        return count
+
+    def invalidate(self, file_paths=None):
+        """Remove cache entries
+
+        Args:
+            file_paths (list): configuration files, None for all entries
+
+        Returns:
+            (int): number of entries removed
+        """
+        if file_paths is None:
+            entry_paths = [
+                os.path.join(self.cache_directory, file_name)
+                for file_name in os.listdir(self.cache_directory)
+                if file_name.endswith(CACHE_EXTENSION)
+            ]
+        else:
+            entry_paths = [self._get_entry_path(file_path) for file_path in file_paths]
+
+        count = 0
+        for entry_path in entry_paths:
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            else:
+                count += 1
+        return count
+
+    def get_statistics(self):
+        """Return the number of hits, misses, entries revalidated on their
+        content digest, and read or write errors
+
+        Returns:
+            (dict): statistics
+        """
+        return dict(self._statistics)
+
+    def _get_entry_path(self, file_path):
+        key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_directory, key + CACHE_EXTENSION)
+
+    def _get(self, file_path, parse_function, content):
+        entry_path = self._get_entry_path(file_path)
+        stat = os.stat(file_path)
+        entry = self._read_entry(entry_path)
+        stat_valid = (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+        )
+
+        if stat_valid and content is None:
+            self._statistics["hits"] += 1
+            return entry["data"]
+
+        if content is None:
+            with open(file_path, "r") as config_file:
+                content = config_file.read()
+        digest = _get_digest(content)
+
+        if entry is not None and entry["digest"] == digest:
+            data = entry["data"]
+            if stat_valid:
+                self._statistics["hits"] += 1
+                return data
+            self._statistics["revalidated"] += 1
+        else:
+            self._statistics["misses"] += 1
+            if parse_function is None:
+                data = load_yaml(file_path)
+            else:
+                data = parse_function(content)
+
+        entry = {
+            "version": FORMAT_VERSION,
+            "path": os.path.abspath(file_path),
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "digest": digest,
+            "data": data,
+        }
+        self._write_entry(entry_path, entry)
+        return data
+
+    def _read_entry(self, entry_path):
+        try:
+            with open(entry_path, "rb") as entry_file:
+                entry = pickle.load(entry_file)
+        except (IOError, OSError):
+            return None
+        except Exception:
+            self._statistics["errors"] += 1
+            return None
+        if entry.get("version") != FORMAT_VERSION:
+            return None
+        return entry
+
+    def _write_entry(self, entry_path, entry):
+        # write and rename, so readers never see a partial entry
+        tmp_path = "%s.%d" % (entry_path, os.getpid())
+        try:
+            with open(tmp_path, "wb") as entry_file:
+                pickle.dump(entry, entry_file, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp_path, entry_path)
+        except (IOError, OSError):
+            self._statistics["errors"] += 1
+            logging.getLogger("HWR").warning(
+                "Cannot write configuration cache entry %s", entry_path
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Warm or invalidate the HardwareRepository configuration cache"
+    )
+    parser.add_argument("cache_directory", help="configuration cache directory")
+    subparsers = parser.add_subparsers(dest="command")
+    warm_parser = subparsers.add_parser("warm", help="parse and cache files")
+    warm_parser.add_argument(
+        "configuration_paths", nargs="+", help="configuration directories"
+    )
+    invalidate_parser = subparsers.add_parser(
+        "invalidate", help="remove cache entries"
+    )
+    invalidate_parser.add_argument(
+        "file_paths", nargs="*", help="configuration files (default: all)"
+    )
+    args = parser.parse_args(argv)
+
+    cache = ConfigurationCache(args.cache_directory)
+    if args.command == "warm":
+        count = cache.warm(args.configuration_paths)
+        print("%d configuration files cached" % count)
+    elif args.command == "invalidate":
+        count = cache.invalidate(args.file_paths or None)
+        print("%d cache entries removed" % count)
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -79,6 +79,78 @@ def parse_string(xml_hardware_object, name):
     return cur_handler.get_hardware_object()
 
 
+def get_events(xml_hardware_object):
+    """Return the SAX events of an XML string, as a cacheable list
+
+    Args:
+        xml_hardware_object (str): XML string
+
+    Returns:
+        (list): events, see EventRecorder
+    """
+    event_recorder = EventRecorder()
+    xml.sax.parseString(str.encode(xml_hardware_object), event_recorder)
+    return event_recorder.get_events()
+
+
+def replay_events(events, handler):
+    """Feed recorded SAX events to a content handler, instead of parsing
+
+    Args:
+        events (list): events, as returned by get_events
+        handler (ContentHandler): handler
+    """
+    handler.startDocument()
+    for event in events:
+        if event[0] == EventRecorder.START:
+            handler.startElement(event[1], event[2])
+        elif event[0] == EventRecorder.END:
+            handler.endElement(event[1])
+        else:
+            handler.characters(event[1])
+    handler.endDocument()
+
+
+def parse_events(events, xml_hardware_object, name):
+    """Same as parse_string, from the recorded events of the XML string
+
+    Args:
+        events (list): events of xml_hardware_object, see get_events
+        xml_hardware_object (str): XML string, used for template checks
+        name (str): name of the hardware object (i.e. '/motors/m0')
+
+    Returns:
+        (HardwareObject): hardware object, or name of a redirection
+    """
+    global CURRENT_XML
+    CURRENT_XML = xml_hardware_object
+    cur_handler = HardwareObjectHandler(name)
+    replay_events(events, cur_handler)
+    return cur_handler.get_hardware_object()
+
+
+def get_references(xml_hardware_object, name, events=None):
+    """Return the names of the hardware objects referenced in an XML string
+
+    References are the href (or hwrid) attributes of the elements, and the
+    target of a hwr_import redirection, resolved as by HardwareObjectHandler
+
+    Args:
+        xml_hardware_object (str): XML string
+        name (str): name of the hardware object (i.e. '/motors/m0')
+        events (list): recorded events of the XML string, to skip parsing
+
+    Returns:
+        (list): referenced hardware object names, in document order
+    """
+    reference_retriever = ReferenceRetriever(name)
+    if events is None:
+        xml.sax.parseString(str.encode(xml_hardware_object), reference_retriever)
+    else:
+        replay_events(events, reference_retriever)
+    return reference_retriever.get_references()
+
+
 def load_module(hardware_object_name):
     """[summary]
 
@@ -490,3 +562,78 @@ class XmlStructureRetriever(ContentHandler):
 
         self.previous_path = self.path
         self.path = self.path[: self.path.rfind("/")]
+
+
+class ReferenceRetriever(ContentHandler):
+    def __init__(self, name):
+        ContentHandler.__init__(self)
+
+        self.name = name
+        self.references = []
+
+    def get_references(self):
+        """Return the referenced hardware object names
+
+        Returns:
+            (list): hardware object names
+        """
+        return self.references
+
+    def startElement(self, name, attrs):
+        """Collect href/hwrid references
+
+        Args:
+            name (str): element name
+            attrs (xml.sax.xmlreader.AttributesImpl): element attributes
+        """
+        reference = attrs.get("hwrid") or attrs.get("href")
+        if not reference:
+            return
+
+        reference = str(reference)
+        if reference.startswith("../"):
+            reference = "/".join(self.name.split("/")[:-1] + [reference[3:]])
+        elif reference.startswith("./"):
+            reference = "/".join(self.name.split("/")[:-1] + [reference[2:]])
+
+        if reference not in self.references:
+            self.references.append(reference)
+
+
+class EventRecorder(ContentHandler):
+    """Record the SAX events of a document as a list of tuples
+
+    Events are (START, name, attributes dict), (END, name) and
+    (CHARACTERS, content), with consecutive character data merged.
+    """
+
+    START = 0
+    END = 1
+    CHARACTERS = 2
+
+    def __init__(self):
+        ContentHandler.__init__(self)
+
+        self.events = []
+
+    def get_events(self):
+        """Return the recorded events
+
+        Returns:
+            (list): events
+        """
+        return self.events
+
+    def startElement(self, name, attrs):
+        self.events.append(
+            (self.START, str(name), dict((str(k), str(v)) for k, v in attrs.items()))
+        )
+
+    def endElement(self, name):
+        self.events.append((self.END, str(name)))
+
+    def characters(self, content):
+        if self.events and self.events[-1][0] == self.CHARACTERS:
+            self.events[-1] = (self.CHARACTERS, self.events[-1][1] + content)
+        else:
+            self.events.append((self.CHARACTERS, str(content)))
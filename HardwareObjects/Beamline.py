@@ -474,6 +474,17 @@ class Beamline(ConfiguredObject):
 
     # Analysis (combines processing and data analysis)
 
+    @property
+    def job_runner(self):
+        """Pools of external processing programs (EDNA, dozor, autoprocessing).
+
+        Returns:
+            Optional[JobRunner]:
+        """
+        return self._objects.get("job_runner")
+
+    __content_roles.append("job_runner")
+
     @property
     def online_processing(self):
         """Synchronous (on-line) data processing procedure.
@@ -565,11 +565,7 @@ class Cats90(SampleChanger):
             self._add_component(basket)
 
         # write the default basket information into permanent Basket objects
-        for basket_index in range(self.number_of_baskets):
-            basket = self.get_components()[basket_index]
-            datamatrix = None
-            present = scanned = False
-            basket._set_info(present, datamatrix, scanned)
+        self._set_info_many(0)
 
         # create temporary list with default sample information and indices
         sample_list = []
@@ -1471,21 +1467,17 @@ class Cats90(SampleChanger):
                     basket._set_info(present, datamatrix, scanned)
 
                 # set the information for all dependent samples
-                for sample_index in range(basket.get_number_of_samples()):
-                    sample = self.get_component_by_address(
-                        Pin.get_sample_address((basket_index + 1), (sample_index + 1))
+                samples_num = len(basket.get_components())
+                if basket.is_present():
+                    basket._set_info_many(
+                        (1 << samples_num) - 1, ["          "] * samples_num
                     )
-                    present = sample.get_container().is_present()
-                    if present:
-                        datamatrix = "          "
-                    else:
-                        datamatrix = None
-                    scanned = False
-                    sample._set_info(present, datamatrix, scanned)
+                else:
+                    basket._set_info_many(0)
 
-                    # forget about any loaded state in newly mounted or removed basket)
-                    loaded = _has_been_loaded = False
-                    sample._set_loaded(loaded, has_been_loaded)
+                # forget about any loaded state in newly mounted or removed basket)
+                for sample in basket.get_components():
+                    sample._set_loaded(False, False)
 
         self._trigger_contents_updated_event()
         self._update_loaded_sample()
@@ -20,6 +20,7 @@ import redis
 import json
 import gevent
 import logging
+import numpy
 
 from enum import Enum, unique
 
@@ -58,10 +59,55 @@ class FrameType(Enum):
     """
 
     DATA = "data"
+    DATA_MANY = "data_many"
     START = "start"
     STOP = "stop"
 
 
+# First byte of the binary data frames, that JSON frames never start with.
+# It is followed by the number of values per point and the points, packed
+# as little endian float64: x0, y0, (z0), x1, y1, (z1), ...
+BINARY_FRAME_MARKER = b"\x00"
+
+AXES = ("x", "y", "z")
+
+
+def pack_frame(data_points, data_dim=1):
+    """
+    Pack data points in a binary data frame
+
+    Args:
+        data_points (list): x, y, (z) dictionaries
+        data_dim (int): data dimension, 1 for x, y and 2 for x, y, z data
+
+    Returns:
+        (bytes): the frame
+    """
+    axes = AXES[: data_dim + 1]
+    values = numpy.array(
+        [[point.get(axis, float("nan")) for axis in axes] for point in data_points],
+        dtype="<f8",
+    )
+    return BINARY_FRAME_MARKER + bytes(bytearray([len(axes)])) + values.tobytes()
+
+
+def unpack_frame(frame):
+    """
+    Unpack a binary data frame
+
+    Args:
+        frame (bytes): the frame, see pack_frame
+
+    Returns:
+        (dict): x, y, (z) lists of values
+    """
+    nb_axes = bytearray(frame[1:2])[0]
+    values = numpy.frombuffer(frame[2:], dtype="<f8").reshape(-1, nb_axes)
+    return dict(
+        (axis, values[:, index].tolist()) for index, axis in enumerate(AXES[:nb_axes])
+    )
+
+
 def one_d_data(x, y):
     """
     Convenience function for creating x, y data
@@ -84,8 +130,23 @@ class DataPublisher(HardwareObject):
     def __init__(self, name):
         super(DataPublisher, self).__init__(name)
         self._r = None
+        # binary frames can not be decoded as text
+        self._raw_r = None
         self._subsribe_task = None
 
+        # Published points are sent, and stored points written to redis,
+        # by batches of batch_size points or every batch_interval ms
+        self._batch_size = 1
+        self._batch_interval = 100
+        self._binary_frames = False
+
+        # _id -> points waiting to be published
+        self._pending_points = {}
+        # _id -> x, y, (z) values waiting to be stored
+        self._pending_data = {}
+        # (_id, "pub" or "store") -> timer flushing the pending values
+        self._flush_tasks = {}
+
     def init(self):
         """
         FWK2 Init method
@@ -96,9 +157,14 @@ class DataPublisher(HardwareObject):
         rport = self.get_property("port", 6379)
         rdb = self.get_property("db", 11)
 
+        self._batch_size = self.get_property("batch_size", 1)
+        self._batch_interval = self.get_property("batch_interval", 100)
+        self._binary_frames = self.get_property("binary_frames", False)
+
         self._r = redis.Redis(
             host=rhost, port=rport, db=rdb, charset="utf-8", decode_responses=True
         )
+        self._raw_r = redis.Redis(host=rhost, port=rport, db=rdb)
 
         if not self._subsribe_task:
             self._subsribe_task = gevent.spawn(self._handle_messages)
@@ -107,7 +173,7 @@ class DataPublisher(HardwareObject):
         """
         Listens for published data and handles the data.
         """
-        pubsub = self._r.pubsub(ignore_subscribe_messages=True)
+        pubsub = self._raw_r.pubsub(ignore_subscribe_messages=True)
         pubsub.psubscribe("HWR_DP_NEW_DATA_POINT_*")
 
         _data = {}
@@ -119,10 +185,16 @@ class DataPublisher(HardwareObject):
         for message in pubsub.listen():
             if message:
                 try:
-                    redis_channel = message["channel"]
+                    redis_channel = message["channel"].decode()
                     _id = redis_channel.split("_")[-1]
 
-                    data = json.loads(message["data"])
+                    if message["data"][:1] == BINARY_FRAME_MARKER:
+                        data = {
+                            "type": FrameType.DATA_MANY.value,
+                            "data": unpack_frame(message["data"]),
+                        }
+                    else:
+                        data = json.loads(message["data"])
 
                     if data["type"] == FrameType.START.value:
                         _data[redis_channel] = {"x": [], "y": []}
@@ -131,6 +203,8 @@ class DataPublisher(HardwareObject):
 
                         # Clear previous data so that we are not acumelating
                         # with previously published data
+                        self._cancel_flush(_id, "store")
+                        self._pending_data.pop(_id, None)
                         self._clear_data(_id)
 
                         self.emit(
@@ -140,23 +214,36 @@ class DataPublisher(HardwareObject):
                         active_source_desc[redis_channel] = self._get_description(_id)
 
                     elif data["type"] == FrameType.STOP.value:
+                        self._flush_data(_id)
                         self._update_description(_id, {"running": False})
                         self.emit(
                             "end", self.get_description(_id, include_data=True)[0]
                         )
                         active_source_desc.pop(redis_channel)
-                    elif data["type"] == FrameType.DATA.value:
-                        _data[redis_channel] = {
-                            "x": _data[redis_channel]["x"] + [data["data"]["x"]],
-                            "y": _data[redis_channel]["y"] + [data["data"]["y"]],
-                        }
-
-                        self.emit(
-                            "data", {"id": _id, "data": data["data"]},
-                        )
+                    elif data["type"] in (
+                        FrameType.DATA.value,
+                        FrameType.DATA_MANY.value,
+                    ):
+                        if data["type"] == FrameType.DATA.value:
+                            points = [data["data"]]
+                        else:
+                            columns = data["data"]
+                            axes = [axis for axis in AXES if axis in columns]
+                            points = [
+                                dict(zip(axes, values))
+                                for values in zip(*[columns[axis] for axis in axes])
+                            ]
+
+                        for point in points:
+                            _data[redis_channel]["x"].append(point["x"])
+                            _data[redis_channel]["y"].append(point["y"])
+
+                            self.emit(
+                                "data", {"id": _id, "data": point},
+                            )
 
                         self._append_data(
-                            _id, data["data"], active_source_desc[redis_channel]
+                            _id, points, active_source_desc[redis_channel]
                         )
                     else:
                         msg = "Unknown frame type %s" % message
@@ -165,6 +252,25 @@ class DataPublisher(HardwareObject):
                     msg = "Could not parse data in %s" % message
                     logging.getLogger("HWR").exception(msg)
 
+    def _schedule_flush(self, _id, kind, flush_function):
+        """
+        Flush pending values after batch_interval, unless already scheduled
+
+        Args:
+            _id (str): The id of the source
+            kind (str): "pub" or "store"
+            flush_function (callable): called with _id
+        """
+        if (_id, kind) not in self._flush_tasks:
+            self._flush_tasks[(_id, kind)] = gevent.spawn_later(
+                self._batch_interval / 1000.0, flush_function, _id
+            )
+
+    def _cancel_flush(self, _id, kind):
+        task = self._flush_tasks.pop((_id, kind), None)
+        if task is not None and task is not gevent.getcurrent():
+            task.kill(block=False)
+
     def _remove_available(self, _id):
         """
         Remove source with _id from list of avialable sources
@@ -252,20 +358,41 @@ class DataPublisher(HardwareObject):
         desc.update(data)
         self._set_description(_id, desc)
 
-    def _append_data(self, _id, data, desc):
+    def _append_data(self, _id, data_points, desc):
         """
         Append data to source with _id
 
         Args:
             _id (str): The id of the source to remove
+            data_points (list): x, y, (z) data to append
             desc (dict): Publisher description
-            data: x, y, (z) data to append
         """
-        self._r.rpush("HWR_DP_%s_DATA_X" % _id, data.get("x", float("nan")))
-        self._r.rpush("HWR_DP_%s_DATA_Y" % _id, data.get("y", float("nan")))
+        axes = AXES[:3] if desc["data_dim"] > 1 else AXES[:2]
+        pending = self._pending_data.setdefault(
+            _id, dict((axis, []) for axis in axes)
+        )
+        for point in data_points:
+            for axis in axes:
+                pending[axis].append(point.get(axis, float("nan")))
 
-        if desc["data_dim"] > 1:
-            self._r.rpush("HWR_DP_%s_DATA_Z" % _id, data.get("z", float("nan")))
+        if len(pending["x"]) >= self._batch_size:
+            self._flush_data(_id)
+        else:
+            self._schedule_flush(_id, "store", self._flush_data)
+
+    def _flush_data(self, _id):
+        """
+        Write the pending data of source with _id in one pipeline
+        """
+        self._cancel_flush(_id, "store")
+        pending = self._pending_data.pop(_id, None)
+        if not pending or not pending["x"]:
+            return
+
+        pipe = self._r.pipeline(transaction=False)
+        for axis, values in pending.items():
+            pipe.rpush("HWR_DP_%s_DATA_%s" % (_id, axis.upper()), *values)
+        pipe.execute()
 
     def _clear_data(self, _id):
         """
@@ -325,12 +452,62 @@ class DataPublisher(HardwareObject):
         return _id
 
     def pub(self, _id, data):
-        self._publish(_id, {"type": FrameType.DATA.value, "data": data})
+        """
+        Publish a data point, or queue it when publishing by batches
+
+        Args:
+            _id (str): The id of the source
+            data (dict): x, y, (z) data
+        """
+        if self._batch_size <= 1 and not self._binary_frames:
+            self._publish(_id, {"type": FrameType.DATA.value, "data": data})
+            return
+
+        points = self._pending_points.setdefault(_id, [])
+        points.append(data)
+
+        if len(points) >= self._batch_size:
+            self._flush_points(_id)
+        else:
+            self._schedule_flush(_id, "pub", self._flush_points)
+
+    def pub_many(self, _id, data_points):
+        """
+        Publish several data points in one frame
+
+        Args:
+            _id (str): The id of the source
+            data_points (list): x, y, (z) data
+        """
+        if not data_points:
+            return
+
+        if self._binary_frames:
+            data_dim = 2 if any("z" in point for point in data_points) else 1
+            self._r.publish(
+                "HWR_DP_NEW_DATA_POINT_%s" % _id, pack_frame(data_points, data_dim)
+            )
+        else:
+            axes = [axis for axis in AXES if axis in data_points[0]]
+            columns = dict(
+                (axis, [point.get(axis, float("nan")) for point in data_points])
+                for axis in axes
+            )
+            self._publish(_id, {"type": FrameType.DATA_MANY.value, "data": columns})
+
+    def _flush_points(self, _id):
+        """
+        Publish the queued data points of source with _id
+        """
+        self._cancel_flush(_id, "pub")
+        self.pub_many(_id, self._pending_points.pop(_id, []))
 
     def start(self, _id):
+        self._flush_points(_id)
         self._publish(_id, {"type": FrameType.START.value, "data": {}})
 
     def stop(self, _id):
+        self._flush_points(_id)
         self._update_description(_id, {"running": False})
         self._publish(_id, {"type": FrameType.STOP.value, "data": {}})
 
@@ -34,19 +34,8 @@ from HardwareRepository.HardwareObjects.abstract.AbstractOnlineProcessing import
     AbstractOnlineProcessing,
 )
 
-from HardwareRepository.HardwareObjects.XSDataCommon import (
-    XSDataBoolean,
-    XSDataDouble,
-    XSDataInteger,
-    XSDataString,
-)
-from HardwareRepository.HardwareObjects.XSDataControlDozorv1_1 import (
-    XSDataInputControlDozor,
-    XSDataResultControlDozor,
-    XSDataControlImageDozor,
-)
-
-
+from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
+from HardwareRepository.HardwareObjects.JobRunner import PRIORITY_BACKGROUND
 from HardwareRepository import HardwareRepository as HWR
 
 __credits__ = ["EMBL Hamburg"]
@@ -155,24 +144,38 @@ class EMBLOnlineProcessing(AbstractOnlineProcessing):
         :param processing_input_filename
         :type : str
         """
-        input_file = XSDataInputControlDozor()
-        input_file.setTemplate(XSDataString(self.params_dict["template"]))
+        input_file = xsdata.XSDataInputControlDozor()
+        input_file.setTemplate(xsdata.XSDataString(self.params_dict["template"]))
         input_file.setFirst_image_number(
-            XSDataInteger(self.params_dict["first_image_num"])
+            xsdata.XSDataInteger(self.params_dict["first_image_num"])
+        )
+        input_file.setLast_image_number(
+            xsdata.XSDataInteger(self.params_dict["images_num"])
+        )
+        input_file.setFirst_run_number(
+            xsdata.XSDataInteger(self.params_dict["run_number"])
+        )
+        input_file.setLast_run_number(
+            xsdata.XSDataInteger(self.params_dict["run_number"])
+        )
+        input_file.setLine_number_of(
+            xsdata.XSDataInteger(self.params_dict["lines_num"])
         )
-        input_file.setLast_image_number(XSDataInteger(self.params_dict["images_num"]))
-        input_file.setFirst_run_number(XSDataInteger(self.params_dict["run_number"]))
-        input_file.setLast_run_number(XSDataInteger(self.params_dict["run_number"]))
-        input_file.setLine_number_of(XSDataInteger(self.params_dict["lines_num"]))
         input_file.setReversing_rotation(
-            XSDataBoolean(self.params_dict["reversing_rotation"])
+            xsdata.XSDataBoolean(self.params_dict["reversing_rotation"])
+        )
+        input_file.setPixelMin(
+            xsdata.XSDataInteger(HWR.beamline.detector.get_pixel_min())
+        )
+        input_file.setPixelMax(
+            xsdata.XSDataInteger(HWR.beamline.detector.get_pixel_max())
+        )
+        input_file.setBeamstopSize(xsdata.XSDataDouble(self.beamstop_hwobj.get_size()))
+        input_file.setBeamstopDistance(
+            xsdata.XSDataDouble(self.beamstop_hwobj.get_distance())
         )
-        input_file.setPixelMin(XSDataInteger(HWR.beamline.detector.get_pixel_min()))
-        input_file.setPixelMax(XSDataInteger(HWR.beamline.detector.get_pixel_max()))
-        input_file.setBeamstopSize(XSDataDouble(self.beamstop_hwobj.get_size()))
-        input_file.setBeamstopDistance(XSDataDouble(self.beamstop_hwobj.get_distance()))
         input_file.setBeamstopDirection(
-            XSDataString(self.beamstop_hwobj.get_direction())
+            xsdata.XSDataString(self.beamstop_hwobj.get_direction())
         )
 
         input_file.exportToFile(processing_input_filename)
@@ -221,14 +224,19 @@ class EMBLOnlineProcessing(AbstractOnlineProcessing):
                 )
 
                 self.started = True
-                subprocess.Popen(
-                    str(line_to_execute),
-                    shell=True,
-                    stdin=None,
-                    stdout=None,
-                    stderr=None,
-                    close_fds=True,
-                )
+                if HWR.beamline.job_runner is not None:
+                    self.processing_job = HWR.beamline.job_runner.submit(
+                        str(line_to_execute), "online_processing", name="dozor"
+                    )
+                else:
+                    subprocess.Popen(
+                        str(line_to_execute),
+                        shell=True,
+                        stdin=None,
+                        stdout=None,
+                        stderr=None,
+                        close_fds=True,
+                    )
 
     def frame_count_changed(self, frame_count):
         """
@@ -246,12 +254,7 @@ class EMBLOnlineProcessing(AbstractOnlineProcessing):
         Smooths the resolution
         :return:
         """
-        step = 30
-        for key in ["score", "spots_num"]:
-            for index in range(self.results_raw[key].size):
-                self.results_raw[key][index] = numpy.mean(
-                    self.results_raw[key][index - step : index + step]
-                )
+        self.results.smooth(["score", "spots_num"], 30)
 
     def batch_processed(self, batch):
         """Method called from EDNA via xmlrpc to set results
@@ -263,34 +266,21 @@ class EMBLOnlineProcessing(AbstractOnlineProcessing):
             if type(batch[0]) not in (tuple, list):
                 batch = [batch]
 
-            for image in batch:
-                frame_num = int(image[0])
-                self.results_raw["spots_num"][frame_num] = image[1]
-                self.results_raw["spots_resolution"][frame_num] = 1 / image[3]
-                self.results_raw["score"][frame_num] = image[2]
-
-                for score_key in self.results_raw.keys():
-                    if self.params_dict["lines_num"] > 1:
-                        col, row = self.grid.get_col_row_from_image(frame_num)
-                        self.results_aligned[score_key][col][row] = self.results_raw[
-                            score_key
-                        ][frame_num]
-                    else:
-                        if frame_num < self.results_aligned[score_key].size:
-                            self.results_aligned[score_key][
-                                frame_num
-                            ] = self.results_raw[score_key][frame_num]
+            batch = np.array(batch, dtype=float)
+            self.results.set_values(
+                batch[:, 0].astype(int),
+                {
+                    "spots_num": batch[:, 1],
+                    "spots_resolution": 1 / batch[:, 3],
+                    "score": batch[:, 2],
+                },
+            )
             # if self.params_dict["lines_num"] <= 1:
             #    self.smooth()
 
     def dozor_average_i_changed(self, average_i_value):
         if self.started:
-            self.results_raw["average_intensity"] = np.append(
-                self.results_raw["average_intensity"], average_i_value
-            )
-            self.results_aligned["average_intensity"] = np.append(
-                self.results_aligned["average_intensity"], average_i_value
-            )
+            self.results.append("average_intensity", average_i_value)
 
     def update_map(self):
         return
@@ -335,16 +325,16 @@ class EMBLOnlineProcessing(AbstractOnlineProcessing):
         processing_xml_filename = os.path.join(
             self.params_dict["process_directory"], "dozor_result.xml"
         )
-        dozor_result = XSDataResultControlDozor()
+        dozor_result = xsdata.XSDataResultControlDozor()
         for index in range(self.params_dict["images_num"]):
-            dozor_image = XSDataControlImageDozor()
-            dozor_image.setNumber(XSDataInteger(index))
-            dozor_image.setScore(XSDataDouble(self.results_raw["score"][index]))
+            dozor_image = xsdata.XSDataControlImageDozor()
+            dozor_image.setNumber(xsdata.XSDataInteger(index))
+            dozor_image.setScore(xsdata.XSDataDouble(self.results_raw["score"][index]))
             dozor_image.setSpots_num_of(
-                XSDataInteger(self.results_raw["spots_num"][index])
+                xsdata.XSDataInteger(self.results_raw["spots_num"][index])
             )
             dozor_image.setSpots_resolution(
-                XSDataDouble(self.results_raw["spots_resolution"][index])
+                xsdata.XSDataDouble(self.results_raw["spots_resolution"][index])
             )
             dozor_result.addImageDozor(dozor_image)
         dozor_result.exportToFile(processing_xml_filename)
@@ -721,11 +711,19 @@ class EMBLOnlineProcessing(AbstractOnlineProcessing):
             "Online processing: crystfel command: \n %s" % (crystfel_command),
         )
 
-        subprocess.Popen(
-            crystfel_command,
-            shell=True,
-            stdin=None,
-            stdout=None,
-            stderr=None,
-            close_fds=True,
-        )
+        if HWR.beamline.job_runner is not None:
+            HWR.beamline.job_runner.submit(
+                crystfel_command,
+                "autoprocessing",
+                PRIORITY_BACKGROUND,
+                name="CrystFEL autoprocessing",
+            )
+        else:
+            subprocess.Popen(
+                crystfel_command,
+                shell=True,
+                stdin=None,
+                stdout=None,
+                stderr=None,
+                close_fds=True,
+            )
@@ -24,7 +24,7 @@ import json
 import time
 import Image
 import logging
-import threading
+import functools
 import collections
 from queue import Queue
 from copy import deepcopy
@@ -44,6 +44,7 @@ from HardwareRepository.TaskUtils import task
 from HardwareRepository.HardwareObjects.abstract.AbstractCollect import AbstractCollect
 from HardwareRepository.HardwareObjects.QtGraphicsManager import QtGraphicsManager
 from HardwareRepository.HardwareObjects import queue_model_objects as qmo
+from HardwareRepository.utils.image_stack import ImageStack
 
 from HardwareRepository import HardwareRepository as HWR
 
@@ -78,8 +79,7 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
         self.qimage = None
         self.qpixmap = None
         self.image_count = 0
-        self.image_reading_thread = None
-        self.ff_corrected_list = []
+        self.image_stack = None
         self.config_dict = {}
         self.collect_omega_start = 0
         self.omega_start = 0
@@ -308,12 +308,12 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
         end_x = measured_points[1].x()
         end_y = measured_points[1].y()
 
-        if self.image_reading_thread is None:
+        if self.image_stack is None:
             im = np.array(self.qimage.bits()).reshape(
                 self.qimage.width(), self.qimage.height()
             )
         else:
-            im = self.image_reading_thread.get_raw_image(self.current_image_index)
+            im = self.image_stack.get_raw_image(self.current_image_index)
         # im_slice = im[start_x:start_y,end_x,end_y]
         # print im_slice.size, im_slice
         x = np.linspace(start_x, end_x, measured_pix_num)
@@ -693,7 +693,7 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
             self.display_image(index)
 
     def display_image(self, index):
-        if self.image_reading_thread is None:
+        if self.image_stack is None:
             return
 
         # osc_seq = self.config_dict["collect"]["oscillation_sequence"][0]
@@ -703,39 +703,12 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
         # self.graphics_omega_reference_item.set_phi_position(angle)
         self.current_image_index = index
 
-        raw_image = self.image_reading_thread.get_raw_image(index)
-
-        if self.ff_apply:
-            if self.ff_corrected_list[index] is None:
-                corrected_im_min_max = (
-                    self.image_reading_thread.get_corrected_im_min_max()
-                )
-                ff_image = self.image_reading_thread.get_ff_image(index).astype(float)
-                ff_corrected_image = np.divide(
-                    raw_image.astype(float),
-                    ff_image,
-                    out=np.ones_like(raw_image.astype(float)),
-                    where=ff_image != 0,
-                )
-                im = (
-                    255.0
-                    * (ff_corrected_image - corrected_im_min_max[0])
-                    / (corrected_im_min_max[1] - corrected_im_min_max[0])
-                )
-                self.ff_corrected_list[index] = im.astype(np.uint16)
-            else:
-                im = self.ff_corrected_list[index]
-        else:
-            raw_im_min_max = self.image_reading_thread.get_raw_im_min_max()
-            im = (
-                255.0
-                * (raw_image - raw_im_min_max[0])
-                / (raw_im_min_max[1] - raw_im_min_max[0])
-            )
+        # normalised uint8 frame, flat field corrected if ff_apply
+        im = self.image_stack.get_frame(index, self.ff_apply)
 
         if im is not None:
             self.qimage = QtImport.QImage(
-                im.astype(np.uint8),
+                im,
                 im.shape[1],
                 im.shape[0],
                 im.shape[1],
@@ -786,7 +759,9 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
         self.config_dict = {}
         self.omega_start = HWR.beamline.diffractometer.get_omega_position()
         self.motor_positions = None
-        self.image_reading_thread = None
+        if self.image_stack is not None:
+            self.image_stack.close()
+            self.image_stack = None
 
         if not data_model:
             if data_path.endswith("tiff"):
@@ -867,20 +842,18 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
                 )
 
         self.image_count = len(raw_filename_list)
-        if self.image_reading_thread is not None:
-            self.image_reading_thread.set_stop()
 
-        self.ff_corrected_list = [None] * self.image_count
-
-        self.image_reading_thread = ImageReadingThread(
-            raw_filename_list, ff_filename_list, ff_ssim
+        # frames are decoded on display, and ahead of it while playing
+        self.image_stack = ImageStack(
+            raw_filename_list,
+            functools.partial(read_image, timeout=0),
+            ff_filename_list,
+            ff_ssim,
         )
-        self.image_reading_thread.start()
 
         self.current_image_index = 0
         self.emit("imageInit", self.image_count)
 
-        gevent.sleep(2)
         self.last_image_index = 0
         self.display_image_by_angle()
 
@@ -905,6 +878,12 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
                 if index >= abs(self.image_count / 360.0 * relative_angle):
                     break
             logging.getLogger("HWR").debug("display: " + str(self.current_image_index))
+            self.image_stack.read_ahead(
+                self.current_image_index,
+                direction * step,
+                ff_apply=self.ff_apply,
+                wrap=self.repeat_image_play,
+            )
             self.display_image(self.current_image_index)
             self.current_image_index += direction * step
             if self.repeat_image_play and self.current_image_index >= self.image_count:
@@ -918,14 +897,19 @@ class EMBLXrayImaging(QtGraphicsManager, AbstractCollect):
 
     def stop_image_play(self):
         self.image_polling.kill()
+        if self.image_stack is not None:
+            logging.getLogger("HWR").debug(
+                "Imaging: image stack %s" % self.image_stack.get_statistics()
+            )
 
     def stop_collect(self):
         self.cmd_collect_abort()
 
     def mouse_wheel_scrolled(self, delta):
         if (
-            self.image_reading_thread is None
-            or self.image_reading_thread.get_raw_image(self.current_image_index) is None
+            self.image_stack is None
+            or self.image_stack.get_frame(self.current_image_index, self.ff_apply)
+            is None
         ):
             return
 
@@ -1006,99 +990,3 @@ class GraphicsView(QtImport.QGraphicsView):
 
     def wheelEvent(self, event):
         self.wheelSignal.emit(event.delta())
-
-
-class ImageReadingThread(threading.Thread):
-    def __init__(self, raw_filename_list, ff_filename_list=[], ff_ssim=[]):
-        threading.Thread.__init__(self)
-
-        self.stopped = False
-        self.failed_to_read_count = 10
-        self.raw_filename_list = raw_filename_list
-        self.ff_filename_list = ff_filename_list
-
-        self.raw_image_list = [None] * len(self.raw_filename_list)
-        self.ff_image_list = [None] * len(self.ff_filename_list)
-
-        self.ff_ssim = None
-        self.raw_im_min_max = [pow(2, 16), 0]
-        self.corrected_im_min_max = [pow(2, 16), 0]
-
-    def start(self):
-        # self.thread_watcher = gevent.get_hub().loop.async()
-        self.thread_done = gevent.event.Event()
-        threading.Thread.start(self)
-        return self.thread_done
-
-    def set_stop(self):
-        self.stopped = True
-        logging.getLogger("GUI").info("Image reading stopped")
-
-    def set_ff_ssim(self, ff_ssim):
-        self.ff_ssim = ff_ssim
-
-    def run(self):
-        logging.getLogger("GUI").info("Image reading started...")
-        for index, filename in enumerate(self.ff_filename_list):
-            if self.stopped:
-                # self.thread_watcher.send()
-                return
-            self.ff_image_list[index] = read_image(filename)
-
-        progress_step = 20
-
-        for index, filename in enumerate(self.raw_filename_list):
-            if self.stopped:
-                return
-
-            raw_image = read_image(filename)
-            self.raw_image_list[index] = raw_image
-
-            if index == 0:
-                self.raw_im_min_max[0] = raw_image[8:].min()
-                self.raw_im_min_max[1] = raw_image[8:].max()
-
-            if self.ff_filename_list and index == 0:
-                ff_image = self.get_ff_image(index)
-                ff_applied = np.divide(
-                    raw_image.astype(float),
-                    ff_image.astype(float),
-                    out=np.ones_like(raw_image.astype(float)),
-                    where=ff_image.astype(float) != 0,
-                )
-                ff_applied[ff_image == (pow(2, 16) - 1)] = 1
-
-                self.corrected_im_min_max[0] = ff_applied[8:].min()
-                self.corrected_im_min_max[1] = ff_applied[8:].max()
-
-            done_per = int(float(index) / len(self.raw_filename_list) * 100)
-            if (
-                not index % (len(self.raw_filename_list) / (100 / progress_step))
-                and done_per > 0
-            ):
-                logging.getLogger("GUI").info("Image reading %d%% completed" % done_per)
-
-        logging.getLogger("GUI").info("Image reading finished")
-        # self.thread_watcher.send()
-
-    def get_raw_image(self, index):
-        return self.raw_image_list[index]
-
-    def get_raw_im_min_max(self):
-        return self.raw_im_min_max
-
-    def get_corrected_im_min_max(self):
-        return self.corrected_im_min_max
-
-    def get_ff_image(self, raw_image_index):
-        print "get_ff_image ", raw_image_index
-        if self.ff_ssim:
-            ff_index = self.ff_ssim[raw_image_index][2] - 1
-        else:
-            ff_index = int(
-                raw_image_index
-                / float(len(self.raw_image_list))
-                * len(self.ff_image_list)
-            )
-        print ff_index
-        return self.ff_image_list[ff_index]
@@ -6,7 +6,7 @@ import itertools
 import os
 import traceback
 from pprint import pformat
-from collections import namedtuple
+from collections import deque, namedtuple
 from datetime import datetime
 
 try:
@@ -19,6 +19,7 @@ except Exception:
 
 from suds.sudsobject import asdict
 from suds import WebFault
+from suds.cache import ObjectCache
 from suds.client import Client
 from HardwareRepository.BaseHardwareObjects import HardwareObject
 from HardwareRepository.ConvertUtils import string_types
@@ -66,47 +67,163 @@ SampleReference = namedtuple(
 )
 
 
-def trace(fun):
-    def _trace(*args):
-        log_msg = "lims client " + fun.__name__ + " called with: "
+# maximum length of the traced arguments and results, once formatted
+TRACE_MAX_LENGTH = 4000
+# maximum number of items of the traced lists, before formatting
+TRACE_MAX_ITEMS = 20
+# log the arguments and results of one call out of TRACE_SAMPLING per function
+TRACE_SAMPLING = 1
+# number of calls kept in the trace records, by default, see
+# set_trace_buffer_size
+TRACE_BUFFER_SIZE = 1000
+
+TraceRecord = namedtuple(
+    "TraceRecord", ["name", "start_time", "duration", "result_size", "error"]
+)
+
+_trace_records = deque(maxlen=TRACE_BUFFER_SIZE)
+_trace_counts = {}
+
+
+class _LazyFormat(object):
+    """Pretty-printed, size-capped text of objects, only formatted when
+    a log handler emits the record"""
 
-        for arg in args[1:]:
+    def __init__(self, *objects):
+        self.objects = objects
+
+    def __str__(self):
+        texts = []
+        for obj in self.objects:
+            if isinstance(obj, (list, tuple)) and len(obj) > TRACE_MAX_ITEMS:
+                obj = list(obj[:TRACE_MAX_ITEMS]) + ["... (%d items)" % len(obj)]
             try:
-                log_msg += pformat(arg, indent=4, width=80) + ", "
+                texts.append(pformat(obj, indent=4, width=80))
             except Exception:
                 pass
+        text = ", ".join(texts)
+        if len(text) > TRACE_MAX_LENGTH:
+            text = "%s... (%d characters)" % (text[:TRACE_MAX_LENGTH], len(text))
+        return text
 
-        logging.getLogger("ispyb_client").debug(log_msg)
-        result = fun(*args)
 
-        try:
-            result_msg = (
-                "lims client "
-                + fun.__name__
-                + " returned  with: "
-                + pformat(result, indent=4, width=80)
-            )
-        except Exception:
-            pass
+def _get_size(obj):
+    if obj is None:
+        return 0
+    try:
+        return len(obj)
+    except Exception:
+        return 1
 
-        logging.getLogger("ispyb_client").debug(result_msg)
+
+def _log_call(name):
+    """Log a call, if sampled. Returns True if its result has to be logged"""
+    logger = logging.getLogger("ispyb_client")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    count = _trace_counts.get(name, 0)
+    _trace_counts[name] = count + 1
+    return count % TRACE_SAMPLING == 0
+
+
+def _call_traced(fun, args, kwargs, log_result):
+    start_time = time.time()
+    result = None
+    error = True
+    try:
+        result = fun(*args, **kwargs)
+        error = False
         return result
+    finally:
+        _trace_records.append(
+            TraceRecord(
+                fun.__name__,
+                start_time,
+                time.time() - start_time,
+                _get_size(result),
+                error,
+            )
+        )
+        if log_result and not error:
+            logging.getLogger("ispyb_client").debug(
+                "lims client %s returned  with: %s", fun.__name__, _LazyFormat(result)
+            )
+
+
+def set_trace_buffer_size(size=None):
+    """Set the number of calls kept in the trace records, the most recent
+    records are kept
+
+    Args:
+        size (int): number of calls, None for TRACE_BUFFER_SIZE
+    """
+    global _trace_records
+    if size is None:
+        size = TRACE_BUFFER_SIZE
+    _trace_records = deque(_trace_records, maxlen=int(size))
+
+
+def get_trace_records(name=None):
+    """Return the most recent traced calls, oldest first
+
+    Args:
+        name (str): function name, None for all functions
+
+    Returns:
+        (list): TraceRecord tuples, duration in s and result size as
+                number of items
+    """
+    return [record for record in _trace_records if name in (None, record.name)]
+
+
+def get_trace_statistics():
+    """Return the statistics of the traced calls in the records
+
+    Returns:
+        (dict): function name -> dict of calls, errors, mean_time,
+                max_time [s] and max_result_size
+    """
+    statistics = {}
+    for record in list(_trace_records):
+        stats = statistics.setdefault(
+            record.name,
+            {
+                "calls": 0,
+                "errors": 0,
+                "mean_time": 0,
+                "max_time": 0,
+                "max_result_size": 0,
+            },
+        )
+        stats["calls"] += 1
+        stats["errors"] += record.error
+        stats["mean_time"] += record.duration
+        stats["max_time"] = max(record.duration, stats["max_time"])
+        stats["max_result_size"] = max(record.result_size, stats["max_result_size"])
+    for stats in statistics.values():
+        stats["mean_time"] /= stats["calls"]
+    return statistics
+
+
+def trace(fun):
+    def _trace(*args):
+        log_result = _log_call(fun.__name__)
+        if log_result:
+            logging.getLogger("ispyb_client").debug(
+                "lims client %s called with: %s", fun.__name__, _LazyFormat(*args[1:])
+            )
+        return _call_traced(fun, args, {}, log_result)
 
     return _trace
 
 
 def in_greenlet(fun):
     def _in_greenlet(*args, **kwargs):
-        log_msg = "lims client " + fun.__name__ + " called with: "
-
-        for arg in args[1:]:
-            try:
-                log_msg += pformat(arg, indent=4, width=80) + ", "
-            except Exception:
-                pass
-
-        logging.getLogger("ispyb_client").debug(log_msg)
-        task = gevent.spawn(fun, *args)
+        if _log_call(fun.__name__):
+            logging.getLogger("ispyb_client").debug(
+                "lims client %s called with: %s", fun.__name__, _LazyFormat(*args[1:])
+            )
+        task = gevent.spawn(_call_traced, fun, args, {}, False)
         if kwargs.get("wait", False):
             task.get()
 
@@ -148,6 +265,172 @@ def utf_decode(res_d):
     return res_d
 
 
+class _TimedService(object):
+    """Proxy of a suds service, timing each SOAP operation"""
+
+    def __init__(self, service, service_name, statistics):
+        self._service = service
+        self._service_name = service_name
+        self._statistics = statistics
+
+    def __getattr__(self, name):
+        method = getattr(self._service, name)
+        key = "%s.%s" % (self._service_name, name)
+
+        def timed_method(*args, **kwargs):
+            start_time = time.time()
+            failed = True
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                duration = time.time() - start_time
+                stats = self._statistics.get(key)
+                if stats is None:
+                    stats = self._statistics[key] = {
+                        "calls": 0,
+                        "errors": 0,
+                        "total_time": 0,
+                        "max_time": 0,
+                    }
+                stats["calls"] += 1
+                stats["errors"] += failed
+                stats["total_time"] += duration
+                stats["max_time"] = max(duration, stats["max_time"])
+                logging.getLogger("ispyb_client").debug(
+                    "lims client %s took %.3f s", key, duration
+                )
+
+        return timed_method
+
+
+class _CachedFactory(object):
+    """Proxy of a suds factory, resolving each type name only once"""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._types = {}
+
+    def create(self, name):
+        type_ = self._types.get(name)
+        if type_ is None:
+            type_ = self._factory.resolver.find(name)
+            if type_ is None or type_.enum():
+                # not cached: let suds raise or build the enumeration
+                return self._factory.create(name)
+            self._types[name] = type_
+        return self._factory.builder.build(type_)
+
+    def __getattr__(self, name):
+        return getattr(self._factory, name)
+
+
+class _ManagedClient(object):
+    """Long-lived suds client, with timed service and cached factory"""
+
+    def __init__(self, client, service_name, statistics):
+        self.client = client
+        self.service = _TimedService(client.service, service_name, statistics)
+        self.factory = _CachedFactory(client.factory)
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+class WebServiceClients(object):
+    """Suds clients of the ISPyB web services, one per WSDL url
+
+    Clients are created on first use and then kept, so that each WSDL is
+    fetched and parsed once per process. With a cache directory, the
+    parsed WSDLs and schemas are also pickled on disk for cache_days
+    days, in a subdirectory per cache_version: change the version
+    to discard the cache when the web services change.
+    """
+
+    def __init__(
+        self,
+        cache_directory=None,
+        cache_days=7,
+        cache_version="1",
+        timeout=None,
+        transport_class=None,
+        username=None,
+        password=None,
+        proxy=None,
+    ):
+        self.cache_directory = cache_directory
+        self.cache_days = cache_days
+        self.cache_version = cache_version
+        self.timeout = timeout
+        self.transport_class = transport_class
+        self.username = username
+        self.password = password
+        self.proxy = proxy or {}
+        self._clients = {}
+        self._statistics = {}
+
+    def get_client(self, url):
+        """Return the client of a web service, created on first use
+
+        Args:
+            url (str): WSDL url
+
+        Returns:
+            (_ManagedClient): proxy of the suds client
+        """
+        client = self._clients.get(url)
+        if client is None:
+            client = self._clients[url] = self._create_client(url)
+        return client
+
+    def get_statistics(self):
+        """Return the call statistics of the SOAP operations
+
+        Returns:
+            (dict): "service.operation" -> dict of calls, errors, total_time,
+                    max_time and mean_time [s]
+        """
+        statistics = {}
+        for key, stats in self._statistics.items():
+            stats = dict(stats)
+            stats["mean_time"] = stats["total_time"] / stats["calls"]
+            statistics[key] = stats
+        return statistics
+
+    def _create_client(self, url):
+        options = {"proxy": self.proxy}
+        if self.timeout is not None:
+            options["timeout"] = self.timeout
+        if self.transport_class is not None:
+            options["transport"] = self.transport_class(
+                username=self.username, password=self.password, proxy=self.proxy
+            )
+        if self.cache_directory:
+            options["cache"] = ObjectCache(
+                os.path.join(self.cache_directory, str(self.cache_version)),
+                days=self.cache_days,
+            )
+            # cache the parsed WSDL objects, not only the documents
+            options["cachingpolicy"] = 1
+        else:
+            # ensure that suds do not create cache files in tmp
+            options["cache"] = None
+
+        start_time = time.time()
+        client = Client(url, **options)
+        client.set_options(location=url)
+        logging.getLogger("ispyb_client").debug(
+            "lims client created for %s in %.3f s", url, time.time() - start_time
+        )
+        service_name = url.rsplit("/", 1)[-1].split("?", 1)[0]
+        return _ManagedClient(client, service_name, self._statistics)
+
+
+# clients shared by the ISPyBClient and ISPyBValueFactory, set by init()
+_WS_CLIENTS = WebServiceClients()
+
+
 class ISPyBClient(HardwareObject):
     """
     Web-service client for ISPyB.
@@ -172,6 +455,7 @@ class ISPyBClient(HardwareObject):
         self.ws_root = None
         self.ws_username = None
         self.ws_password = None
+        self.ws_clients = None
 
         self.base_result_url = None
 
@@ -180,6 +464,7 @@ class ISPyBClient(HardwareObject):
         Init method declared by HardwareObject.
         """
         self.lims_rest = self.get_object_by_role("lims_rest")
+        set_trace_buffer_size(self.get_property("trace_buffer_size"))
         self.authServerType = self.get_property("authServerType") or "ldap"
         if self.authServerType == "ldap":
             # Initialize ldap
@@ -220,6 +505,7 @@ class ISPyBClient(HardwareObject):
                 global _WS_COLLECTION_URL
                 global _WS_SCREENING_URL
                 global _WS_AUTOPROC_URL
+                global _WS_CLIENTS
 
                 _WSDL_ROOT = self.ws_root.strip()
                 _WS_BL_SAMPLE_URL = _WSDL_ROOT + "ToolsForBLSampleWebService?wsdl"
@@ -232,67 +518,22 @@ class ISPyBClient(HardwareObject):
                 else:
                     from suds.transport.http import HttpAuthenticated
 
-                t1 = HttpAuthenticated(
-                    username=self.ws_username,
-                    password=self.ws_password,
-                    proxy=self.proxy,
-                )
-
-                t2 = HttpAuthenticated(
-                    username=self.ws_username,
-                    password=self.ws_password,
-                    proxy=self.proxy,
-                )
-
-                t3 = HttpAuthenticated(
-                    username=self.ws_username,
-                    password=self.ws_password,
-                    proxy=self.proxy,
-                )
-
-                t4 = HttpAuthenticated(
+                _WS_CLIENTS = self.ws_clients = WebServiceClients(
+                    cache_directory=self.get_property("wsdl_cache_directory"),
+                    cache_days=self.get_property("wsdl_cache_days", 7),
+                    cache_version=self.get_property("wsdl_cache_version", 1),
+                    timeout=3,
+                    transport_class=HttpAuthenticated,
                     username=self.ws_username,
                     password=self.ws_password,
                     proxy=self.proxy,
                 )
 
                 try:
-                    self._shipping = Client(
-                        _WS_SHIPPING_URL,
-                        timeout=3,
-                        transport=t1,
-                        cache=None,
-                        proxy=self.proxy,
-                    )
-                    self._collection = Client(
-                        _WS_COLLECTION_URL,
-                        timeout=3,
-                        transport=t2,
-                        cache=None,
-                        proxy=self.proxy,
-                    )
-                    self._tools_ws = Client(
-                        _WS_BL_SAMPLE_URL,
-                        timeout=3,
-                        transport=t3,
-                        cache=None,
-                        proxy=self.proxy,
-                    )
-                    self._autoproc_ws = Client(
-                        _WS_AUTOPROC_URL,
-                        timeout=3,
-                        transport=t4,
-                        cache=None,
-                        proxy=self.proxy,
-                    )
-
-                    # ensure that suds do not create those files in tmp
-                    self._shipping.set_options(cache=None, location=_WS_SHIPPING_URL)
-                    self._collection.set_options(
-                        cache=None, location=_WS_COLLECTION_URL
-                    )
-                    self._tools_ws.set_options(cache=None, location=_WS_BL_SAMPLE_URL)
-                    self._autoproc_ws.set_options(cache=None, location=_WS_AUTOPROC_URL)
+                    self._shipping = self.ws_clients.get_client(_WS_SHIPPING_URL)
+                    self._collection = self.ws_clients.get_client(_WS_COLLECTION_URL)
+                    self._tools_ws = self.ws_clients.get_client(_WS_BL_SAMPLE_URL)
+                    self._autoproc_ws = self.ws_clients.get_client(_WS_AUTOPROC_URL)
                 except URLError:
                     logging.getLogger("ispyb_client").exception(_CONNECTION_ERROR_MSG)
                     return
@@ -319,6 +560,18 @@ class ISPyBClient(HardwareObject):
                 except AttributeError:
                     pass
 
+    def get_soap_statistics(self):
+        """Return the call statistics of the SOAP operations, see
+        WebServiceClients.get_statistics"""
+        if self.ws_clients is None:
+            return {}
+        return self.ws_clients.get_statistics()
+
+    def get_trace_statistics(self):
+        """Return the statistics of the traced calls, see
+        get_trace_statistics"""
+        return get_trace_statistics()
+
     def get_login_type(self):
         return self.loginType
 
@@ -1096,14 +1349,17 @@ class ISPyBClient(HardwareObject):
             )
 
     # @in_greenlet
-    def store_image(self, image_dict):
+    def store_image(self, image_dict, raise_errors=False):
         """
         Stores the image (image parameters) <image_dict>
 
         :param image_dict: A dictonary with image pramaters.
         :type image_dict: dict
 
-        :returns: None
+        :param raise_errors: Raise the errors instead of logging them
+        :type raise_errors: bool
+
+        :returns: The image id
         """
         if self._disabled:
             return
@@ -1120,17 +1376,23 @@ class ISPyBClient(HardwareObject):
                     )
                     return image_id
                 except WebFault:
+                    if raise_errors:
+                        raise
                     logging.getLogger("ispyb_client").exception(
                         "ISPyBClient: exception in store_image"
                     )
                 except URLError:
+                    if raise_errors:
+                        raise
                     logging.getLogger("ispyb_client").exception(_CONNECTION_ERROR_MSG)
             else:
-                logging.getLogger("ispyb_client").error(
-                    "Error in store_image: "
-                    + "data_collection_id missing, could not store image in ISPyB"
-                )
+                msg = "data_collection_id missing, could not store image in ISPyB"
+                if raise_errors:
+                    raise ValueError(msg)
+                logging.getLogger("ispyb_client").error("Error in store_image: " + msg)
         else:
+            if raise_errors:
+                raise RuntimeError("could not connect to ISPyB server")
             logging.getLogger("ispyb_client").exception(
                 "Error in store_image: could not connect to server"
             )
@@ -2479,7 +2741,7 @@ class ISPyBValueFactory:
         workflow_vo = None
 
         try:
-            ws_client = Client(_WS_COLLECTION_URL, cache=None)
+            ws_client = _WS_CLIENTS.get_client(_WS_COLLECTION_URL)
             workflow_vo = ws_client.factory.create("workflow3VO")
         except Exception:
             raise
@@ -2510,7 +2772,7 @@ class ISPyBValueFactory:
         workflow_mesh_vo = None
 
         try:
-            ws_client = Client(_WS_COLLECTION_URL, cache=None)
+            ws_client = _WS_CLIENTS.get_client(_WS_COLLECTION_URL)
             workflow_mesh_vo = ws_client.factory.create("workflowMeshWS3VO")
         except Exception:
             raise
@@ -2544,7 +2806,7 @@ class ISPyBValueFactory:
         grid_info_vo = None
 
         try:
-            ws_client = Client(_WS_COLLECTION_URL, cache=None)
+            ws_client = _WS_CLIENTS.get_client(_WS_COLLECTION_URL)
             grid_info_vo = ws_client.factory.create("gridInfoWS3VO")
         except Exception:
             raise
@@ -2574,7 +2836,7 @@ class ISPyBValueFactory:
         workflow_vo = None
 
         try:
-            ws_client = Client(_WS_COLLECTION_URL, cache=None)
+            ws_client = _WS_CLIENTS.get_client(_WS_COLLECTION_URL)
             workflow_step_vo = ws_client.factory.create("workflowStep3VO")
         except Exception:
             raise
@@ -2612,7 +2874,7 @@ class ISPyBValueFactory:
         grid_info_vo = None
 
         try:
-            ws_client = Client(_WS_COLLECTION_URL, cache=None)
+            ws_client = _WS_CLIENTS.get_client(_WS_COLLECTION_URL)
             grid_info_vo = ws_client.factory.create("gridInfoWS3VO")
         except Exception:
             raise
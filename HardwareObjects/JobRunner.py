@@ -0,0 +1,452 @@
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""Runs the external programs (EDNA, dozor, CrystFEL, autoprocessing) as jobs
+
+Jobs belong to a tool class, e.g. "characterisation", with a bounded number
+of jobs running at the same time, and the number of jobs running for all
+tool classes can be bounded as well (max_jobs). Waiting jobs start in order
+of priority, then of submission, whatever their tool class, as soon as both
+their pool and the global limit have a free slot: interactive jobs go ahead
+of background autoprocessing. Jobs of a pool without limit (None), e.g.
+the dozor jobs of the online processing, always start at once. Jobs are
+waited for in greenlets, run in their own process group (cancel terminates
+all their processes) and through utils/job_wrapper.py, which records their
+CPU time and maximum resident set size. The last jobs are kept in a
+history:
+
+    HWR.beamline.job_runner.get_jobs(tool="characterisation")
+
+Example xml:
+
+<object class="JobRunner">
+  <!-- maximum number of jobs running at the same time, per tool class,
+       None for no limit -->
+  <pools>
+    {"characterisation": 2, "online_processing": None, "thumbnails": 2,
+     "autoprocessing": 1}
+  </pools>
+  <default_pool_size>1</default_pool_size>
+  <!-- maximum number of jobs running at the same time, all tool classes,
+       0 for no limit -->
+  <max_jobs>3</max_jobs>
+  <history_size>500</history_size>
+  <!-- delay between SIGTERM and SIGKILL on cancel [s] -->
+  <kill_timeout>5</kill_timeout>
+</object>
+"""
+
+import ast
+import enum
+import heapq
+import itertools
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+import time
+from collections import deque
+
+import gevent
+import gevent.event
+from gevent import subprocess
+
+from HardwareRepository.BaseHardwareObjects import HardwareObject
+from HardwareRepository.utils import job_wrapper
+
+__copyright__ = """ Copyright © 2020 by the MXCuBE collaboration """
+__license__ = "LGPLv3+"
+
+# Job priorities, lower values start first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BACKGROUND = 20
+
+JOB_WRAPPER = os.path.splitext(os.path.abspath(job_wrapper.__file__))[0] + ".py"
+
+
+class JobState(enum.Enum):
+    """Job states"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class Job(object):
+    """External program run by the JobRunner
+
+    Attributes:
+        id (int): job number
+        name (str): description
+        tool (str): tool class
+        command (str or list): shell command line, or program and arguments
+        priority (int): lower values start first
+        state (JobState): state
+        returncode (int): exit code, 128 + signal number if killed
+        submit_time (float): submission time, as time.time()
+        start_time (float): start time, None if not started
+        end_time (float): end time, None if not finished
+        cpu_time (float): user and system CPU time [s]
+        max_rss (int): maximum resident set size [kB]
+    """
+
+    def __init__(self, runner, job_id, command, tool, priority, name, **kwargs):
+        self.id = job_id
+        self.name = name or "%s-%d" % (tool, job_id)
+        self.tool = tool
+        self.command = command
+        self.priority = priority
+        self.state = JobState.QUEUED
+        self.returncode = None
+        self.submit_time = time.time()
+        self.start_time = None
+        self.end_time = None
+        self.cpu_time = None
+        self.max_rss = None
+
+        # cwd, env, log_file
+        self.process_options = kwargs
+        self._runner = runner
+        self._process = None
+        self._usage_file = None
+        self._cancel_requested = False
+        self._finished = gevent.event.Event()
+
+    @property
+    def wall_time(self):
+        """Run time [s], up to now if running, None if not started"""
+        if self.start_time is None:
+            return None
+        return (self.end_time or time.time()) - self.start_time
+
+    @property
+    def pid(self):
+        """Process id of the job (and process group id), None if not running"""
+        if self._process is None:
+            return None
+        return self._process.pid
+
+    def is_finished(self):
+        """Returns True if the job is finished, cancelled or failed"""
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """Wait for the end of the job, without blocking other greenlets
+
+        Args:
+            timeout (float): maximum wait [s], None for no limit
+
+        Returns:
+            (int): exit code, None on timeout or if cancelled before start
+        """
+        self._finished.wait(timeout)
+        return self.returncode
+
+    def cancel(self):
+        """Cancel the job, see JobRunner.cancel"""
+        return self._runner.cancel(self)
+
+    def as_dict(self):
+        """Returns the job attributes, for display"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "tool": self.tool,
+            "command": self.command,
+            "priority": self.priority,
+            "state": self.state.value,
+            "returncode": self.returncode,
+            "submit_time": self.submit_time,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "max_rss": self.max_rss,
+        }
+
+
+class JobRunner(HardwareObject):
+    """Pools of external programs, per tool class
+
+    Signals emited:
+        - jobStateChanged (Job): a job is queued, started, or finished
+    """
+
+    def __init__(self, name):
+        HardwareObject.__init__(self, name)
+        self.pools = {}
+        self.default_pool_size = 1
+        self.max_jobs = 0
+        self.kill_timeout = 5
+        # tool -> heap of (priority, job id, job)
+        self._queues = {}
+        # tool -> running jobs
+        self._running = {}
+        self._history = deque(maxlen=500)
+        self._job_ids = itertools.count(1)
+
+    def init(self):
+        self.pools = ast.literal_eval(str(self.get_property("pools", "{}")).strip())
+        self.default_pool_size = int(self.get_property("default_pool_size", 1))
+        self.max_jobs = int(self.get_property("max_jobs", 0))
+        self.kill_timeout = float(self.get_property("kill_timeout", 5))
+        self._history = deque(maxlen=int(self.get_property("history_size", 500)))
+
+    def get_pool_size(self, tool):
+        """Returns the maximum number of jobs of a tool class running at the
+        same time, None for no limit"""
+        return self.pools.get(tool, self.default_pool_size)
+
+    def submit(self, command, tool, priority=PRIORITY_NORMAL, name=None, **kwargs):
+        """Queue a job, started as soon as its pool and the global limit
+        have a free slot
+
+        Args:
+            command (str or list): shell command line, or program and arguments
+            tool (str): tool class, e.g. "characterisation"
+            priority (int): PRIORITY_INTERACTIVE, PRIORITY_NORMAL,
+                PRIORITY_BACKGROUND or any int, lower values start first
+            name (str): description
+
+        Keyword Args:
+            cwd (str): working directory
+            env (dict): environment
+            log_file (str): file receiving the standard and error outputs
+
+        Returns:
+            (Job): the job
+        """
+        job = Job(self, next(self._job_ids), command, tool, priority, name, **kwargs)
+        heapq.heappush(self._queues.setdefault(tool, []), (priority, job.id, job))
+        self._history.append(job)
+        self.emit("jobStateChanged", (job,))
+        self._start_jobs()
+        return job
+
+    def run(self, command, tool, priority=PRIORITY_NORMAL, name=None, **kwargs):
+        """Submit a job and wait for its end, see submit
+
+        Returns:
+            (Job): the finished job
+        """
+        job = self.submit(command, tool, priority, name, **kwargs)
+        job.wait()
+        return job
+
+    def cancel(self, job):
+        """Cancel a job: a waiting job is not started, the process group of
+        a running job is terminated, then killed after kill_timeout
+
+        Args:
+            job (Job): job
+
+        Returns:
+            (bool): False if the job was already finished
+        """
+        if job.state is JobState.QUEUED:
+            job.end_time = time.time()
+            self._finish(job, JobState.CANCELLED)
+            return True
+        if job.state is JobState.RUNNING and not job._cancel_requested:
+            job._cancel_requested = True
+            self._signal(job, signal.SIGTERM)
+            gevent.spawn_later(self.kill_timeout, self._kill, job)
+            return True
+        return False
+
+    def get_jobs(self, tool=None, state=None):
+        """Returns the jobs of the history, oldest first
+
+        Args:
+            tool (str): only the jobs of this tool class
+            state (JobState or str): only the jobs in this state
+
+        Returns:
+            (list): jobs
+        """
+        # compared by value: the hardware object module may be loaded twice
+        state = getattr(state, "value", state)
+        return [
+            job
+            for job in self._history
+            if (tool is None or job.tool == tool)
+            and (state is None or job.state.value == state)
+        ]
+
+    def get_statistics(self):
+        """Returns, per tool class, the pool size, the number of jobs of the
+        history per state, and the mean wall and CPU times [s] and largest
+        resident set size [kB] of its finished jobs
+
+        Returns:
+            (dict): tool -> statistics
+        """
+        statistics = {}
+        for job in self._history:
+            stats = statistics.get(job.tool)
+            if stats is None:
+                stats = dict((state.value, 0) for state in JobState)
+                stats.update(
+                    pool_size=self.get_pool_size(job.tool),
+                    wall_time=0,
+                    cpu_time=0,
+                    max_rss=0,
+                    measured=0,
+                )
+                statistics[job.tool] = stats
+            stats[job.state.value] += 1
+            if job.cpu_time is not None:
+                stats["measured"] += 1
+                stats["wall_time"] += job.wall_time
+                stats["cpu_time"] += job.cpu_time
+                stats["max_rss"] = max(stats["max_rss"], job.max_rss)
+
+        for stats in statistics.values():
+            measured = stats.pop("measured") or 1
+            stats["mean_wall_time"] = stats.pop("wall_time") / measured
+            stats["mean_cpu_time"] = stats.pop("cpu_time") / measured
+        return statistics
+
+    def _start_jobs(self):
+        """Start the first waiting jobs of all the tool classes, in order of
+        priority, while their pool and the global limit have free slots"""
+        while True:
+            free_slot = (
+                not self.max_jobs
+                or sum(len(running) for running in self._running.values())
+                < self.max_jobs
+            )
+            candidates = []
+            for tool, queue in self._queues.items():
+                # cancelled jobs are left in the queue
+                while queue and queue[0][2].state is not JobState.QUEUED:
+                    heapq.heappop(queue)
+                running = self._running.setdefault(tool, set())
+                pool_size = self.get_pool_size(tool)
+                # pools without limit ignore the global limit as well
+                if queue and (
+                    pool_size is None or (free_slot and len(running) < pool_size)
+                ):
+                    candidates.append(queue[0])
+            if not candidates:
+                return
+            job = min(candidates)[2]
+            heapq.heappop(self._queues[job.tool])
+            self._start(job, self._running[job.tool])
+
+    def _start(self, job, running):
+        command = job.command
+        if not isinstance(command, (list, tuple)):
+            command = ["/bin/sh", "-c", command]
+        fd, job._usage_file = tempfile.mkstemp(prefix="mxcube_job_", suffix=".json")
+        os.close(fd)
+
+        options = job.process_options
+        log_file = options.get("log_file")
+        output = open(log_file, "a") if log_file else None
+        try:
+            job._process = subprocess.Popen(
+                [sys.executable, JOB_WRAPPER, job._usage_file] + list(command),
+                cwd=options.get("cwd"),
+                env=options.get("env"),
+                stdin=None,
+                stdout=output,
+                stderr=subprocess.STDOUT if output else None,
+                close_fds=True,
+                # own process group, terminated on cancel
+                preexec_fn=os.setsid,
+            )
+        except OSError:
+            logging.getLogger("HWR").exception(
+                "JobRunner: cannot start job %s", job.name
+            )
+            os.remove(job._usage_file)
+            job.start_time = job.end_time = time.time()
+            self._finish(job, JobState.FAILED)
+            return
+        finally:
+            if output is not None:
+                output.close()
+
+        job.start_time = time.time()
+        job.state = JobState.RUNNING
+        running.add(job)
+        logging.getLogger("HWR").debug(
+            "JobRunner: job %s started (pid %d): %s", job.name, job.pid, job.command
+        )
+        self.emit("jobStateChanged", (job,))
+        gevent.spawn(self._wait, job, running)
+
+    def _wait(self, job, running):
+        returncode = job._process.wait()
+        job.end_time = time.time()
+        try:
+            with open(job._usage_file) as usage_file:
+                usage = json.load(usage_file)
+        except (IOError, ValueError):
+            # wrapper killed
+            usage = {"returncode": returncode}
+        finally:
+            try:
+                os.remove(job._usage_file)
+            except OSError:
+                pass
+
+        job.returncode = usage["returncode"]
+        job.cpu_time = usage.get("cpu_time")
+        job.max_rss = usage.get("max_rss")
+        running.discard(job)
+
+        if job._cancel_requested:
+            state = JobState.CANCELLED
+        elif job.returncode == 0:
+            state = JobState.SUCCESS
+        else:
+            state = JobState.FAILED
+        logging.getLogger("HWR").debug(
+            "JobRunner: job %s %s (exit code %s) in %.1f s",
+            job.name,
+            state.value,
+            job.returncode,
+            job.wall_time,
+        )
+        self._finish(job, state)
+        self._start_jobs()
+
+    def _finish(self, job, state):
+        job.state = state
+        job._finished.set()
+        self.emit("jobStateChanged", (job,))
+
+    def _signal(self, job, signum):
+        try:
+            os.killpg(job.pid, signum)
+        except OSError:
+            # already finished
+            pass
+
+    def _kill(self, job):
+        if job.state is JobState.RUNNING:
+            self._signal(job, signal.SIGKILL)
@@ -71,8 +71,8 @@ class LimaEigerDetector(AbstractDetector):
             "saving_common_header",
         )
 
-        self.get_command_object("prepare_acq").init_device()
-        self.get_command_object("prepare_acq").device.set_timeout_millis(5 * 60 * 1000)
+        # the proxies are shared: do not change the timeout of the common one
+        self.get_command_object("prepare_acq").set_device_timeout(5 * 60 * 1000)
         self.get_channel_object("photon_energy").init_device()
         self._emit_status()
 
@@ -102,6 +102,20 @@ edPlugin.executeSynchronous()
 
 HPC_HOST = "b-picard07-clu0-fe-0.maxiv.lu.se"
 
+try:
+    from HardwareRepository import HardwareRepository as HWR
+    from HardwareRepository.HardwareObjects.JobRunner import PRIORITY_BACKGROUND
+except ImportError:
+    # run as a script, outside MXCuBE
+    HWR = None
+
+
+def get_job_runner():
+    """Returns the job runner of the beamline, None outside MXCuBE"""
+    if HWR is None or HWR.beamline is None:
+        return None
+    return HWR.beamline.job_runner
+
 
 class AutoProcLauncher:
     def __init__(
@@ -209,10 +223,14 @@ class AutoProcLauncher:
             "Autoproc launcher: command gonna be launched: %s" % cmd
         )
 
-        p = subprocess.Popen(
-            cmd, shell=True
-        )  # , stdout = subprocess.PIPE, stderr = subprocess.PIPE)
-        p.wait()
+        job_runner = get_job_runner()
+        if job_runner is not None:
+            job_runner.run(cmd, "autoprocessing", PRIORITY_BACKGROUND, name="autoPROC")
+        else:
+            p = subprocess.Popen(
+                cmd, shell=True
+            )  # , stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+            p.wait()
 
     def parse_and_execute(self):
         self.parse_input_file()
@@ -47,6 +47,8 @@ import math
 import logging
 from datetime import datetime
 
+import numpy
+
 from gui.utils import QtImport
 
 from HardwareRepository.HardwareObjects import queue_model_objects
@@ -691,6 +693,9 @@ class GraphicsItemGrid(GraphicsItem):
     BOT_LEFT = 2
     BOT_RIGHT = 3
 
+    # Frame numbers are not displayed in cells smaller than this [pix]
+    MIN_TEXT_CELL_SIZE = 30
+
     """Grid representation is based on two grid states:
                __draw_mode = True: user defines grid size
                              False: grid is defined
@@ -761,6 +766,15 @@ class GraphicsItemGrid(GraphicsItem):
         self.__original_pixmap = None
         self.base_color = QtImport.QColor(70, 70, 165, self.__fill_alpha)
 
+        # Cells are rendered in a cached image: only the cells whose color
+        # changed are repainted, or all of them when the geometry changed
+        self.__cell_colors = None
+        self.__dirty_cells = None
+        self.__cells_image = None
+        self.__cells_image_origin = None
+        self.__cells_image_key = None
+        self.__coordinate_map_version = 0
+
     @staticmethod
     def set_grid_direction(grid_direction):
         """Sets grids direction.
@@ -994,6 +1008,8 @@ class GraphicsItemGrid(GraphicsItem):
             pos_x, pos_y = self.get_coord_from_line_image(line, image)
             col, row = self.get_col_row_from_line_image(line, image)
             self.__coordinate_map.append((line, image, pos_x, pos_y, col, row))
+        self.__coordinate_map_version += 1
+        self.__update_cell_colors()
 
     def set_corner_coord(self, corner_coord):
         """
@@ -1220,6 +1236,130 @@ class GraphicsItemGrid(GraphicsItem):
         :return:
         """
         self.__score = score
+        self.__update_cell_colors()
+
+    def __update_cell_colors(self):
+        """
+        Computes the fill color of all cells, normalising the score once,
+        and marks the cells whose color changed for repaint
+        :return:
+        """
+        num_cells = self.__num_cols * self.__num_rows
+        if not self.__display_overlay:
+            colors = numpy.zeros(num_cells, dtype=numpy.uint32)
+        elif self.__score is None:
+            colors = numpy.full(num_cells, self.base_color.rgba(), dtype=numpy.uint32)
+        else:
+            score = numpy.zeros(num_cells)
+            values = numpy.asarray(self.__score, dtype=float).ravel()[:num_cells]
+            score[: values.size] = values
+            max_score = score.max() if num_cells else 0
+            if max_score > 0:
+                # hsv (60 * score, 255, 255 * score) as argb
+                score = numpy.clip(score / max_score, 0, 1)
+                value = (255 * score).astype(numpy.uint32)
+                green = value * (60 * score).astype(numpy.uint32) // 60
+                alpha = numpy.uint32(self.__fill_alpha) << 24
+                colors = alpha | (value << 16) | (green << 8)
+            else:
+                colors = numpy.zeros(num_cells, dtype=numpy.uint32)
+
+        if self.__cell_colors is None or self.__cell_colors.shape != colors.shape:
+            self.__dirty_cells = None
+        elif self.__dirty_cells is not None:
+            self.__dirty_cells.update(
+                numpy.flatnonzero(colors != self.__cell_colors).tolist()
+            )
+        self.__cell_colors = colors
+
+    def __render_cells(self):
+        """
+        Paints the dirty cells in the cached cells image
+        :return:
+        """
+        text_visible = min(self.__spacing_pix) >= self.MIN_TEXT_CELL_SIZE
+        image_key = (
+            self.__coordinate_map_version,
+            tuple(self.__spacing_pix),
+            tuple(self.beam_size_pix),
+            self.beam_is_rectangle,
+            self.__first_image_num,
+            self.custom_pen.color().rgba(),
+            self.custom_pen.style(),
+            text_visible,
+        )
+        if image_key != self.__cells_image_key or self.__cells_image is None:
+            self.__cells_image_key = image_key
+            self.__dirty_cells = None
+        if (
+            self.__cell_colors is None
+            or self.__cell_colors.size < len(self.__coordinate_map)
+        ):
+            self.__update_cell_colors()
+            self.__dirty_cells = None
+
+        if self.__dirty_cells is None:
+            dirty_cells = range(len(self.__coordinate_map))
+            if self.__coordinate_map:
+                positions = numpy.array(
+                    [cell[2:4] for cell in self.__coordinate_map], dtype=float
+                )
+                cell_size = numpy.maximum(self.__spacing_pix, self.beam_size_pix)
+                origin = positions.min(axis=0) - cell_size / 2.0 - 1
+                size = positions.max(axis=0) - origin + cell_size / 2.0 + 1
+            else:
+                origin = size = numpy.ones(2)
+            self.__cells_image_origin = QtImport.QPointF(origin[0], origin[1])
+            self.__cells_image = QtImport.QImage(
+                int(math.ceil(size[0])),
+                int(math.ceil(size[1])),
+                QtImport.QImage.Format_ARGB32_Premultiplied,
+            )
+            self.__cells_image.fill(QtImport.Qt.transparent)
+        else:
+            dirty_cells = sorted(self.__dirty_cells)
+        self.__dirty_cells = set()
+        if not len(dirty_cells):
+            return
+
+        painter = QtImport.QPainter(self.__cells_image)
+        painter.translate(-self.__cells_image_origin)
+        painter.setPen(self.custom_pen)
+        brush = QtImport.QBrush(SOLID_PATTERN_STYLE)
+        for image_index in dirty_cells:
+            (line, image, pos_x, pos_y, col, row) = self.__coordinate_map[image_index]
+            paint_rect = QtImport.QRectF(
+                pos_x - self.__spacing_pix[0] / 2.0,
+                pos_y - self.__spacing_pix[1] / 2.0,
+                self.__spacing_pix[0],
+                self.__spacing_pix[1],
+            )
+            shape_rect = QtImport.QRectF(
+                pos_x - self.beam_size_pix[0] / 2.0,
+                pos_y - self.beam_size_pix[1] / 2.0,
+                self.beam_size_pix[0],
+                self.beam_size_pix[1],
+            )
+
+            painter.setCompositionMode(QtImport.QPainter.CompositionMode_Source)
+            painter.fillRect(paint_rect.united(shape_rect), QtImport.Qt.transparent)
+            painter.setCompositionMode(QtImport.QPainter.CompositionMode_SourceOver)
+
+            brush.setColor(
+                QtImport.QColor.fromRgba(int(self.__cell_colors[image_index]))
+            )
+            painter.setBrush(brush)
+            if text_visible:
+                painter.drawText(
+                    paint_rect,
+                    QtImport.Qt.AlignCenter,
+                    str(image_index + self.__first_image_num),
+                )
+            if self.beam_is_rectangle:
+                painter.drawRect(shape_rect)
+            else:
+                painter.drawEllipse(shape_rect)
+        painter.end()
 
     def get_snapshot(self):
         """
@@ -1247,6 +1387,7 @@ class GraphicsItemGrid(GraphicsItem):
             self.__overlay_pixmap.setOpacity(self.__fill_alpha / 255.0)
         else:
             self.base_color.setAlpha(self.__fill_alpha)
+        self.__update_cell_colors()
 
     def set_display_overlay(self, state):
         """
@@ -1255,6 +1396,9 @@ class GraphicsItemGrid(GraphicsItem):
         :return:
         """
         self.__display_overlay = state
+        self.__update_cell_colors()
+        # the grid may not be in a scene yet
+        self.update()
 
     def set_base_color(self, color):
         """
@@ -1264,6 +1408,7 @@ class GraphicsItemGrid(GraphicsItem):
         """
         self.base_color = color
         self.base_color.setAlpha(self.__fill_alpha)
+        self.__update_cell_colors()
         self.scene().update()
 
     def paint(self, painter, option, widget):
@@ -1299,59 +1444,8 @@ class GraphicsItemGrid(GraphicsItem):
             if min(self.__spacing_pix) < 20:
                 painter.drawPolygon(self.__frame_polygon, QtImport.Qt.OddEvenFill)
             else:
-                for image_index in range(self.__num_cols * self.__num_rows):
-                    # Estimate area where frame number or score will be displayed
-                    (line, image, pos_x, pos_y, col, row) = self.__coordinate_map[
-                        image_index
-                    ]
-                    paint_rect = QtImport.QRect(
-                        pos_x - self.__spacing_pix[0] / 2,
-                        pos_y - self.__spacing_pix[1] / 2,
-                        self.__spacing_pix[0],
-                        self.__spacing_pix[1],
-                    )
-
-                    # If score exists overlay color may change
-                    cell_score = None
-                    if self.__display_overlay:
-                        cell_score = 1.0
-                        if self.__score is not None:
-                            cell_score = self.__score[image_index]
-
-                            if self.__score.max() > 0:
-                                cell_score = float(cell_score) / self.__score.max()
-                                brush_color.setHsv(
-                                    0 + 60 * cell_score,
-                                    255,
-                                    255 * cell_score,
-                                    self.__fill_alpha,
-                                )
-                                self.custom_brush.setColor(brush_color)
-                                painter.setBrush(self.custom_brush)
-                            else:
-                                painter.setBrush(QtImport.Qt.transparent)
-                    else:
-                        painter.setBrush(QtImport.Qt.transparent)
-
-                    painter.drawText(
-                        paint_rect,
-                        QtImport.Qt.AlignCenter,
-                        str(image_index + self.__first_image_num),
-                    )
-                    if self.beam_is_rectangle:
-                        painter.drawRect(
-                            pos_x - self.beam_size_pix[0] / 2,
-                            pos_y - self.beam_size_pix[1] / 2,
-                            self.beam_size_pix[0],
-                            self.beam_size_pix[1],
-                        )
-                    else:
-                        painter.drawEllipse(
-                            pos_x - self.beam_size_pix[0] / 2,
-                            pos_y - self.beam_size_pix[1] / 2,
-                            self.beam_size_pix[0],
-                            self.beam_size_pix[1],
-                        )
+                self.__render_cells()
+                painter.drawImage(self.__cells_image_origin, self.__cells_image)
 
         # Draws x in the middle of the grid
         painter.drawLine(
@@ -42,6 +42,137 @@ class Serializer(object):
         return json.dumps(object, default=lambda o: o.__dict__.values()[0])
 
 
+class QueueModelIndex(object):
+    """
+    Index of the nodes of a model on node id, and of their path templates
+    on directory, prefix and run number, with their ranges of image numbers.
+    Kept up to date by QueueModel when nodes are added, removed or moved,
+    by the path templates when their directory, prefix, run number or range
+    change, and by their owners when they are replaced (PathTemplateOwner).
+    """
+
+    def __init__(self, root):
+        self.root = root
+        # node id -> node
+        self._nodes = {}
+        # id(node) -> (node, indexed path template)
+        self._node_path_templates = {}
+        # id(path template) -> [path template, key, run number, start, nodes]
+        self._entries = {}
+        # (directory, prefix) -> {run number: FileRangeIndex}
+        self._path_templates = {}
+
+        for child in root.get_children():
+            self.add_node(child)
+
+    @staticmethod
+    def _get_key(path_template):
+        return (os.path.normpath(path_template.directory), path_template.get_prefix())
+
+    def add_node(self, node):
+        """
+        Indexes the node <node> and its descendants
+        """
+        self._add_node(node)
+        for child in node.get_children():
+            self.add_node(child)
+
+    def remove_node(self, node):
+        """
+        Removes the node <node> and its descendants from the index
+        """
+        self._remove_node(node)
+        for child in node.get_children():
+            self.remove_node(child)
+
+    def _add_node(self, node):
+        self._remove_node(node)
+        self._nodes[node._node_id] = node
+
+        path_template = node.get_path_template()
+        self._node_path_templates[id(node)] = (node, path_template)
+        if path_template:
+            entry = self._entries.get(id(path_template))
+            if entry is None:
+                entry = [path_template, None, None, None, []]
+                self._entries[id(path_template)] = entry
+                self._add_path_template(entry)
+                object.__setattr__(path_template, "_index", self)
+            entry[4].append(node)
+
+    def _remove_node(self, node):
+        if self._nodes.get(node._node_id) is node:
+            del self._nodes[node._node_id]
+
+        # the path template indexed with the node, it may have been replaced
+        path_template = self._node_path_templates.pop(id(node), (None, None))[1]
+        entry = path_template and self._entries.get(id(path_template))
+        if entry and node in entry[4]:
+            entry[4].remove(node)
+            if not entry[4]:
+                self._remove_path_template(entry)
+                del self._entries[id(path_template)]
+                path_template.__dict__.pop("_index", None)
+
+    def get_node(self, _id):
+        """
+        :returns: The indexed node with the node id <_id>, None if not found
+        :rtype: TaskNode
+        """
+        node = self._nodes.get(_id)
+        if node is not None and node.get_root() is self.root:
+            return node
+        return None
+
+    def get_path_templates(self, path_template):
+        """
+        :returns: The path templates with the directory and prefix of
+                  <path_template>, on run number
+        :rtype: dict of FileRangeIndex
+        """
+        return self._path_templates.get(self._get_key(path_template), {})
+
+    def path_template_changed(self, path_template):
+        """
+        Re-indexes <path_template>, called when its directory, prefix,
+        run number or range change
+        """
+        entry = self._entries.get(id(path_template))
+        if entry is not None and entry[1] is not None:
+            self._remove_path_template(entry)
+            self._add_path_template(entry)
+
+    def path_template_replaced(self, path_template):
+        """
+        Re-indexes the nodes of <path_template>, called when another path
+        template is assigned in its place
+        """
+        entry = self._entries.get(id(path_template))
+        if entry is not None:
+            for node in list(entry[4]):
+                self._add_node(node)
+
+    def _add_path_template(self, entry):
+        path_template = entry[0]
+        entry[1] = self._get_key(path_template)
+        entry[2] = path_template.run_number
+        entry[3] = path_template.start_num
+        runs = self._path_templates.setdefault(entry[1], {})
+        if entry[2] not in runs:
+            runs[entry[2]] = queue_model_objects.FileRangeIndex()
+        runs[entry[2]].add(path_template, entry[3], path_template.num_files)
+
+    def _remove_path_template(self, entry):
+        runs = self._path_templates[entry[1]]
+        file_ranges = runs[entry[2]]
+        file_ranges.remove(entry[0], entry[3])
+        if not file_ranges:
+            del runs[entry[2]]
+            if not runs:
+                del self._path_templates[entry[1]]
+        entry[1] = entry[2] = entry[3] = None
+
+
 class QueueModel(HardwareObject):
     def __init__(self, name):
         HardwareObject.__init__(self, name)
@@ -61,6 +192,9 @@ class QueueModel(HardwareObject):
 
         self._selected_model = self._ispyb_model
 
+        # id(root node) -> QueueModelIndex
+        self._indexes = {}
+
     def __getstate__(self):
         d = dict(self.__dict__)
         return d
@@ -116,8 +250,25 @@ class QueueModel(HardwareObject):
             for name in self._models.keys():
                 self._models[name] = queue_model_objects.RootNode()
 
+        roots = list(self._models.values()) + [self._selected_model]
+        for root_id, index in list(self._indexes.items()):
+            if not any(index.root is root for root in roots):
+                del self._indexes[root_id]
+
         HWR.beamline.queue_manager.clear()
 
+    def _get_index(self, root):
+        """
+        :returns: The index of the model with the root node <root>,
+                  built on first use
+        :rtype: QueueModelIndex
+        """
+        index = self._indexes.get(id(root))
+        if index is None or index.root is not root:
+            index = QueueModelIndex(root)
+            self._indexes[id(root)] = index
+        return index
+
     def register_model(self, name, root_node):
         """
         Register a new model with name <name> and root node <root_node>.
@@ -164,6 +315,7 @@ class QueueModel(HardwareObject):
             child._node_id = self._selected_model._total_node_count
             parent._children.append(child)
             child._set_name(child._name)
+            self._get_index(parent.get_root()).add_node(child)
             self.emit("child_added", (parent, child))
         else:
             raise TypeError("Expected type TaskNode, got %s " % str(type(child)))
@@ -199,6 +351,9 @@ class QueueModel(HardwareObject):
         :rtype: TaskNode
         """
         if parent is None:
+            node = self._get_index(self._selected_model).get_node(_id)
+            if node is not None:
+                return node
             parent = self._selected_model
 
         for node in parent._children:
@@ -222,6 +377,7 @@ class QueueModel(HardwareObject):
         """
         if child in parent._children:
             parent._children.remove(child)
+            self._get_index(parent.get_root()).remove_node(child)
             self.emit("child_removed", (parent, child))
 
     def _detach_child(self, parent, child):
@@ -234,7 +390,8 @@ class QueueModel(HardwareObject):
         :returns: None
         :rtype: None
         """
-        child = parent._children.pop(child)
+        parent._children.remove(child)
+        self._get_index(parent.get_root()).remove_node(child)
         return child
 
     def set_parent(self, parent, child):
@@ -247,9 +404,14 @@ class QueueModel(HardwareObject):
         :param child: The child
         :type child: TaskNode Object
         """
-        if child._parent:
-            self._detach_child(parent, child)
-            child.set_parent(parent)
+        if child._parent and child in child._parent._children:
+            previous_parent = child._parent
+            self._detach_child(previous_parent, child)
+            self.emit("child_removed", (previous_parent, child))
+            parent._children.append(child)
+            child._parent = parent
+            self._get_index(parent.get_root()).add_node(child)
+            self.emit("child_added", (parent, child))
         else:
             child._parent = parent
 
@@ -302,17 +464,16 @@ class QueueModel(HardwareObject):
         :returns: The next available run number for the given path_template.
         :rtype: int
         """
-        all_path_templates = self.get_path_templates()
         conflicting_path_templates = [0]
+        path_templates = self._get_index(self.get_model_root()).get_path_templates(
+            new_path_template
+        )
 
-        for pt in all_path_templates:
-            if exclude_current:
-                if pt[1] is not new_path_template:
-                    if pt[1] == new_path_template:
-                        conflicting_path_templates.append(pt[1].run_number)
-            else:
-                if pt[1] == new_path_template:
-                    conflicting_path_templates.append(pt[1].run_number)
+        for run_number, run_path_templates in path_templates.items():
+            if not exclude_current or any(
+                pt is not new_path_template for pt in run_path_templates
+            ):
+                conflicting_path_templates.append(run_number)
 
         return max(conflicting_path_templates) + 1
 
@@ -348,15 +509,22 @@ class QueueModel(HardwareObject):
 
         :returns: True if there is a potential path collision.
         """
-        result = False
-        path_template_list = self.get_path_templates()
+        path_templates = self._get_index(self.get_model_root()).get_path_templates(
+            new_path_template
+        )
 
-        for pt in path_template_list:
-            if pt[1] is not new_path_template:
-                if new_path_template.intersection(pt[1]):
-                    result = True
+        file_ranges = path_templates.get(new_path_template.run_number)
+        if file_ranges is None:
+            return False
 
-        return result
+        return (
+            file_ranges.get_overlapping(
+                new_path_template.start_num,
+                new_path_template.num_files,
+                exclude=new_path_template,
+            )
+            is not None
+        )
 
     def copy_node(self, node):
         """
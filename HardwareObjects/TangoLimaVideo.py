@@ -12,6 +12,7 @@ Example configuration:
 
 If video mode is not specified, BAYER_RG16 is used by default.
 """
+import collections
 import logging
 import time
 import struct
@@ -27,29 +28,32 @@ from PyTango.gevent import DeviceProxy
 
 from HardwareRepository import BaseHardwareObjects
 
+# Header of the Lima video_last_image attribute
+VIDEO_HEADER = struct.Struct(">IHHqiiHHHH")
 
-def poll_image(lima_tango_device, video_mode, FORMATS):
-    img_data = lima_tango_device.video_last_image
+# Number of frames over which the frame rate is computed
+FRAME_RATE_WINDOW = 50
 
-    hfmt = ">IHHqiiHHHH"
-    hsize = struct.calcsize(hfmt)
-    _, _, img_mode, frame_number, width, height, _, _, _, _ = struct.unpack(
-        hfmt, img_data[1][:hsize]
-    )
 
-    raw_data = img_data[1][hsize:]
-    _from, _to = FORMATS.get(video_mode, (None, None))
+def read_image(lima_tango_device):
+    """Read the last video image of a Lima device
 
-    if _from and _to:
-        img = Image.frombuffer(_from, (height, width), raw_data, "raw", _from, 0, 1)
+    Returns:
+        (tuple): (payload, width, height, frame_number), the payload is a
+                 memoryview on the data read, without copy
+    """
+    img_data = lima_tango_device.video_last_image
+    raw_data = img_data[1]
+    _, _, img_mode, frame_number, width, height, _, _, _, _ = VIDEO_HEADER.unpack_from(
+        raw_data
+    )
+    return memoryview(raw_data)[VIDEO_HEADER.size :], width, height, frame_number
 
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format=_to)
-        img = img.tobytes()
-    else:
-        img = raw_data
 
-    return img, width, height
+def poll_image(lima_tango_device, video_mode, FORMATS):
+    # NB the former round trip through a PIL image returned the same bytes
+    data, width, height, _ = read_image(lima_tango_device)
+    return data.tobytes(), width, height
 
 
 class TangoLimaVideo(BaseHardwareObjects.Device):
@@ -62,6 +66,20 @@ class TangoLimaVideo(BaseHardwareObjects.Device):
         self.__polling = None
         self._video_mode = None
         self._last_image = (0, 0, 0)
+        self._last_frame_number = None
+        self._last_image_counter = None
+        self._has_image_counter = True
+        # image format -> (frame number, encoded image)
+        self._encoded_images = {}
+        self._encode_buffer = io.BytesIO()
+        self._frame_times = collections.deque(maxlen=FRAME_RATE_WINDOW)
+        self._statistics = {
+            "frames": 0,
+            "skipped": 0,
+            "errors": 0,
+            "total_latency": 0,
+            "max_latency": 0,
+        }
 
         # Dictionary containing conversion information for a given
         # video_mode. The camera video mode is the key and the first
@@ -110,19 +128,106 @@ class TangoLimaVideo(BaseHardwareObjects.Device):
 
         self.set_is_ready(True)
 
-    def get_last_image(self):
-        return self._last_image
+    def get_last_image(self, image_format=None):
+        """Return the last image received
+
+        Args:
+            image_format (str): PIL image format, e.g. "JPEG", None for the
+                data as received. Each frame is encoded once per format
+
+        Returns:
+            (tuple): data (bytes), width, height
+        """
+        data, width, height = self._last_image
+        if image_format is None or not width:
+            return data, width, height
+
+        frame_number, encoded = self._encoded_images.get(image_format, (None, None))
+        if frame_number != self._last_frame_number:
+            mode = self._FORMATS.get(self.video_mode, (None, None))[0]
+            if mode is None:
+                raise ValueError("Cannot convert video mode %s" % self.video_mode)
+            img = Image.frombuffer(mode, (width, height), data, "raw", mode, 0, 1)
+            self._encode_buffer.seek(0)
+            self._encode_buffer.truncate()
+            img.save(self._encode_buffer, format=image_format)
+            encoded = self._encode_buffer.getvalue()
+            self._encoded_images[image_format] = (self._last_frame_number, encoded)
+        return encoded, width, height
+
+    def get_statistics(self):
+        """Return the counters of the video polling. Latency is the time to
+        read and emit an image, in ms
+
+        Returns:
+            (dict): statistics
+        """
+        stats = dict(self._statistics)
+        total_latency = stats.pop("total_latency")
+        stats["mean_latency"] = (
+            total_latency / stats["frames"] * 1000 if stats["frames"] else 0
+        )
+        stats["max_latency"] *= 1000
+        frame_times = list(self._frame_times)
+        if len(frame_times) > 1 and frame_times[-1] > frame_times[0]:
+            stats["frame_rate"] = (len(frame_times) - 1) / (
+                frame_times[-1] - frame_times[0]
+            )
+        else:
+            stats["frame_rate"] = 0
+        return stats
+
+    def _read_new_image(self):
+        """Read the last image if it is a new frame, None otherwise
+
+        Returns:
+            (tuple): data (bytes, copied once per new frame), width, height
+        """
+        counter = None
+        if self._has_image_counter:
+            # cheap check, without reading the image
+            try:
+                counter = self.device.video_last_image_counter
+            except Exception:
+                self._has_image_counter = False
+            else:
+                if counter == self._last_image_counter:
+                    return None
+
+        data, width, height, frame_number = read_image(self.device)
+        # only once the image is read: a failed read is tried again
+        self._last_image_counter = counter
+        if frame_number == self._last_frame_number:
+            return None
+        self._last_frame_number = frame_number
+        return data.tobytes(), width, height
 
     def _do_polling(self, sleep_time):
-        lima_tango_device = self.device
-
         while True:
-            data, width, height = poll_image(
-                lima_tango_device, self.video_mode, self._FORMATS
-            )
-
-            self._last_image = data, width, height
-            self.emit("imageReceived", data, width, height, False)
+            start = time.time()
+            try:
+                image = self._read_new_image()
+            except Exception:
+                self._statistics["errors"] += 1
+                logging.getLogger("HWR").debug("%s: cannot read image", self.name())
+                image = None
+            else:
+                if image is None:
+                    self._statistics["skipped"] += 1
+
+            if image is not None:
+                data, width, height = image
+                self._last_image = image
+                self.emit("imageReceived", data, width, height, False)
+
+                now = time.time()
+                latency = now - start
+                self._frame_times.append(now)
+                self._statistics["frames"] += 1
+                self._statistics["total_latency"] += latency
+                self._statistics["max_latency"] = max(
+                    self._statistics["max_latency"], latency
+                )
             time.sleep(sleep_time)
 
     def connect_notify(self, signal):
@@ -139,9 +244,9 @@ class TangoLimaVideo(BaseHardwareObjects.Device):
         return self.device.image_height
 
     def take_snapshot(self, path=None, bw=False):
-        data, width, height = poll_image(self.device, self.video_mode, self._FORMATS)
+        data, width, height, _ = read_image(self.device)
 
-        img = Image.frombytes("RGB", (width, height), data)
+        img = Image.frombuffer("RGB", (width, height), data, "raw", "RGB", 0, 1)
 
         if bw:
             img.convert("1")
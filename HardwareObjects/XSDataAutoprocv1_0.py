@@ -5,6 +5,8 @@
 #
 
 from XSDataCommon import XSDataVectorDouble
+from XSDataCommon import parseXMLFile
+from XSDataCommon import parseXMLString
 from XSDataCommon import XSDataString
 from XSDataCommon import XSDataResult
 from XSDataCommon import XSDataInteger
@@ -14,7 +16,6 @@ from XSDataCommon import XSDataDouble
 from XSDataCommon import XSDataBoolean
 import os
 import sys
-from xml.dom import minidom
 from xml.dom import Node
 
 
@@ -67,8 +68,7 @@ else:
 
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(unicode("    "))
+    outfile.write(unicode("    " * level))
 
 
 def warnEmptyAttribute(_strName, _strTypeName):
@@ -243,7 +243,7 @@ class XSData2DCoordinates(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSData2DCoordinates")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -267,8 +267,7 @@ class XSData2DCoordinates(object):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSData2DCoordinates()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -281,8 +280,7 @@ class XSData2DCoordinates(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSData2DCoordinates()
         rootObj.build(rootNode)
         return rootObj
@@ -381,7 +379,7 @@ class XSDataRange(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataRange")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -405,8 +403,7 @@ class XSDataRange(object):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataRange()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -419,8 +416,7 @@ class XSDataRange(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataRange()
         rootObj.build(rootNode)
         return rootObj
@@ -787,7 +783,7 @@ class XSDataXdsCompletenessEntry(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXdsCompletenessEntry")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -811,8 +807,7 @@ class XSDataXdsCompletenessEntry(object):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXdsCompletenessEntry()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -825,8 +820,7 @@ class XSDataXdsCompletenessEntry(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXdsCompletenessEntry()
         rootObj.build(rootNode)
         return rootObj
@@ -926,7 +920,7 @@ class XSDataXscaleCompletenessEntry(XSDataXdsCompletenessEntry):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleCompletenessEntry")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -950,8 +944,7 @@ class XSDataXscaleCompletenessEntry(XSDataXdsCompletenessEntry):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleCompletenessEntry()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -964,8 +957,7 @@ class XSDataXscaleCompletenessEntry(XSDataXdsCompletenessEntry):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleCompletenessEntry()
         rootObj.build(rootNode)
         return rootObj
@@ -1384,7 +1376,7 @@ class XSDataAutoprocImport(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAutoprocImport")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1408,8 +1400,7 @@ class XSDataAutoprocImport(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAutoprocImport()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1422,8 +1413,7 @@ class XSDataAutoprocImport(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAutoprocImport()
         rootObj.build(rootNode)
         return rootObj
@@ -1717,7 +1707,7 @@ class XSDataAutoprocImportOut(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAutoprocImportOut")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1741,8 +1731,7 @@ class XSDataAutoprocImportOut(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAutoprocImportOut()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1755,8 +1744,7 @@ class XSDataAutoprocImportOut(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAutoprocImportOut()
         rootObj.build(rootNode)
         return rootObj
@@ -2343,7 +2331,7 @@ class XSDataAutoprocInput(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAutoprocInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2367,8 +2355,7 @@ class XSDataAutoprocInput(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAutoprocInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2381,8 +2368,7 @@ class XSDataAutoprocInput(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAutoprocInput()
         rootObj.build(rootNode)
         return rootObj
@@ -2796,7 +2782,7 @@ class XSDataFileConversion(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataFileConversion")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2820,8 +2806,7 @@ class XSDataFileConversion(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataFileConversion()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2834,8 +2819,7 @@ class XSDataFileConversion(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataFileConversion()
         rootObj.build(rootNode)
         return rootObj
@@ -3008,7 +2992,7 @@ class XSDataFileConversionOut(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataFileConversionOut")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3032,8 +3016,7 @@ class XSDataFileConversionOut(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataFileConversionOut()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3046,8 +3029,7 @@ class XSDataFileConversionOut(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataFileConversionOut()
         rootObj.build(rootNode)
         return rootObj
@@ -3255,7 +3237,7 @@ class XSDataInputControlDimple(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputControlDimple")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3279,8 +3261,7 @@ class XSDataInputControlDimple(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputControlDimple()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3293,8 +3274,7 @@ class XSDataInputControlDimple(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputControlDimple()
         rootObj.build(rootNode)
         return rootObj
@@ -3758,7 +3738,7 @@ class XSDataMinimalXdsIn(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMinimalXdsIn")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3782,8 +3762,7 @@ class XSDataMinimalXdsIn(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMinimalXdsIn()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3796,8 +3775,7 @@ class XSDataMinimalXdsIn(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMinimalXdsIn()
         rootObj.build(rootNode)
         return rootObj
@@ -3876,7 +3854,7 @@ class XSDataMinimalXdsOut(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMinimalXdsOut")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3900,8 +3878,7 @@ class XSDataMinimalXdsOut(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMinimalXdsOut()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3914,8 +3891,7 @@ class XSDataMinimalXdsOut(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMinimalXdsOut()
         rootObj.build(rootNode)
         return rootObj
@@ -4880,7 +4856,7 @@ class XSDataXdsOutput(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXdsOutput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4904,8 +4880,7 @@ class XSDataXdsOutput(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXdsOutput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4918,8 +4893,7 @@ class XSDataXdsOutput(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXdsOutput()
         rootObj.build(rootNode)
         return rootObj
@@ -5377,7 +5351,7 @@ class XSDataResCutoff(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResCutoff")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5401,8 +5375,7 @@ class XSDataResCutoff(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResCutoff()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5415,8 +5388,7 @@ class XSDataResCutoff(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResCutoff()
         rootObj.build(rootNode)
         return rootObj
@@ -5702,7 +5674,7 @@ class XSDataResCutoffResult(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResCutoffResult")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5726,8 +5698,7 @@ class XSDataResCutoffResult(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResCutoffResult()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5740,8 +5711,7 @@ class XSDataResCutoffResult(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResCutoffResult()
         rootObj.build(rootNode)
         return rootObj
@@ -5828,7 +5798,7 @@ class XSDataResultControlDimple(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultControlDimple")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5852,8 +5822,7 @@ class XSDataResultControlDimple(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultControlDimple()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5866,8 +5835,7 @@ class XSDataResultControlDimple(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultControlDimple()
         rootObj.build(rootNode)
         return rootObj
@@ -5990,7 +5958,7 @@ class XSDataXdsGenerateInput(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXdsGenerateInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6014,8 +5982,7 @@ class XSDataXdsGenerateInput(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXdsGenerateInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6028,8 +5995,7 @@ class XSDataXdsGenerateInput(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXdsGenerateInput()
         rootObj.build(rootNode)
         return rootObj
@@ -6372,7 +6338,7 @@ class XSDataXdsGenerateOutput(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXdsGenerateOutput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6396,8 +6362,7 @@ class XSDataXdsGenerateOutput(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXdsGenerateOutput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6410,8 +6375,7 @@ class XSDataXdsGenerateOutput(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXdsGenerateOutput()
         rootObj.build(rootNode)
         return rootObj
@@ -6527,7 +6491,7 @@ class XSDataXdsOutputFile(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXdsOutputFile")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6551,8 +6515,7 @@ class XSDataXdsOutputFile(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXdsOutputFile()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6565,8 +6528,7 @@ class XSDataXdsOutputFile(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXdsOutputFile()
         rootObj.build(rootNode)
         return rootObj
@@ -6719,7 +6681,7 @@ class XSDataXscaleOutput(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleOutput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6743,8 +6705,7 @@ class XSDataXscaleOutput(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleOutput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6757,8 +6718,7 @@ class XSDataXscaleOutput(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleOutput()
         rootObj.build(rootNode)
         return rootObj
@@ -6915,7 +6875,7 @@ class XSDataXscaleParsedOutput(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleParsedOutput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6939,8 +6899,7 @@ class XSDataXscaleParsedOutput(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleParsedOutput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6953,8 +6912,7 @@ class XSDataXscaleParsedOutput(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleParsedOutput()
         rootObj.build(rootNode)
         return rootObj
@@ -7546,7 +7504,7 @@ class XSDataXscaleGeneratedFiles(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleGeneratedFiles")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -7570,8 +7528,7 @@ class XSDataXscaleGeneratedFiles(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleGeneratedFiles()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -7584,8 +7541,7 @@ class XSDataXscaleGeneratedFiles(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleGeneratedFiles()
         rootObj.build(rootNode)
         return rootObj
@@ -7740,7 +7696,7 @@ class XSDataXscaleInputFile(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleInputFile")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -7764,8 +7720,7 @@ class XSDataXscaleInputFile(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleInputFile()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -7778,8 +7733,7 @@ class XSDataXscaleInputFile(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleInputFile()
         rootObj.build(rootNode)
         return rootObj
@@ -8164,7 +8118,7 @@ class XSDataXscaleInput(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -8188,8 +8142,7 @@ class XSDataXscaleInput(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -8202,8 +8155,7 @@ class XSDataXscaleInput(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleInput()
         rootObj.build(rootNode)
         return rootObj
@@ -8280,7 +8232,7 @@ class XSDataXscaleParsingInput(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataXscaleParsingInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -8304,8 +8256,7 @@ class XSDataXscaleParsingInput(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataXscaleParsingInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -8318,8 +8269,7 @@ class XSDataXscaleParsingInput(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataXscaleParsingInput()
         rootObj.build(rootNode)
         return rootObj
@@ -5,9 +5,13 @@
 #
 
 import sys
-from xml.dom import minidom
 from xml.dom import Node
 
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
+
 
 #
 # Support/utility functions.
@@ -17,13 +21,15 @@ from xml.dom import Node
 if sys.version.startswith("3"):
     unicode = str
     from io import StringIO
+    from io import BytesIO
 else:
     from StringIO import StringIO
 
+    BytesIO = StringIO
+
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(unicode("    "))
+    outfile.write(unicode("    " * level))
 
 
 def checkType(_strClassName, _strMethodName, _value, _strExpectedType):
@@ -52,6 +58,118 @@ def warnEmptyAttribute(_strName, _strTypeName):
     # 		print("Warning! Non-optional attribute %s of type %s is None!" % (_strName, _strTypeName))
 
 
+#
+# ElementTree parse backend.
+#
+# The build methods walk a subset of the DOM Node interface (childNodes,
+# nodeName, nodeType, firstChild.nodeValue, toxml). XMLElementNode provides
+# it on top of ElementTree.iterparse: the children of the root element are
+# built as soon as they are parsed, and every element is cleared once its
+# object is built, so that the whole document is never held in memory.
+#
+
+
+class XMLTextNode(object):
+    """Text content of an element"""
+
+    __slots__ = ("nodeValue",)
+
+    nodeType = Node.TEXT_NODE
+    nodeName = "#text"
+    firstChild = None
+    childNodes = ()
+
+    def __init__(self, nodeValue):
+        self.nodeValue = nodeValue
+
+    def toxml(self):
+        return self.nodeValue
+
+
+class XMLElementNode(object):
+    """ElementTree element seen as a DOM element node"""
+
+    __slots__ = ("element", "nodeName", "_events")
+
+    nodeType = Node.ELEMENT_NODE
+
+    def __init__(self, element, events=None):
+        self.element = element
+        # '{namespace}name' -> 'name'
+        self.nodeName = element.tag[element.tag.find("}") + 1 :]
+        # remaining iterparse events of the element, if still being parsed
+        self._events = events
+
+    @property
+    def childNodes(self):
+        if self._events is not None:
+            return self._iterParsedChildNodes()
+        return self._iterChildNodes()
+
+    @property
+    def firstChild(self):
+        self._parseAll()
+        if len(self.element):
+            return XMLElementNode(self.element[0])
+        if self.element.text:
+            return XMLTextNode(self.element.text)
+        return None
+
+    def toxml(self):
+        self._parseAll()
+        return ElementTree.tostring(self.element, encoding="utf-8").decode("utf-8")
+
+    def _iterChildNodes(self):
+        if len(self.element):
+            for child in self.element:
+                yield XMLElementNode(child)
+                child.clear()
+        elif self.element.text:
+            yield XMLTextNode(self.element.text)
+
+    def _iterParsedChildNodes(self):
+        events, self._events = self._events, None
+        depth = 0
+        hasChildren = False
+        for event, element in events:
+            if event == "start":
+                depth += 1
+            elif depth == 0:
+                # end of this element
+                break
+            else:
+                depth -= 1
+                if depth == 0:
+                    hasChildren = True
+                    yield XMLElementNode(element)
+                    self.element.remove(element)
+        if not hasChildren and self.element.text:
+            yield XMLTextNode(self.element.text)
+
+    def _parseAll(self):
+        if self._events is not None:
+            events, self._events = self._events, None
+            for event, element in events:
+                pass
+
+
+def parseXMLFile(_inFile):
+    """Parse an XML file (path or file object), returns its root node"""
+    events = ElementTree.iterparse(_inFile, events=("start", "end"))
+    event, rootElement = next(events)
+    return XMLElementNode(rootElement, events)
+
+
+def parseXMLString(_inString):
+    """Parse an XML string, returns its root node"""
+    if isinstance(_inString, bytes):
+        return parseXMLFile(BytesIO(_inString))
+    if bytes is str:
+        # Python 2 unicode
+        return parseXMLFile(BytesIO(_inString.encode("utf-8")))
+    return parseXMLFile(StringIO(_inString))
+
+
 class MixedContainer(object):
     # Constants for category:
     CategoryNone = 0
@@ -169,7 +287,7 @@ class XSConfiguration(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSConfiguration")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -197,8 +315,7 @@ class XSConfiguration(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSConfiguration()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -211,8 +328,7 @@ class XSConfiguration(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSConfiguration()
         rootObj.build(rootNode)
         return rootObj
@@ -251,7 +367,7 @@ class XSData(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSData")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -279,8 +395,7 @@ class XSData(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSData()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -293,8 +408,7 @@ class XSData(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSData()
         rootObj.build(rootNode)
         return rootObj
@@ -416,7 +530,7 @@ class XSDataDisplacement(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDisplacement")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -444,8 +558,7 @@ class XSDataDisplacement(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDisplacement()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -458,8 +571,7 @@ class XSDataDisplacement(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDisplacement()
         rootObj.build(rootNode)
         return rootObj
@@ -743,7 +855,7 @@ class XSDataExecutionInfo(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataExecutionInfo")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -771,8 +883,7 @@ class XSDataExecutionInfo(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataExecutionInfo()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -785,8 +896,7 @@ class XSDataExecutionInfo(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataExecutionInfo()
         rootObj.build(rootNode)
         return rootObj
@@ -878,7 +988,7 @@ class XSDataKeyValuePair(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataKeyValuePair")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -906,8 +1016,7 @@ class XSDataKeyValuePair(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataKeyValuePair()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -920,8 +1029,7 @@ class XSDataKeyValuePair(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataKeyValuePair()
         rootObj.build(rootNode)
         return rootObj
@@ -996,7 +1104,7 @@ class XSDataDictionary(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDictionary")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1024,8 +1132,7 @@ class XSDataDictionary(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDictionary()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1038,8 +1145,7 @@ class XSDataDictionary(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDictionary()
         rootObj.build(rootNode)
         return rootObj
@@ -1134,7 +1240,7 @@ class XSOptionItem(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSOptionItem")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1162,8 +1268,7 @@ class XSOptionItem(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSOptionItem()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1176,8 +1281,7 @@ class XSOptionItem(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSOptionItem()
         rootObj.build(rootNode)
         return rootObj
@@ -1251,7 +1355,7 @@ class XSOptionList(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSOptionList")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1279,8 +1383,7 @@ class XSOptionList(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSOptionList()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1293,8 +1396,7 @@ class XSOptionList(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSOptionList()
         rootObj.build(rootNode)
         return rootObj
@@ -1382,7 +1484,7 @@ class XSParamItem(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSParamItem")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1410,8 +1512,7 @@ class XSParamItem(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSParamItem()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1424,8 +1525,7 @@ class XSParamItem(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSParamItem()
         rootObj.build(rootNode)
         return rootObj
@@ -1497,7 +1597,7 @@ class XSParamList(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSParamList")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1525,8 +1625,7 @@ class XSParamList(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSParamList()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1539,8 +1638,7 @@ class XSParamList(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSParamList()
         rootObj.build(rootNode)
         return rootObj
@@ -1652,7 +1750,7 @@ class XSPluginItem(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSPluginItem")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1680,8 +1778,7 @@ class XSPluginItem(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSPluginItem()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1694,8 +1791,7 @@ class XSPluginItem(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSPluginItem()
         rootObj.build(rootNode)
         return rootObj
@@ -1769,7 +1865,7 @@ class XSPluginList(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSPluginList")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1797,8 +1893,7 @@ class XSPluginList(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSPluginList()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1811,8 +1906,7 @@ class XSPluginList(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSPluginList()
         rootObj.build(rootNode)
         return rootObj
@@ -1851,7 +1945,7 @@ class XSDataAngle(XSDataDisplacement):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAngle")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1879,8 +1973,7 @@ class XSDataAngle(XSDataDisplacement):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAngle()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1893,8 +1986,7 @@ class XSDataAngle(XSDataDisplacement):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAngle()
         rootObj.build(rootNode)
         return rootObj
@@ -2098,7 +2190,7 @@ class XSDataArray(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataArray")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2126,8 +2218,7 @@ class XSDataArray(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataArray()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2140,8 +2231,7 @@ class XSDataArray(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataArray()
         rootObj.build(rootNode)
         return rootObj
@@ -2215,7 +2305,7 @@ class XSDataBoolean(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataBoolean")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2243,8 +2333,7 @@ class XSDataBoolean(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataBoolean()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2257,8 +2346,7 @@ class XSDataBoolean(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataBoolean()
         rootObj.build(rootNode)
         return rootObj
@@ -2329,7 +2417,7 @@ class XSDataDouble(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDouble")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2357,8 +2445,7 @@ class XSDataDouble(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDouble()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2371,8 +2458,7 @@ class XSDataDouble(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDouble()
         rootObj.build(rootNode)
         return rootObj
@@ -2436,7 +2522,7 @@ class XSDataFile(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataFile")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2464,8 +2550,7 @@ class XSDataFile(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataFile()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2478,8 +2563,7 @@ class XSDataFile(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataFile()
         rootObj.build(rootNode)
         return rootObj
@@ -2550,7 +2634,7 @@ class XSDataFloat(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataFloat")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2578,8 +2662,7 @@ class XSDataFloat(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataFloat()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2592,8 +2675,7 @@ class XSDataFloat(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataFloat()
         rootObj.build(rootNode)
         return rootObj
@@ -2665,7 +2747,7 @@ class XSDataInput(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2693,8 +2775,7 @@ class XSDataInput(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2707,8 +2788,7 @@ class XSDataInput(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInput()
         rootObj.build(rootNode)
         return rootObj
@@ -2777,7 +2857,7 @@ class XSDataInteger(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInteger")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2805,8 +2885,7 @@ class XSDataInteger(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInteger()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2819,8 +2898,7 @@ class XSDataInteger(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInteger()
         rootObj.build(rootNode)
         return rootObj
@@ -2859,7 +2937,7 @@ class XSDataLinearDisplacement(XSDataDisplacement):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataLinearDisplacement")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2887,8 +2965,7 @@ class XSDataLinearDisplacement(XSDataDisplacement):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataLinearDisplacement()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2901,8 +2978,7 @@ class XSDataLinearDisplacement(XSDataDisplacement):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataLinearDisplacement()
         rootObj.build(rootNode)
         return rootObj
@@ -3242,7 +3318,7 @@ class XSDataMatrixDouble(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMatrixDouble")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3270,8 +3346,7 @@ class XSDataMatrixDouble(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMatrixDouble()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3284,8 +3359,7 @@ class XSDataMatrixDouble(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMatrixDouble()
         rootObj.build(rootNode)
         return rootObj
@@ -3607,7 +3681,7 @@ class XSDataMatrixInteger(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMatrixInteger")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3635,8 +3709,7 @@ class XSDataMatrixInteger(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMatrixInteger()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3649,8 +3722,7 @@ class XSDataMatrixInteger(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMatrixInteger()
         rootObj.build(rootNode)
         return rootObj
@@ -3717,7 +3789,7 @@ class XSDataString(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataString")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3745,8 +3817,7 @@ class XSDataString(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataString()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3759,8 +3830,7 @@ class XSDataString(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataString()
         rootObj.build(rootNode)
         return rootObj
@@ -3899,7 +3969,7 @@ class XSDataMessage(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMessage")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -3927,8 +3997,7 @@ class XSDataMessage(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMessage()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -3941,8 +4010,7 @@ class XSDataMessage(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMessage()
         rootObj.build(rootNode)
         return rootObj
@@ -4101,7 +4169,7 @@ class XSDataStatus(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataStatus")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4129,8 +4197,7 @@ class XSDataStatus(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatus()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4143,8 +4210,7 @@ class XSDataStatus(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatus()
         rootObj.build(rootNode)
         return rootObj
@@ -4206,7 +4272,7 @@ class XSDataResult(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResult")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4234,8 +4300,7 @@ class XSDataResult(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResult()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4248,8 +4313,7 @@ class XSDataResult(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResult()
         rootObj.build(rootNode)
         return rootObj
@@ -4410,7 +4474,7 @@ class XSDataRotation(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataRotation")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4438,8 +4502,7 @@ class XSDataRotation(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataRotation()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4452,8 +4515,7 @@ class XSDataRotation(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataRotation()
         rootObj.build(rootNode)
         return rootObj
@@ -4563,7 +4625,7 @@ class XSDataSize(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSize")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4591,8 +4653,7 @@ class XSDataSize(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSize()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4605,8 +4666,7 @@ class XSDataSize(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSize()
         rootObj.build(rootNode)
         return rootObj
@@ -4878,7 +4938,7 @@ class XSDataSysteminfo(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSysteminfo")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4906,8 +4966,7 @@ class XSDataSysteminfo(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSysteminfo()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4920,8 +4979,7 @@ class XSDataSysteminfo(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSysteminfo()
         rootObj.build(rootNode)
         return rootObj
@@ -5058,7 +5116,7 @@ class XSDataVectorDouble(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataVectorDouble")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5086,8 +5144,7 @@ class XSDataVectorDouble(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataVectorDouble()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5100,8 +5157,7 @@ class XSDataVectorDouble(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataVectorDouble()
         rootObj.build(rootNode)
         return rootObj
@@ -5232,7 +5288,7 @@ class XSDataVectorInteger(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataVectorInteger")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5260,8 +5316,7 @@ class XSDataVectorInteger(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataVectorInteger()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5274,8 +5329,7 @@ class XSDataVectorInteger(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataVectorInteger()
         rootObj.build(rootNode)
         return rootObj
@@ -5316,7 +5370,7 @@ class XSDataDate(XSDataString):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDate")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5344,8 +5398,7 @@ class XSDataDate(XSDataString):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDate()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5358,8 +5411,7 @@ class XSDataDate(XSDataString):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDate()
         rootObj.build(rootNode)
         return rootObj
@@ -5450,7 +5502,7 @@ class XSDataDoubleWithUnit(XSDataDouble):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDoubleWithUnit")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5478,8 +5530,7 @@ class XSDataDoubleWithUnit(XSDataDouble):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDoubleWithUnit()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5492,8 +5543,7 @@ class XSDataDoubleWithUnit(XSDataDouble):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDoubleWithUnit()
         rootObj.build(rootNode)
         return rootObj
@@ -5576,7 +5626,7 @@ class XSDataImage(XSDataFile):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataImage")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5604,8 +5654,7 @@ class XSDataImage(XSDataFile):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataImage()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5618,8 +5667,7 @@ class XSDataImage(XSDataFile):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataImage()
         rootObj.build(rootNode)
         return rootObj
@@ -5671,7 +5719,7 @@ class XSDataMatrix(XSDataMatrixDouble):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMatrix")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5699,8 +5747,7 @@ class XSDataMatrix(XSDataMatrixDouble):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMatrix()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5713,8 +5760,7 @@ class XSDataMatrix(XSDataMatrixDouble):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMatrix()
         rootObj.build(rootNode)
         return rootObj
@@ -5756,7 +5802,7 @@ class XSDataUnitVector(XSDataVectorDouble):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataUnitVector")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5784,8 +5830,7 @@ class XSDataUnitVector(XSDataVectorDouble):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataUnitVector()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5798,8 +5843,7 @@ class XSDataUnitVector(XSDataVectorDouble):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataUnitVector()
         rootObj.build(rootNode)
         return rootObj
@@ -5840,7 +5884,7 @@ class XSDataAbsorbedDoseRate(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAbsorbedDoseRate")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5868,8 +5912,7 @@ class XSDataAbsorbedDoseRate(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAbsorbedDoseRate()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5882,8 +5925,7 @@ class XSDataAbsorbedDoseRate(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAbsorbedDoseRate()
         rootObj.build(rootNode)
         return rootObj
@@ -5924,7 +5966,7 @@ class XSDataAngularSpeed(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAngularSpeed")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5952,8 +5994,7 @@ class XSDataAngularSpeed(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAngularSpeed()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5966,8 +6007,7 @@ class XSDataAngularSpeed(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAngularSpeed()
         rootObj.build(rootNode)
         return rootObj
@@ -6008,7 +6048,7 @@ class XSDataFlux(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataFlux")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6036,8 +6076,7 @@ class XSDataFlux(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataFlux()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6050,8 +6089,7 @@ class XSDataFlux(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataFlux()
         rootObj.build(rootNode)
         return rootObj
@@ -6092,7 +6130,7 @@ class XSDataLength(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataLength")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6120,8 +6158,7 @@ class XSDataLength(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataLength()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6134,8 +6171,7 @@ class XSDataLength(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataLength()
         rootObj.build(rootNode)
         return rootObj
@@ -6176,7 +6212,7 @@ class XSDataSpeed(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSpeed")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6204,8 +6240,7 @@ class XSDataSpeed(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSpeed()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6218,8 +6253,7 @@ class XSDataSpeed(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSpeed()
         rootObj.build(rootNode)
         return rootObj
@@ -6260,7 +6294,7 @@ class XSDataTime(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataTime")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6288,8 +6322,7 @@ class XSDataTime(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataTime()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6302,8 +6335,7 @@ class XSDataTime(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataTime()
         rootObj.build(rootNode)
         return rootObj
@@ -6344,7 +6376,7 @@ class XSDataWavelength(XSDataDoubleWithUnit):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataWavelength")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6372,8 +6404,7 @@ class XSDataWavelength(XSDataDoubleWithUnit):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataWavelength()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6386,8 +6417,7 @@ class XSDataWavelength(XSDataDoubleWithUnit):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataWavelength()
         rootObj.build(rootNode)
         return rootObj
@@ -5,6 +5,8 @@
 #
 
 from XSDataCommon import XSDataString
+from XSDataCommon import parseXMLFile
+from XSDataCommon import parseXMLString
 from XSDataCommon import XSDataResult
 from XSDataCommon import XSDataInteger
 from XSDataCommon import XSDataInput
@@ -13,7 +15,6 @@ from XSDataCommon import XSDataDouble
 from XSDataCommon import XSDataBoolean
 import os
 import sys
-from xml.dom import minidom
 from xml.dom import Node
 
 
@@ -64,8 +65,7 @@ else:
 
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(unicode("    "))
+    outfile.write(unicode("    " * level))
 
 
 def warnEmptyAttribute(_strName, _strTypeName):
@@ -647,7 +647,7 @@ class XSDataControlImageDozor(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataControlImageDozor")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -671,8 +671,7 @@ class XSDataControlImageDozor(object):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataControlImageDozor()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -685,8 +684,7 @@ class XSDataControlImageDozor(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataControlImageDozor()
         rootObj.build(rootNode)
         return rootObj
@@ -1239,7 +1237,7 @@ class XSDataInputControlDozor(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputControlDozor")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1263,8 +1261,7 @@ class XSDataInputControlDozor(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputControlDozor()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1277,8 +1274,7 @@ class XSDataInputControlDozor(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputControlDozor()
         rootObj.build(rootNode)
         return rootObj
@@ -1386,7 +1382,7 @@ class XSDataResultControlDozor(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultControlDozor")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1410,8 +1406,7 @@ class XSDataResultControlDozor(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultControlDozor()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1424,8 +1419,7 @@ class XSDataResultControlDozor(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultControlDozor()
         rootObj.build(rootNode)
         return rootObj
@@ -11,6 +11,8 @@ from XSDataMXv1 import XSDataExperimentalCondition
 from XSDataMXv1 import XSDataDiffractionPlan
 from XSDataMXv1 import XSDataCollectionPlan
 from XSDataCommon import XSDataString
+from XSDataCommon import parseXMLFile
+from XSDataCommon import parseXMLString
 from XSDataCommon import XSDataResult
 from XSDataCommon import XSDataInteger
 from XSDataCommon import XSDataInput
@@ -19,7 +21,6 @@ from XSDataCommon import XSDataDictionary
 from XSDataCommon import XSData
 import os
 import sys
-from xml.dom import minidom
 from xml.dom import Node
 
 
@@ -82,8 +83,7 @@ else:
 
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(unicode("    "))
+    outfile.write(unicode("    " * level))
 
 
 def checkType(_strClassName, _strMethodName, _value, _strExpectedType):
@@ -247,7 +247,7 @@ class XSDataMXCuBEDataSet(object):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMXCuBEDataSet")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -275,8 +275,7 @@ class XSDataMXCuBEDataSet(object):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMXCuBEDataSet()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -289,8 +288,7 @@ class XSDataMXCuBEDataSet(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMXCuBEDataSet()
         rootObj.build(rootNode)
         return rootObj
@@ -1913,7 +1911,7 @@ class XSDataMXCuBEParameters(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataMXCuBEParameters")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1941,8 +1939,7 @@ class XSDataMXCuBEParameters(XSData):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMXCuBEParameters()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1955,8 +1952,7 @@ class XSDataMXCuBEParameters(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMXCuBEParameters()
         rootObj.build(rootNode)
         return rootObj
@@ -2258,7 +2254,7 @@ class XSDataInputMXCuBE(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputMXCuBE")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2286,8 +2282,7 @@ class XSDataInputMXCuBE(XSDataInput):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputMXCuBE()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2300,8 +2295,7 @@ class XSDataInputMXCuBE(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputMXCuBE()
         rootObj.build(rootNode)
         return rootObj
@@ -2609,7 +2603,7 @@ class XSDataResultMXCuBE(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultMXCuBE")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2637,8 +2631,7 @@ class XSDataResultMXCuBE(XSDataResult):
     # Static method for parsing a string
 
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultMXCuBE()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2651,8 +2644,7 @@ class XSDataResultMXCuBE(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultMXCuBE()
         rootObj.build(rootNode)
         return rootObj
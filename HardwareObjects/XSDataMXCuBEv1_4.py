@@ -5,7 +5,6 @@
 #
 
 import os, sys
-from xml.dom import minidom
 from xml.dom import Node
 
 
@@ -52,6 +51,8 @@ except ImportError as error:
     else:
         raise error
 from XSDataCommon import XSData
+from XSDataCommon import parseXMLFile
+from XSDataCommon import parseXMLString
 from XSDataCommon import XSDataDictionary
 from XSDataCommon import XSDataFile
 from XSDataCommon import XSDataInput
@@ -81,8 +82,7 @@ else:
 
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(unicode('    '))
+    outfile.write(unicode('    ' * level))
 
 
 def warnEmptyAttribute(_strName, _strTypeName):
@@ -230,8 +230,7 @@ class XSDataMXCuBEDataSet(object):
         return XSDataMXCuBEDataSet.parseString(self.marshal())
     #Static method for parsing a string
     def parseString( _inString ):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMXCuBEDataSet()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -242,8 +241,7 @@ class XSDataMXCuBEDataSet(object):
     parseString = staticmethod( parseString )
     #Static method for parsing a file
     def parseFile( _inFilePath ):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMXCuBEDataSet()
         rootObj.build(rootNode)
         return rootObj
@@ -1297,8 +1295,7 @@ class XSDataMXCuBEParameters(XSData):
         return XSDataMXCuBEParameters.parseString(self.marshal())
     #Static method for parsing a string
     def parseString( _inString ):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataMXCuBEParameters()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1309,8 +1306,7 @@ class XSDataMXCuBEParameters(XSData):
     parseString = staticmethod( parseString )
     #Static method for parsing a file
     def parseFile( _inFilePath ):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataMXCuBEParameters()
         rootObj.build(rootNode)
         return rootObj
@@ -1613,8 +1609,7 @@ class XSDataInputMXCuBE(XSDataInput):
         return XSDataInputMXCuBE.parseString(self.marshal())
     #Static method for parsing a string
     def parseString( _inString ):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputMXCuBE()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1625,8 +1620,7 @@ class XSDataInputMXCuBE(XSDataInput):
     parseString = staticmethod( parseString )
     #Static method for parsing a file
     def parseFile( _inFilePath ):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputMXCuBE()
         rootObj.build(rootNode)
         return rootObj
@@ -1877,8 +1871,7 @@ class XSDataResultMXCuBE(XSDataResult):
         return XSDataResultMXCuBE.parseString(self.marshal())
     #Static method for parsing a string
     def parseString( _inString ):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultMXCuBE()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1889,8 +1882,7 @@ class XSDataResultMXCuBE(XSDataResult):
     parseString = staticmethod( parseString )
     #Static method for parsing a file
     def parseFile( _inFilePath ):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultMXCuBE()
         rootObj.build(rootNode)
         return rootObj
@@ -5,6 +5,8 @@
 #
 
 from XSDataCommon import XSDataAngle
+from XSDataCommon import parseXMLFile
+from XSDataCommon import parseXMLString
 from XSDataCommon import XSDataWavelength
 from XSDataCommon import XSDataTime
 from XSDataCommon import XSDataLength
@@ -26,7 +28,6 @@ from XSDataCommon import XSDataBoolean
 from XSDataCommon import XSData
 import os
 import sys
-from xml.dom import minidom
 from xml.dom import Node
 
 
@@ -103,8 +104,7 @@ else:
 
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(unicode("    "))
+    outfile.write(unicode("    " * level))
 
 
 def warnEmptyAttribute(_strName, _strTypeName):
@@ -396,7 +396,7 @@ class XSDataStatisticsIntegrationAverageAndNumberOfReflections(object):
             0,
             name_="XSDataStatisticsIntegrationAverageAndNumberOfReflections",
         )
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -424,8 +424,7 @@ class XSDataStatisticsIntegrationAverageAndNumberOfReflections(object):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatisticsIntegrationAverageAndNumberOfReflections()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -442,8 +441,7 @@ class XSDataStatisticsIntegrationAverageAndNumberOfReflections(object):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatisticsIntegrationAverageAndNumberOfReflections()
         rootObj.build(rootNode)
         return rootObj
@@ -601,7 +599,7 @@ class XSDataAtom(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAtom")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -625,8 +623,7 @@ class XSDataAtom(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAtom()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -639,8 +636,7 @@ class XSDataAtom(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAtom()
         rootObj.build(rootNode)
         return rootObj
@@ -748,7 +744,7 @@ class XSDataAtomicComposition(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataAtomicComposition")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -772,8 +768,7 @@ class XSDataAtomicComposition(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataAtomicComposition()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -786,8 +781,7 @@ class XSDataAtomicComposition(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataAtomicComposition()
         rootObj.build(rootNode)
         return rootObj
@@ -1079,7 +1073,7 @@ class XSDataBeam(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataBeam")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1103,8 +1097,7 @@ class XSDataBeam(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataBeam()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1117,8 +1110,7 @@ class XSDataBeam(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataBeam()
         rootObj.build(rootNode)
         return rootObj
@@ -1406,7 +1398,7 @@ class XSDataCell(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataCell")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1430,8 +1422,7 @@ class XSDataCell(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataCell()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1444,8 +1435,7 @@ class XSDataCell(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataCell()
         rootObj.build(rootNode)
         return rootObj
@@ -1655,7 +1645,7 @@ class XSDataChain(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataChain")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1679,8 +1669,7 @@ class XSDataChain(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataChain()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1693,8 +1682,7 @@ class XSDataChain(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataChain()
         rootObj.build(rootNode)
         return rootObj
@@ -1814,7 +1802,7 @@ class XSDataChemicalCompositionMM(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataChemicalCompositionMM")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -1838,8 +1826,7 @@ class XSDataChemicalCompositionMM(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataChemicalCompositionMM()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -1852,8 +1839,7 @@ class XSDataChemicalCompositionMM(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataChemicalCompositionMM()
         rootObj.build(rootNode)
         return rootObj
@@ -2044,7 +2030,7 @@ class XSDataCollection(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataCollection")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2068,8 +2054,7 @@ class XSDataCollection(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataCollection()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2082,8 +2067,7 @@ class XSDataCollection(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataCollection()
         rootObj.build(rootNode)
         return rootObj
@@ -2837,7 +2821,7 @@ class XSDataDetector(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDetector")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -2861,8 +2845,7 @@ class XSDataDetector(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDetector()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -2875,8 +2858,7 @@ class XSDataDetector(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDetector()
         rootObj.build(rootNode)
         return rootObj
@@ -4006,7 +3988,7 @@ class XSDataDiffractionPlan(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataDiffractionPlan")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4030,8 +4012,7 @@ class XSDataDiffractionPlan(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataDiffractionPlan()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4044,8 +4025,7 @@ class XSDataDiffractionPlan(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataDiffractionPlan()
         rootObj.build(rootNode)
         return rootObj
@@ -4438,7 +4418,7 @@ class XSDataGoniostat(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataGoniostat")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4462,8 +4442,7 @@ class XSDataGoniostat(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataGoniostat()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4476,8 +4455,7 @@ class XSDataGoniostat(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataGoniostat()
         rootObj.build(rootNode)
         return rootObj
@@ -4630,7 +4608,7 @@ class XSDataExperimentalCondition(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataExperimentalCondition")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -4654,8 +4632,7 @@ class XSDataExperimentalCondition(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataExperimentalCondition()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -4668,8 +4645,7 @@ class XSDataExperimentalCondition(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataExperimentalCondition()
         rootObj.build(rootNode)
         return rootObj
@@ -5501,7 +5477,7 @@ class XSDataImageQualityIndicators(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataImageQualityIndicators")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5525,8 +5501,7 @@ class XSDataImageQualityIndicators(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataImageQualityIndicators()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5539,8 +5514,7 @@ class XSDataImageQualityIndicators(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataImageQualityIndicators()
         rootObj.build(rootNode)
         return rootObj
@@ -5695,7 +5669,7 @@ class XSDataIndexingSolution(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIndexingSolution")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -5719,8 +5693,7 @@ class XSDataIndexingSolution(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIndexingSolution()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -5733,8 +5706,7 @@ class XSDataIndexingSolution(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIndexingSolution()
         rootObj.build(rootNode)
         return rootObj
@@ -6217,7 +6189,7 @@ class XSDataIntegrationSubWedgeResult(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIntegrationSubWedgeResult")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6241,8 +6213,7 @@ class XSDataIntegrationSubWedgeResult(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIntegrationSubWedgeResult()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6255,8 +6226,7 @@ class XSDataIntegrationSubWedgeResult(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIntegrationSubWedgeResult()
         rootObj.build(rootNode)
         return rootObj
@@ -6425,7 +6395,7 @@ class XSDataLigand(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataLigand")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6449,8 +6419,7 @@ class XSDataLigand(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataLigand()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6463,8 +6432,7 @@ class XSDataLigand(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataLigand()
         rootObj.build(rootNode)
         return rootObj
@@ -6580,7 +6548,7 @@ class XSDataOrientation(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataOrientation")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -6604,8 +6572,7 @@ class XSDataOrientation(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataOrientation()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -6618,8 +6585,7 @@ class XSDataOrientation(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataOrientation()
         rootObj.build(rootNode)
         return rootObj
@@ -7214,7 +7180,7 @@ class XSDataResolutionBin(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResolutionBin")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -7238,8 +7204,7 @@ class XSDataResolutionBin(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResolutionBin()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -7252,8 +7217,7 @@ class XSDataResolutionBin(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResolutionBin()
         rootObj.build(rootNode)
         return rootObj
@@ -7557,7 +7521,7 @@ class XSDataSample(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSample")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -7581,8 +7545,7 @@ class XSDataSample(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSample()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -7595,8 +7558,7 @@ class XSDataSample(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSample()
         rootObj.build(rootNode)
         return rootObj
@@ -7675,7 +7637,7 @@ class XSDataSolvent(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSolvent")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -7699,8 +7661,7 @@ class XSDataSolvent(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSolvent()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -7713,8 +7674,7 @@ class XSDataSolvent(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSolvent()
         rootObj.build(rootNode)
         return rootObj
@@ -7830,7 +7790,7 @@ class XSDataSpaceGroup(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSpaceGroup")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -7854,8 +7814,7 @@ class XSDataSpaceGroup(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSpaceGroup()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -7868,8 +7827,7 @@ class XSDataSpaceGroup(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSpaceGroup()
         rootObj.build(rootNode)
         return rootObj
@@ -8182,7 +8140,7 @@ class XSDataStatisticsIndexing(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataStatisticsIndexing")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -8206,8 +8164,7 @@ class XSDataStatisticsIndexing(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatisticsIndexing()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -8220,8 +8177,7 @@ class XSDataStatisticsIndexing(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatisticsIndexing()
         rootObj.build(rootNode)
         return rootObj
@@ -8701,7 +8657,7 @@ class XSDataStatisticsIntegration(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataStatisticsIntegration")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -8725,8 +8681,7 @@ class XSDataStatisticsIntegration(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatisticsIntegration()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -8739,8 +8694,7 @@ class XSDataStatisticsIntegration(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatisticsIntegration()
         rootObj.build(rootNode)
         return rootObj
@@ -8884,7 +8838,7 @@ class XSDataStatisticsIntegrationPerReflectionType(XSData):
         self.export(
             oStreamString, 0, name_="XSDataStatisticsIntegrationPerReflectionType"
         )
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -8908,8 +8862,7 @@ class XSDataStatisticsIntegrationPerReflectionType(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatisticsIntegrationPerReflectionType()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -8924,8 +8877,7 @@ class XSDataStatisticsIntegrationPerReflectionType(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatisticsIntegrationPerReflectionType()
         rootObj.build(rootNode)
         return rootObj
@@ -9160,7 +9112,7 @@ class XSDataStatisticsIntegrationPerResolutionBin(XSData):
         self.export(
             oStreamString, 0, name_="XSDataStatisticsIntegrationPerResolutionBin"
         )
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -9184,8 +9136,7 @@ class XSDataStatisticsIntegrationPerResolutionBin(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatisticsIntegrationPerResolutionBin()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -9200,8 +9151,7 @@ class XSDataStatisticsIntegrationPerResolutionBin(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatisticsIntegrationPerResolutionBin()
         rootObj.build(rootNode)
         return rootObj
@@ -9312,7 +9262,7 @@ class XSDataStatisticsStrategy(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataStatisticsStrategy")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -9336,8 +9286,7 @@ class XSDataStatisticsStrategy(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStatisticsStrategy()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -9350,8 +9299,7 @@ class XSDataStatisticsStrategy(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStatisticsStrategy()
         rootObj.build(rootNode)
         return rootObj
@@ -9786,7 +9734,7 @@ class XSDataStrategySummary(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataStrategySummary")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -9810,8 +9758,7 @@ class XSDataStrategySummary(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStrategySummary()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -9824,8 +9771,7 @@ class XSDataStrategySummary(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStrategySummary()
         rootObj.build(rootNode)
         return rootObj
@@ -10084,7 +10030,7 @@ class XSDataCollectionPlan(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataCollectionPlan")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -10108,8 +10054,7 @@ class XSDataCollectionPlan(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataCollectionPlan()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -10122,8 +10067,7 @@ class XSDataCollectionPlan(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataCollectionPlan()
         rootObj.build(rootNode)
         return rootObj
@@ -10282,7 +10226,7 @@ class XSDataCrystal(XSData):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataCrystal")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -10306,8 +10250,7 @@ class XSDataCrystal(XSData):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataCrystal()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -10320,8 +10263,7 @@ class XSDataCrystal(XSData):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataCrystal()
         rootObj.build(rootNode)
         return rootObj
@@ -10543,7 +10485,7 @@ This structure is also defined by its number in the asymmetric unit."""
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataStructure")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -10567,8 +10509,7 @@ This structure is also defined by its number in the asymmetric unit."""
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataStructure()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -10581,8 +10522,7 @@ This structure is also defined by its number in the asymmetric unit."""
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataStructure()
         rootObj.build(rootNode)
         return rootObj
@@ -10819,7 +10759,7 @@ The subWedgeNumber is an optional number for relating different subwedges, espec
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSubWedge")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -10843,8 +10783,7 @@ The subWedgeNumber is an optional number for relating different subwedges, espec
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSubWedge()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -10857,8 +10796,7 @@ The subWedgeNumber is an optional number for relating different subwedges, espec
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSubWedge()
         rootObj.build(rootNode)
         return rootObj
@@ -11001,7 +10939,7 @@ class XSDataGeneratePredictionInput(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataGeneratePredictionInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -11025,8 +10963,7 @@ class XSDataGeneratePredictionInput(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataGeneratePredictionInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -11039,8 +10976,7 @@ class XSDataGeneratePredictionInput(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataGeneratePredictionInput()
         rootObj.build(rootNode)
         return rootObj
@@ -11151,7 +11087,7 @@ class XSDataGeneratePredictionResult(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataGeneratePredictionResult")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -11175,8 +11111,7 @@ class XSDataGeneratePredictionResult(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataGeneratePredictionResult()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -11189,8 +11124,7 @@ class XSDataGeneratePredictionResult(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataGeneratePredictionResult()
         rootObj.build(rootNode)
         return rootObj
@@ -11362,7 +11296,7 @@ class XSDataIndexingInput(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIndexingInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -11386,8 +11320,7 @@ class XSDataIndexingInput(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIndexingInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -11400,8 +11333,7 @@ class XSDataIndexingInput(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIndexingInput()
         rootObj.build(rootNode)
         return rootObj
@@ -11631,7 +11563,7 @@ class XSDataIndexingSolutionSelected(XSDataIndexingSolution):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIndexingSolutionSelected")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -11655,8 +11587,7 @@ class XSDataIndexingSolutionSelected(XSDataIndexingSolution):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIndexingSolutionSelected()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -11669,8 +11600,7 @@ class XSDataIndexingSolutionSelected(XSDataIndexingSolution):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIndexingSolutionSelected()
         rootObj.build(rootNode)
         return rootObj
@@ -12029,7 +11959,7 @@ class XSDataIndexingResult(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIndexingResult")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12053,8 +11983,7 @@ class XSDataIndexingResult(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIndexingResult()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12067,8 +11996,7 @@ class XSDataIndexingResult(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIndexingResult()
         rootObj.build(rootNode)
         return rootObj
@@ -12150,7 +12078,7 @@ class XSDataInputCharacterisation(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputCharacterisation")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12174,8 +12102,7 @@ class XSDataInputCharacterisation(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputCharacterisation()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12188,8 +12115,7 @@ class XSDataInputCharacterisation(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputCharacterisation()
         rootObj.build(rootNode)
         return rootObj
@@ -12403,7 +12329,7 @@ class XSDataInputControlISPyB(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputControlISPyB")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12427,8 +12353,7 @@ class XSDataInputControlISPyB(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputControlISPyB()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12441,8 +12366,7 @@ class XSDataInputControlISPyB(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputControlISPyB()
         rootObj.build(rootNode)
         return rootObj
@@ -12550,7 +12474,7 @@ class XSDataInputControlImageQualityIndicators(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputControlImageQualityIndicators")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12574,8 +12498,7 @@ class XSDataInputControlImageQualityIndicators(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputControlImageQualityIndicators()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12590,8 +12513,7 @@ class XSDataInputControlImageQualityIndicators(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputControlImageQualityIndicators()
         rootObj.build(rootNode)
         return rootObj
@@ -12679,7 +12601,7 @@ class XSDataInputControlXDSGenerateBackgroundImage(XSDataInput):
         self.export(
             oStreamString, 0, name_="XSDataInputControlXDSGenerateBackgroundImage"
         )
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12703,8 +12625,7 @@ class XSDataInputControlXDSGenerateBackgroundImage(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputControlXDSGenerateBackgroundImage()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12719,8 +12640,7 @@ class XSDataInputControlXDSGenerateBackgroundImage(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputControlXDSGenerateBackgroundImage()
         rootObj.build(rootNode)
         return rootObj
@@ -12813,7 +12733,7 @@ class XSDataInputInducedRadiationProcess(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputInducedRadiationProcess")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12837,8 +12757,7 @@ class XSDataInputInducedRadiationProcess(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputInducedRadiationProcess()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12851,8 +12770,7 @@ class XSDataInputInducedRadiationProcess(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputInducedRadiationProcess()
         rootObj.build(rootNode)
         return rootObj
@@ -12931,7 +12849,7 @@ class XSDataInputReadImageHeader(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputReadImageHeader")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -12955,8 +12873,7 @@ class XSDataInputReadImageHeader(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputReadImageHeader()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -12969,8 +12886,7 @@ class XSDataInputReadImageHeader(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputReadImageHeader()
         rootObj.build(rootNode)
         return rootObj
@@ -13400,7 +13316,7 @@ class XSDataInputStrategy(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputStrategy")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -13424,8 +13340,7 @@ class XSDataInputStrategy(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputStrategy()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -13438,8 +13353,7 @@ class XSDataInputStrategy(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputStrategy()
         rootObj.build(rootNode)
         return rootObj
@@ -13551,7 +13465,7 @@ class XSDataInputSubWedgeAssemble(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputSubWedgeAssemble")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -13575,8 +13489,7 @@ class XSDataInputSubWedgeAssemble(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputSubWedgeAssemble()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -13589,8 +13502,7 @@ class XSDataInputSubWedgeAssemble(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputSubWedgeAssemble()
         rootObj.build(rootNode)
         return rootObj
@@ -13698,7 +13610,7 @@ class XSDataInputSubWedgeMerge(XSDataInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataInputSubWedgeMerge")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -13722,8 +13634,7 @@ class XSDataInputSubWedgeMerge(XSDataInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataInputSubWedgeMerge()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -13736,8 +13647,7 @@ class XSDataInputSubWedgeMerge(XSDataInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataInputSubWedgeMerge()
         rootObj.build(rootNode)
         return rootObj
@@ -13851,7 +13761,7 @@ class XSDataIntegrationResult(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIntegrationResult")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -13875,8 +13785,7 @@ class XSDataIntegrationResult(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIntegrationResult()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -13889,8 +13798,7 @@ class XSDataIntegrationResult(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIntegrationResult()
         rootObj.build(rootNode)
         return rootObj
@@ -14357,7 +14265,7 @@ class XSDataResultCharacterisation(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultCharacterisation")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -14381,8 +14289,7 @@ class XSDataResultCharacterisation(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultCharacterisation()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -14395,8 +14302,7 @@ class XSDataResultCharacterisation(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultCharacterisation()
         rootObj.build(rootNode)
         return rootObj
@@ -14475,7 +14381,7 @@ class XSDataResultControlISPyB(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultControlISPyB")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -14499,8 +14405,7 @@ class XSDataResultControlISPyB(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultControlISPyB()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -14513,8 +14418,7 @@ class XSDataResultControlISPyB(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultControlISPyB()
         rootObj.build(rootNode)
         return rootObj
@@ -14630,7 +14534,7 @@ class XSDataResultControlImageQualityIndicators(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultControlImageQualityIndicators")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -14654,8 +14558,7 @@ class XSDataResultControlImageQualityIndicators(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultControlImageQualityIndicators()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -14670,8 +14573,7 @@ class XSDataResultControlImageQualityIndicators(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultControlImageQualityIndicators()
         rootObj.build(rootNode)
         return rootObj
@@ -14759,7 +14661,7 @@ class XSDataResultControlXDSGenerateBackgroundImage(XSDataResult):
         self.export(
             oStreamString, 0, name_="XSDataResultControlXDSGenerateBackgroundImage"
         )
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -14783,8 +14685,7 @@ class XSDataResultControlXDSGenerateBackgroundImage(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultControlXDSGenerateBackgroundImage()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -14799,8 +14700,7 @@ class XSDataResultControlXDSGenerateBackgroundImage(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultControlXDSGenerateBackgroundImage()
         rootObj.build(rootNode)
         return rootObj
@@ -14957,7 +14857,7 @@ class XSDataResultInducedRadiationProcess(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultInducedRadiationProcess")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -14981,8 +14881,7 @@ class XSDataResultInducedRadiationProcess(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultInducedRadiationProcess()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -14995,8 +14894,7 @@ class XSDataResultInducedRadiationProcess(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultInducedRadiationProcess()
         rootObj.build(rootNode)
         return rootObj
@@ -15075,7 +14973,7 @@ class XSDataResultReadImageHeader(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultReadImageHeader")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -15099,8 +14997,7 @@ class XSDataResultReadImageHeader(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultReadImageHeader()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -15113,8 +15010,7 @@ class XSDataResultReadImageHeader(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultReadImageHeader()
         rootObj.build(rootNode)
         return rootObj
@@ -15424,7 +15320,7 @@ class XSDataResultStrategy(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultStrategy")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -15448,8 +15344,7 @@ class XSDataResultStrategy(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultStrategy()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -15462,8 +15357,7 @@ class XSDataResultStrategy(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultStrategy()
         rootObj.build(rootNode)
         return rootObj
@@ -15573,7 +15467,7 @@ class XSDataResultSubWedgeAssemble(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultSubWedgeAssemble")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -15597,8 +15491,7 @@ class XSDataResultSubWedgeAssemble(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultSubWedgeAssemble()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -15611,8 +15504,7 @@ class XSDataResultSubWedgeAssemble(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultSubWedgeAssemble()
         rootObj.build(rootNode)
         return rootObj
@@ -15720,7 +15612,7 @@ class XSDataResultSubWedgeMerge(XSDataResult):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataResultSubWedgeMerge")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -15744,8 +15636,7 @@ class XSDataResultSubWedgeMerge(XSDataResult):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataResultSubWedgeMerge()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -15758,8 +15649,7 @@ class XSDataResultSubWedgeMerge(XSDataResult):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataResultSubWedgeMerge()
         rootObj.build(rootNode)
         return rootObj
@@ -15855,7 +15745,7 @@ class XSDataSampleCrystal(XSDataSample):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSampleCrystal")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -15879,8 +15769,7 @@ class XSDataSampleCrystal(XSDataSample):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSampleCrystal()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -15893,8 +15782,7 @@ class XSDataSampleCrystal(XSDataSample):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSampleCrystal()
         rootObj.build(rootNode)
         return rootObj
@@ -16038,7 +15926,7 @@ class XSDataIntegrationInput(XSDataGeneratePredictionInput):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataIntegrationInput")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -16062,8 +15950,7 @@ class XSDataIntegrationInput(XSDataGeneratePredictionInput):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataIntegrationInput()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -16076,8 +15963,7 @@ class XSDataIntegrationInput(XSDataGeneratePredictionInput):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataIntegrationInput()
         rootObj.build(rootNode)
         return rootObj
@@ -16180,7 +16066,7 @@ class XSDataSampleCrystalMM(XSDataSampleCrystal):
         oStreamString = StringIO()
         oStreamString.write(unicode('<?xml version="1.0" ?>\n'))
         self.export(oStreamString, 0, name_="XSDataSampleCrystalMM")
-        oStringXML = oStreamString.getValue()
+        oStringXML = oStreamString.getvalue()
         oStreamString.close()
         return oStringXML
 
@@ -16204,8 +16090,7 @@ class XSDataSampleCrystalMM(XSDataSampleCrystal):
 
     # Static method for parsing a string
     def parseString(_inString):
-        doc = minidom.parseString(_inString)
-        rootNode = doc.documentElement
+        rootNode = parseXMLString(_inString)
         rootObj = XSDataSampleCrystalMM()
         rootObj.build(rootNode)
         # Check that all minOccurs are obeyed by marshalling the created object
@@ -16218,8 +16103,7 @@ class XSDataSampleCrystalMM(XSDataSampleCrystal):
     # Static method for parsing a file
 
     def parseFile(_inFilePath):
-        doc = minidom.parse(_inFilePath)
-        rootNode = doc.documentElement
+        rootNode = parseXMLFile(_inFilePath)
         rootObj = XSDataSampleCrystalMM()
         rootObj.build(rootNode)
         return rootObj
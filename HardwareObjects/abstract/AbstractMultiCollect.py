@@ -8,6 +8,7 @@ import abc
 import collections
 import autoprocessing
 import gevent
+import gevent.event
 from HardwareRepository.TaskUtils import task, cleanup, error_cleanup
 
 from HardwareRepository import HardwareRepository as HWR
@@ -59,6 +60,141 @@ BeamlineConfig = collections.namedtuple(
 )
 
 
+class LimsImageWriter(object):
+    """Store image records in the LIMS from a background greenlet
+
+    Records are queued by the acquisition loop and written with the lims
+    store_image method (raise_errors=True, so that the lims client does not
+    swallow the failures), one request per image; they are taken from the
+    queue batch_size at a time, for the flush statistics. Failed records
+    are retried with an exponential backoff. The queue is bounded: when it
+    is full, the oldest records are dropped.
+    """
+
+    def __init__(
+        self, lims=None, max_queue_size=10000, batch_size=50, retries=3, backoff=0.5
+    ):
+        self.lims = lims
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self._queue = collections.deque()
+        self._pending = gevent.event.Event()
+        self._idle = gevent.event.Event()
+        self._idle.set()
+        self._task = None
+        self._statistics = {
+            "queued": 0,
+            "stored": 0,
+            "failed": 0,
+            "dropped": 0,
+            "retries": 0,
+            "max_queue_depth": 0,
+            "flushes": 0,
+            "last_flush_time": 0,
+            "max_flush_time": 0,
+            "total_flush_time": 0,
+        }
+
+    def put(self, image_dict):
+        """Queue an image record
+
+        Args:
+            image_dict (dict): image parameters, see lims store_image
+        """
+        if len(self._queue) >= self.max_queue_size:
+            self._queue.popleft()
+            self._statistics["dropped"] += 1
+            logging.getLogger("HWR").warning(
+                "LIMS image queue full, image record dropped"
+            )
+        self._queue.append(image_dict)
+        self._statistics["queued"] += 1
+        self._statistics["max_queue_depth"] = max(
+            len(self._queue), self._statistics["max_queue_depth"]
+        )
+        self._idle.clear()
+        self._pending.set()
+        if self._task is None or self._task.ready():
+            self._task = gevent.spawn(self._run)
+
+    def flush(self, timeout=None):
+        """Wait until all queued records are written
+
+        Args:
+            timeout (float): maximum waiting time [s], None to wait forever
+
+        Returns:
+            (bool): True if the queue was emptied in time
+        """
+        return self._idle.wait(timeout)
+
+    def get_queue_depth(self):
+        """Return the number of records waiting to be written"""
+        return len(self._queue)
+
+    def get_statistics(self):
+        """Return the writer statistics: records queued, stored, failed
+        and dropped, retries, queue depth, and flush times [s] (per batch of
+        batch_size records)
+
+        Returns:
+            (dict): statistics
+        """
+        stats = dict(self._statistics)
+        stats["queue_depth"] = len(self._queue)
+        total_flush_time = stats.pop("total_flush_time")
+        stats["mean_flush_time"] = (
+            total_flush_time / stats["flushes"] if stats["flushes"] else 0
+        )
+        return stats
+
+    def _run(self):
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._pending.clear()
+                self._pending.wait()
+                continue
+
+            batch = []
+            while self._queue and len(batch) < self.batch_size:
+                batch.append(self._queue.popleft())
+
+            start_time = time.time()
+            stored = self._write(batch)
+            flush_time = time.time() - start_time
+
+            stats = self._statistics
+            stats["flushes"] += 1
+            stats["stored"] += stored
+            stats["failed"] += len(batch) - stored
+            stats["last_flush_time"] = flush_time
+            stats["max_flush_time"] = max(flush_time, stats["max_flush_time"])
+            stats["total_flush_time"] += flush_time
+
+    def _write(self, batch):
+        lims = self.lims or HWR.beamline.lims
+        stored = 0
+        for image_dict in batch:
+            for attempt in range(self.retries + 1):
+                try:
+                    lims.store_image(image_dict, raise_errors=True)
+                except Exception:
+                    if attempt == self.retries:
+                        logging.getLogger("HWR").exception(
+                            "Could not store store image in LIMS"
+                        )
+                        break
+                    self._statistics["retries"] += 1
+                    gevent.sleep(self.backoff * 2 ** attempt)
+                else:
+                    stored += 1
+                    break
+        return stored
+
+
 class AbstractMultiCollect(object):
     __metaclass__ = abc.ABCMeta
 
@@ -69,6 +205,10 @@ class AbstractMultiCollect(object):
         self.oscillation_task = None
         self.oscillations_history = []
         self.current_lims_sample = None
+        self.lims_image_writer = LimsImageWriter()
+        # maximum time to wait for the LIMS image records at the end of
+        # a data collection [s]
+        self.lims_image_flush_timeout = 60
         self.__safety_shutter_close_task = None
         self.run_without_loop = None
         self.run_autoprocessing = None
@@ -905,12 +1045,7 @@ class AbstractMultiCollect(object):
                                         "jpegThumbnailFileFullPath"
                                     ] = jpeg_thumbnail_full_path
 
-                                try:
-                                    HWR.beamline.lims.store_image(lims_image)
-                                except Exception:
-                                    logging.getLogger("HWR").exception(
-                                        "Could not store store image in LIMS"
-                                    )
+                                self.lims_image_writer.put(lims_image)
 
                                 self.generate_image_jpeg(
                                     str(file_path),
@@ -978,6 +1113,11 @@ class AbstractMultiCollect(object):
             self.diffractometer().wait_ready(60)
 
         # data collection done
+        if not self.lims_image_writer.flush(self.lims_image_flush_timeout):
+            logging.getLogger("HWR").warning(
+                "%d image records still to be stored in LIMS",
+                self.lims_image_writer.get_queue_depth(),
+            )
         self.data_collection_end_hook(data_collect_parameters)
 
     @task
@@ -34,6 +34,12 @@ import gevent
 import SimpleHTML
 from HardwareRepository.BaseHardwareObjects import HardwareObject
 from HardwareRepository import HardwareRepository as HWR
+from HardwareRepository.utils.processing_results import (
+    ProcessingResults,
+    get_best_indices,
+    get_col_row_index,
+    save_csv,
+)
 
 
 __license__ = "LGPLv3+"
@@ -77,12 +83,15 @@ class AbstractOnlineProcessing(HardwareObject):
         self.grid = None
         self.params_dict = None
         self.result_types = None
+        self.results = None
         self.results_raw = None
         self.results_aligned = None
+        self.best_positions_cpos = None
         self.interpolate_results = None
         self.done_event = None
         self.started = None
         self.workflow_info = None
+        self.processing_job = None
 
         self.plot_points_num = None
         self.current_grid_index = None
@@ -256,8 +265,9 @@ class AbstractOnlineProcessing(HardwareObject):
             self.params_dict["steps_y"] = 1
             self.params_dict["reversing_rotation"] = False
 
-        self.results_raw = {}
-        self.results_aligned = {}
+        self.results = ProcessingResults()
+        self.results_raw = self.results.raw
+        self.results_aligned = self.results.aligned
 
         # Empty numpy arrays to store raw and aligned results
         self.plot_points_num = images_num
@@ -269,18 +279,29 @@ class AbstractOnlineProcessing(HardwareObject):
             else:
                 images_num = self.params_dict["images_num"]
 
-            self.results_raw[result_type["key"]] = np.zeros(images_num)
-            self.results_aligned[result_type["key"]] = np.zeros(images_num)
-
-            if self.interpolate_results:
-                self.results_aligned["interp_" + result_type] = np.zeros(images_num)
+            shape = None
             if (
                 self.data_collection.is_mesh()
                 and images_num == self.params_dict["images_num"]
             ):
-                self.results_aligned[result_type["key"]] = self.results_aligned[
-                    result_type["key"]
-                ].reshape(self.params_dict["steps_x"], self.params_dict["steps_y"])
+                shape = (self.params_dict["steps_x"], self.params_dict["steps_y"])
+            self.results.allocate(result_type["key"], images_num, shape)
+
+            if self.interpolate_results:
+                self.results_aligned["interp_" + result_type] = np.zeros(images_num)
+
+        if self.grid and self.data_collection.is_mesh():
+            # serial image -> (col, row) of each frame, computed once per scan
+            self.results.set_grid_index(
+                *get_col_row_index(
+                    lambda index: self.grid.get_col_row_from_image_serial(
+                        index + first_image_num
+                    ),
+                    self.params_dict["images_num"],
+                    (self.params_dict["steps_x"], self.params_dict["steps_y"]),
+                )
+            )
+        self.best_positions_cpos = {}
 
         # if not self.data_collection.is_mesh():
         #    self.results_raw["x_array"] = np.linspace(
@@ -347,14 +368,19 @@ class AbstractOnlineProcessing(HardwareObject):
             )
 
             self.started = True
-            subprocess.Popen(
-                str(line_to_execute),
-                shell=True,
-                stdin=None,
-                stdout=None,
-                stderr=None,
-                close_fds=True,
-            )
+            if HWR.beamline.job_runner is not None:
+                self.processing_job = HWR.beamline.job_runner.submit(
+                    str(line_to_execute), "online_processing", name="dozor"
+                )
+            else:
+                subprocess.Popen(
+                    str(line_to_execute),
+                    shell=True,
+                    stdin=None,
+                    stdout=None,
+                    stderr=None,
+                    close_fds=True,
+                )
 
     def save_snapshot_task(self, snapshot_filename):
         """Saves snapshot
@@ -386,6 +412,8 @@ class AbstractOnlineProcessing(HardwareObject):
         """Stops processing"""
         self.started = False
         self.set_processing_status("Stopped")
+        if self.processing_job is not None:
+            self.processing_job.cancel()
         # subprocess.Popen(self.kill_command, shell=True, stdin=None,
         #                 stdout=None, stderr=None, close_fds=True)
 
@@ -702,39 +730,39 @@ class AbstractOnlineProcessing(HardwareObject):
         # ---------------------------------------------------------------------
         # Writes results in the csv file
         try:
-            processing_csv_file = open(processing_csv_archive_file, "w")
-            processing_csv_file.write(
-                "%s,%d,%d,%d,%d,%d,%s,%d,%d,%f,%f,%s\n"
-                % (
-                    self.params_dict["template"],
-                    self.params_dict["first_image_num"],
-                    self.params_dict["images_num"],
-                    self.params_dict["run_number"],
-                    self.params_dict["run_number"],
-                    self.params_dict["lines_num"],
-                    str(self.params_dict["reversing_rotation"]),
-                    HWR.beamline.detector.get_pixel_min(),
-                    HWR.beamline.detector.get_pixel_max(),
-                    self.beamstop_hwobj.get_size(),
-                    self.beamstop_hwobj.get_distance(),
-                    self.beamstop_hwobj.get_direction(),
-                )
-            )
-            for index in range(self.params_dict["images_num"]):
+            with open(processing_csv_archive_file, "w") as processing_csv_file:
                 processing_csv_file.write(
-                    "%d,%f,%d,%f\n"
+                    "%s,%d,%d,%d,%d,%d,%s,%d,%d,%f,%f,%s\n"
                     % (
-                        index,
-                        self.results_raw["score"][index],
-                        self.results_raw["spots_num"][index],
-                        self.results_raw["spots_resolution"][index],
+                        self.params_dict["template"],
+                        self.params_dict["first_image_num"],
+                        self.params_dict["images_num"],
+                        self.params_dict["run_number"],
+                        self.params_dict["run_number"],
+                        self.params_dict["lines_num"],
+                        str(self.params_dict["reversing_rotation"]),
+                        HWR.beamline.detector.get_pixel_min(),
+                        HWR.beamline.detector.get_pixel_max(),
+                        self.beamstop_hwobj.get_size(),
+                        self.beamstop_hwobj.get_distance(),
+                        self.beamstop_hwobj.get_direction(),
                     )
                 )
+                images_num = self.params_dict["images_num"]
+                save_csv(
+                    processing_csv_file,
+                    (
+                        np.arange(images_num),
+                        self.results_raw["score"][:images_num],
+                        self.results_raw["spots_num"][:images_num],
+                        self.results_raw["spots_resolution"][:images_num],
+                    ),
+                    ("%d", "%f", "%d", "%f"),
+                )
             log.info(
                 "Parallel processing: Raw data stored in %s"
                 % processing_csv_archive_file
             )
-            processing_csv_file.close()
         except Exception:
             log.error(
                 "Parallel processing: Unable to store raw data in %s"
@@ -743,39 +771,23 @@ class AbstractOnlineProcessing(HardwareObject):
         # ---------------------------------------------------------------------
 
     def align_processing_results(self, start_index, end_index):
-        """Realigns all results. Each results (one dimensional numpy array)
-           is converted to 2d numpy array according to diffractometer geometry.
+        """Realigns the results of the frames start_index to end_index. Each
+           result (one dimensional numpy array) is converted to 2d numpy array
+           according to diffractometer geometry.
            Function also extracts 10 (if they exist) best positions
         """
-        # Each result array is realigned
+        # Only the new frames are realigned
+        self.results.align(np.arange(start_index, end_index + 1))
 
-        for score_key in self.results_raw.keys():
-            if (
-                self.grid
-                and self.results_raw[score_key].size == self.params_dict["images_num"]
-            ):
-                for cell_index in range(start_index, end_index + 1):
-                    col, row = self.grid.get_col_row_from_image_serial(
-                        cell_index + self.params_dict["first_image_num"]
-                    )
-                    if (
-                        col < self.results_aligned[score_key].shape[0]
-                        and row < self.results_aligned[score_key].shape[1]
-                    ):
-                        self.results_aligned[score_key][col][row] = self.results_raw[
-                            score_key
-                        ][cell_index]
-            else:
-                self.results_aligned[score_key] = self.results_raw[score_key][
-                    :: self.params_dict["images_num"] / self.plot_points_num
-                ]
-                if self.interpolate_results:
-                    x_array = np.linspace(
-                        0,
-                        self.params_dict["images_num"],
-                        self.params_dict["images_num"],
-                        dtype=int,
-                    )
+        if not self.grid and self.interpolate_results:
+            x_array = np.linspace(
+                0,
+                self.params_dict["images_num"],
+                self.params_dict["images_num"],
+                dtype=int,
+            )
+            for score_key in self.results_raw.keys():
+                if self.results_raw[score_key].size == x_array.size:
                     spline = UnivariateSpline(
                         x_array, self.results_aligned[score_key], s=10
                     )
@@ -809,48 +821,50 @@ class AbstractOnlineProcessing(HardwareObject):
         # Best positions are extracted
         best_positions_list = []
 
-        index_arr = (-self.results_raw["score"]).argsort()[:10]
-        if len(index_arr) > 0:
-            for index in index_arr:
-                if self.results_raw["score"][index] > 0:
-                    best_position = {}
-                    best_position["index"] = index
-                    best_position["index_serial"] = (
-                        self.params_dict["first_image_num"] + index
-                    )
-                    best_position["score"] = self.results_raw["score"][index]
-                    best_position["spots_num"] = self.results_raw["spots_num"][index]
-                    best_position["spots_resolution"] = self.results_raw[
-                        "spots_resolution"
-                    ][index]
-                    best_position["filename"] = os.path.basename(
-                        self.params_dict["template"]
-                        % (
-                            self.params_dict["run_number"],
-                            self.params_dict["first_image_num"] + index,
-                        )
-                    )
+        for index in get_best_indices(self.results_raw["score"], 10):
+            index = int(index)
+            best_position = {}
+            best_position["index"] = index
+            best_position["index_serial"] = self.params_dict["first_image_num"] + index
+            best_position["score"] = self.results_raw["score"][index]
+            best_position["spots_num"] = self.results_raw["spots_num"][index]
+            best_position["spots_resolution"] = self.results_raw["spots_resolution"][
+                index
+            ]
+            best_position["filename"] = os.path.basename(
+                self.params_dict["template"]
+                % (
+                    self.params_dict["run_number"],
+                    self.params_dict["first_image_num"] + index,
+                )
+            )
 
-                    cpos = None
-                    if self.grid:
-                        col, row = self.grid.get_col_row_from_image_serial(
-                            index + self.params_dict["first_image_num"]
-                        )
-                        col += 0.5
-                        row = self.params_dict["steps_y"] - row - 0.5
-                        cpos = self.grid.get_motor_pos_from_col_row(col, row)
-                    else:
-                        col = index
-                        row = 0
-                        cpos = None
-                        # TODO make this nicer
-                        # num_images = self.data_collection.acquisitions[0].acquisition_parameters.num_images - 1
-                        # (point_one, point_two) = self.data_collection.get_centred_positions()
-                        # cpos = HWR.beamline.diffractometer.get_point_from_line(point_one, point_two, index, num_images)
-                    best_position["col"] = col
-                    best_position["row"] = row
-                    best_position["cpos"] = cpos
-                    best_positions_list.append(best_position)
+            cpos = None
+            if self.grid:
+                col_row = self.results.get_col_row(index)
+                if col_row is None or col_row[0] < 0:
+                    col_row = self.grid.get_col_row_from_image_serial(
+                        index + self.params_dict["first_image_num"]
+                    )
+                col = col_row[0] + 0.5
+                row = self.params_dict["steps_y"] - col_row[1] - 0.5
+                # motor positions of a cell do not change during the scan
+                cpos = self.best_positions_cpos.get(index)
+                if cpos is None:
+                    cpos = self.grid.get_motor_pos_from_col_row(col, row)
+                    self.best_positions_cpos[index] = cpos
+            else:
+                col = index
+                row = 0
+                cpos = None
+                # TODO make this nicer
+                # num_images = self.data_collection.acquisitions[0].acquisition_parameters.num_images - 1
+                # (point_one, point_two) = self.data_collection.get_centred_positions()
+                # cpos = HWR.beamline.diffractometer.get_point_from_line(point_one, point_two, index, num_images)
+            best_position["col"] = col
+            best_position["row"] = row
+            best_position["cpos"] = cpos
+            best_positions_list.append(best_position)
 
         self.results_aligned["best_positions"] = best_positions_list
 
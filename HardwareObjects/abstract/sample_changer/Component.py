@@ -125,6 +125,7 @@ class Component(object):
         changed = False
         if self.id is not None:
             self.id = None
+            self._id_changed()
             changed = True
         if self.present:
             self.present = False
@@ -137,9 +138,19 @@ class Component(object):
 
     #########################           PROTECTED           #########################
     def _set_info(self, present=False, id=None, scanned=False):
+        if self._update_info(present, id, scanned):
+            self._set_dirty()
+
+    def _update_info(self, present=False, id=None, scanned=False):
+        """
+        Updates the info without marking the containers as dirty
+        Returns True if the info changed
+        :rtype: bool
+        """
         changed = False
         if self.id != id:
             self.id = id
+            self._id_changed()
             changed = True
         if self.id:
             present = True
@@ -152,7 +163,14 @@ class Component(object):
             self.scanned = scanned
             changed = True
         if changed:
-            self._set_dirty()
+            self.dirty = True
+        return changed
+
+    def _id_changed(self):
+        container = self.get_container()
+        while container is not None:
+            container._components_by_id = None
+            container = container.get_container()
 
     def _set_selected(self, selected):
         if selected:
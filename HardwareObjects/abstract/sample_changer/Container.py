@@ -11,6 +11,14 @@ class Container(Component):
         super(Container, self).__init__(container, address, scannable)
         self.type = type
         self.components = []
+        # Indexes and flattened lists of the components below this container,
+        # built on first use. None when out of date: the indexes and the
+        # sample list on structure changes (and id changes for the id index),
+        # the present samples when a component is marked dirty
+        self._components_by_address = None
+        self._components_by_id = None
+        self._sample_list = None
+        self._present_samples = None
 
     #########################           PUBLIC           #########################
 
@@ -44,13 +52,15 @@ class Container(Component):
         Returns the list of all Sample objects under of this container (recursivelly)
         :rtype: list
         """
-        samples = []
-        for c in self.get_components():
-            if isinstance(c, Sample):
-                samples.append(c)
-            else:
-                samples.extend(c.get_sample_list())
-        return samples
+        if self._sample_list is None:
+            samples = []
+            for c in self.get_components():
+                if isinstance(c, Sample):
+                    samples.append(c)
+                else:
+                    samples.extend(c.get_sample_list())
+            self._sample_list = samples
+        return list(self._sample_list)
 
     def get_basket_list(self):
         basket_list = []
@@ -64,34 +74,28 @@ class Container(Component):
         Returns the list of all Sample objects under of this container (recursivelly) tagged as present
         :rtype: list
         """
-        ret = []
-        for sample in self.get_sample_list():
-            if sample.is_present():
-                ret.append(sample)
+        if type(self).get_sample_list is not Container.get_sample_list:
+            # sample list of the subclass may not follow the component changes
+            return [sample for sample in self.get_sample_list() if sample.is_present()]
+        if self._present_samples is None:
+            self._present_samples = [
+                sample for sample in self.get_sample_list() if sample.is_present()
+            ]
+        return list(self._present_samples)
 
     def is_empty(self):
         """
         Returns true if there is no sample present sample under this container
         :rtype: bool
         """
-        for s in self.get_sample_list():
-            if s.is_present():
-                return False
-        return True
+        return not self.get_present_samples()
 
     def get_component_by_address(self, address):
         """
         Returns a component through its slot address or None if address is invalid
         :rtype: Component
         """
-        for c in self.get_components():
-            if c.get_address() == address:
-                return c
-            if isinstance(c, Container):
-                aux = c.get_component_by_address(address)
-                if aux is not None:
-                    return aux
-        return None
+        return self._get_address_index().get(address)
 
     def has_component_address(self, address):
         """
@@ -105,14 +109,7 @@ class Container(Component):
         Returns a component through its id or None if id is invalid
         :rtype: Component
         """
-        for c in self.get_components():
-            if c.get_id() == id:
-                return c
-            if isinstance(c, Container):
-                aux = c.get_component_by_id(id)
-                if aux is not None:
-                    return aux
-        return None
+        return self._get_id_index().get(id)
 
     def has_component_id(self, id):
         """
@@ -142,12 +139,77 @@ class Container(Component):
 
     def _add_component(self, c):
         self.components.append(c)
+        self._structure_changed()
 
     def _remove_component(self, c):
         self.components.remove(c)
+        self._structure_changed()
 
     def _clear_components(self):
         self.components = []
+        self._structure_changed()
+
+    def _set_info_many(self, present, ids=None, scanned=False):
+        """
+        Sets the info of all the components of this container in one pass,
+        marking the containers as dirty once
+        :param present: presence bit mask (bit n for component n) or list of bool
+        :param ids: list of ids or None
+        :param scanned: bool or list of bool
+        :returns: True if the info of a component changed
+        :rtype: bool
+        """
+        changed = False
+        for index, c in enumerate(self.components):
+            if isinstance(present, int):
+                c_present = bool(present >> index & 1)
+            else:
+                c_present = present[index]
+            c_id = ids[index] if ids is not None else None
+            if isinstance(scanned, (list, tuple)):
+                c_scanned = scanned[index]
+            else:
+                c_scanned = scanned
+            if c._update_info(c_present, c_id, c_scanned):
+                changed = True
+        if changed:
+            self._set_dirty()
+        return changed
+
+    def _structure_changed(self):
+        container = self
+        while container is not None:
+            container._components_by_address = None
+            container._components_by_id = None
+            container._sample_list = None
+            container._present_samples = None
+            container = container.get_container()
+
+    def _build_index(self, key_method, index_method):
+        # first component in depth-first order wins, as in a linear search
+        index = {}
+        for c in self.get_components():
+            index.setdefault(getattr(c, key_method)(), c)
+            if isinstance(c, Container):
+                for key, sub_c in getattr(c, index_method)().items():
+                    index.setdefault(key, sub_c)
+        return index
+
+    def _get_address_index(self):
+        if self._components_by_address is None:
+            self._components_by_address = self._build_index(
+                "get_address", "_get_address_index"
+            )
+        return self._components_by_address
+
+    def _get_id_index(self):
+        if self._components_by_id is None:
+            self._components_by_id = self._build_index("get_id", "_get_id_index")
+        return self._components_by_id
+
+    def _set_dirty(self):
+        self._present_samples = None
+        Component._set_dirty(self)
 
     def _reset_dirty(self):
         Component._reset_dirty(self)
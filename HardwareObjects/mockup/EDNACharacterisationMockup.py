@@ -20,7 +20,7 @@
 from HardwareRepository.HardwareObjects import edna_test_data
 from HardwareRepository.HardwareObjects.EDNACharacterisation import EDNACharacterisation
 
-from HardwareRepository.HardwareObjects.XSDataMXCuBEv1_3 import XSDataResultMXCuBE
+from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
 
 
 __credits__ = ["MXCuBE collaboration"]
@@ -35,7 +35,9 @@ class EDNACharacterisationMockup(EDNACharacterisation):
         return
 
     def characterise(self, edna_input):
-        return XSDataResultMXCuBE.parseString(edna_test_data.EDNA_RESULT_DATA)
+        return xsdata.XSDataMXCuBEv1_3.XSDataResultMXCuBE.parseString(
+            edna_test_data.EDNA_RESULT_DATA
+        )
 
     def is_running(self):
         return
@@ -328,13 +328,16 @@ class ISPyBClientMockup(HardwareObject):
         """
         pass
 
-    def store_image(self, image_dict):
+    def store_image(self, image_dict, raise_errors=False):
         """
         Stores the image (image parameters) <image_dict>
 
         :param image_dict: A dictonary with image pramaters.
         :type image_dict: dict
 
+        :param raise_errors: Raise the errors instead of logging them
+        :type raise_errors: bool
+
         :returns: None
         """
         pass
@@ -6,7 +6,7 @@ from HardwareRepository.HardwareObjects.abstract.AbstractCharacterisation import
     AbstractCharacterisation,
 )
 
-from HardwareRepository.HardwareObjects.XSDataMXCuBEv1_3 import XSDataResultMXCuBE
+from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
 
 
 class SOLEILEDNACharacterisationMockup(AbstractCharacterisation):
@@ -34,7 +34,9 @@ class SOLEILEDNACharacterisationMockup(AbstractCharacterisation):
         logging.getLogger("queue_exec").info(msg)
 
         self.processing_done_event.set()
-        self.result = XSDataResultMXCuBE.parseString(edna_test_data.EDNA_RESULT_DATA)
+        self.result = xsdata.XSDataMXCuBEv1_3.XSDataResultMXCuBE.parseString(
+            edna_test_data.EDNA_RESULT_DATA
+        )
 
         return self.result
 
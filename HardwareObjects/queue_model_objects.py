@@ -23,6 +23,7 @@ This module contain objects that combined make up the data model.
 Any object that inherhits from TaskNode can be added to and handled by
 the QueueModel.
 """
+import bisect
 import copy
 import os
 import logging
@@ -41,6 +42,21 @@ __copyright__ = """ Copyright © 2010 - 2020 by MXCuBE Collaboration """
 __license__ = "LGPLv3+"
 
 
+class PathTemplateOwner(object):
+    """
+    Objects with a path_template attribute, the QueueModel index of the
+    replaced path template is told when another one is assigned
+    """
+
+    def __setattr__(self, name, value):
+        previous = self.__dict__.get(name) if name == "path_template" else None
+        object.__setattr__(self, name, value)
+        if previous is not None and previous is not value:
+            index = previous.__dict__.get("_index")
+            if index is not None:
+                index.path_template_replaced(previous)
+
+
 class TaskNode(object):
     """
     Objects that inherit TaskNode can be added to and handled by
@@ -1001,7 +1017,7 @@ class CharacterisationParameters(object):
         return s
 
 
-class EnergyScan(TaskNode):
+class EnergyScan(TaskNode, PathTemplateOwner):
     def __init__(self, sample=None, path_template=None, cpos=None):
         TaskNode.__init__(self)
         self.element_symbol = None
@@ -1102,7 +1118,7 @@ class EnergyScanResult(object):
         self.title = None
 
 
-class XRFSpectrum(TaskNode):
+class XRFSpectrum(TaskNode, PathTemplateOwner):
     """
     Class represents XRF spectrum task
     """
@@ -1320,7 +1336,7 @@ class OpticalCentring(TaskNode):
         return self._name
 
 
-class Acquisition(object):
+class Acquisition(PathTemplateOwner):
     def __init__(self):
         object.__init__(self)
 
@@ -1356,6 +1372,21 @@ class Acquisition(object):
 
 
 class PathTemplate(object):
+    # Attributes defining the directory, prefix and run number of the files,
+    # changes are reported to the QueueModel index the template belongs to
+    INDEXED_ATTRIBUTES = frozenset(
+        (
+            "directory",
+            "base_prefix",
+            "mad_prefix",
+            "reference_image_prefix",
+            "wedge_prefix",
+            "run_number",
+            "start_num",
+            "num_files",
+        )
+    )
+
     @staticmethod
     def set_data_base_path(base_directory):
         # os.path.abspath returns path without trailing slash, if any
@@ -1413,6 +1444,19 @@ class PathTemplate(object):
         if not hasattr(self, "precision"):
             self.precision = str()
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in PathTemplate.INDEXED_ATTRIBUTES:
+            index = self.__dict__.get("_index")
+            if index is not None:
+                index.path_template_changed(self)
+
+    def __getstate__(self):
+        # copies and serialised templates do not belong to an index
+        state = dict(self.__dict__)
+        state.pop("_index", None)
+        return state
+
     def as_dict(self):
         return {
             "directory": self.directory,
@@ -1580,6 +1624,78 @@ class PathTemplate(object):
         return copy.deepcopy(self)
 
 
+class FileRangeIndex(object):
+    """
+    Ranges of image numbers [start_num, start_num + num_files[ of the path
+    templates of the same directory, prefix and run number. Sorted on
+    start_num, with the running maximum of the range ends, so that finding
+    an overlapping range takes O(log n) plus the number of ranges that
+    reach the queried one.
+    """
+
+    def __init__(self):
+        self._starts = []
+        self._ends = []
+        self._path_templates = []
+        self._max_ends = []
+
+    def __len__(self):
+        return len(self._path_templates)
+
+    def __iter__(self):
+        return iter(list(self._path_templates))
+
+    def add(self, path_template, start_num, num_files):
+        """
+        Adds the range of <path_template>
+
+        :param start_num: first image number
+        :param num_files: number of files
+        """
+        index = bisect.bisect_right(self._starts, start_num)
+        self._starts.insert(index, start_num)
+        self._ends.insert(index, start_num + num_files)
+        self._path_templates.insert(index, path_template)
+        self._update_max_ends(index)
+
+    def remove(self, path_template, start_num):
+        """
+        Removes the range of <path_template>, added with <start_num>
+        """
+        index = bisect.bisect_left(self._starts, start_num)
+        while index < len(self._starts) and self._starts[index] == start_num:
+            if self._path_templates[index] is path_template:
+                del self._starts[index]
+                del self._ends[index]
+                del self._path_templates[index]
+                self._update_max_ends(index)
+                return
+            index += 1
+
+    def get_overlapping(self, start_num, num_files, exclude=None):
+        """
+        :returns: A path template with a range overlapping
+                  [start_num, start_num + num_files[, None if none
+        :rtype: PathTemplate
+        """
+        index = bisect.bisect_left(self._starts, start_num + num_files) - 1
+        while index >= 0 and self._max_ends[index] > start_num:
+            if (
+                self._ends[index] > start_num
+                and self._path_templates[index] is not exclude
+            ):
+                return self._path_templates[index]
+            index -= 1
+        return None
+
+    def _update_max_ends(self, index):
+        del self._max_ends[index:]
+        max_end = self._max_ends[-1] if self._max_ends else None
+        for end in self._ends[index:]:
+            max_end = end if max_end is None else max(max_end, end)
+            self._max_ends.append(max_end)
+
+
 class AcquisitionParameters(object):
     def __init__(self):
         object.__init__(self)
@@ -1821,7 +1937,7 @@ class CentredPosition(object):
         return self.kappa_phi
 
 
-class Workflow(TaskNode):
+class Workflow(TaskNode, PathTemplateOwner):
     def __init__(self):
         TaskNode.__init__(self)
         self.path_template = PathTemplate()
@@ -1839,7 +1955,7 @@ class Workflow(TaskNode):
         return self.path_template
 
 
-class GphlWorkflow(TaskNode):
+class GphlWorkflow(TaskNode, PathTemplateOwner):
     def __init__(self, workflow_hwobj):
         TaskNode.__init__(self)
         self.workflow_hwobj = workflow_hwobj
@@ -0,0 +1,122 @@
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""Lazy access to the generated XSData (EDNA) bindings
+
+The binding modules are large and slow to import. They are imported on the
+first access to one of their classes, found in a registry built from the
+class statements of the binding sources (without importing them):
+
+    from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
+
+    xsdata.XSDataDouble(1.0)
+    xsdata.XSDataMXCuBEv1_3.XSDataResultMXCuBE
+
+A class defined in several binding modules resolves to the first module of
+BINDING_MODULES; the others are reached through the module attribute.
+The binding modules are imported with their top level names, as they import
+each other, so that each class exists only once.
+"""
+
+import importlib
+import os
+import re
+import sys
+import types
+
+__copyright__ = """ Copyright © 2020 by the MXCuBE collaboration """
+__license__ = "LGPLv3+"
+
+# Binding modules, in order of precedence for duplicated class names
+BINDING_MODULES = (
+    "XSDataCommon",
+    "XSDataMXv1",
+    "XSDataMXCuBEv1_4",
+    "XSDataMXCuBEv1_3",
+    "XSDataAutoprocv1_0",
+    "XSDataControlDozorv1_1",
+)
+
+CLASS_PATTERN = re.compile(r"^class\s+(\w+)", re.MULTILINE)
+
+_registry = None
+
+
+def get_registry():
+    """Return the binding module of each XSData class
+
+    Returns:
+        (dict): class name -> module name
+    """
+    global _registry
+    if _registry is None:
+        registry = {}
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for module_name in BINDING_MODULES:
+            with open(os.path.join(directory, module_name + ".py")) as source_file:
+                for class_name in CLASS_PATTERN.findall(source_file.read()):
+                    registry.setdefault(class_name, module_name)
+        _registry = registry
+    return _registry
+
+
+def get_loaded_modules():
+    """Return the binding modules imported so far"""
+    return [name for name in BINDING_MODULES if name in sys.modules]
+
+
+def _resolve(name):
+    if name in BINDING_MODULES:
+        value = importlib.import_module(name)
+    else:
+        module_name = get_registry().get(name)
+        if module_name is None:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+        value = getattr(importlib.import_module(module_name), name)
+    # further accesses are plain module attributes
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return _resolve(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(BINDING_MODULES) | set(get_registry()))
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__ (PEP 562) before Python 3.7
+
+    class _LazyModule(types.ModuleType):
+        def __getattr__(self, name):
+            return __getattr__(name)
+
+        def __dir__(self):
+            return __dir__()
+
+    _module = _LazyModule(__name__, __doc__)
+    _module.__dict__.update(globals())
+    # keep the globals of the functions alive
+    _module._original_module = sys.modules[__name__]
+    sys.modules[__name__] = _module
@@ -34,10 +34,13 @@ import sys
 import os
 import time
 import importlib
+from collections import OrderedDict
 from datetime import datetime
 from warnings import warn
 
 import gevent
+import gevent.event
+import gevent.lock
 from ruamel.yaml import YAML
 
 from HardwareRepository.ConvertUtils import string_types, make_table
@@ -64,6 +67,17 @@ TIMERS = []
 beamline = None
 BEAMLINE_CONFIG_FILE = "beamline_config.yml"
 
+# Maximum number of hardware objects loaded concurrently by load_from_yaml.
+# With 1 the contents are loaded one at a time, in dependency order.
+# Only use more on beamlines where object init() does not rely on
+# siblings being loaded before them other than through <object href=...>
+MAX_CONCURRENT_LOADS = 1
+_load_semaphore = None
+
+# Directory of the parsed configuration files cache, None to always parse
+CONFIGURATION_CACHE_DIRECTORY = None
+configuration_cache = None
+
 
 def load_from_yaml(configuration_file, role, _container=None, _table=None):
     """
@@ -84,11 +98,16 @@ def load_from_yaml(configuration_file, role, _container=None, _table=None):
         # This is the topmopst call
         _table = []
 
+    global _load_semaphore
+
     start_time = time.time()
     msg0 = ""
     result = None
     class_name = None
 
+    if _container is None:
+        _load_semaphore = gevent.lock.BoundedSemaphore(max(MAX_CONCURRENT_LOADS, 1))
+
     # Get full path for configuration file
     if _instance is None:
         raise RuntimeError("HardwareRepository has not been initialised")
@@ -98,8 +117,11 @@ def load_from_yaml(configuration_file, role, _container=None, _table=None):
 
     if not msg0:
         # Load the configuration file
-        with open(configuration_path, "r") as fp0:
-            configuration = yaml.load(fp0)
+        if configuration_cache is None:
+            with open(configuration_path, "r") as fp0:
+                configuration = yaml.load(fp0)
+        else:
+            configuration = configuration_cache.get_yaml(configuration_path)
 
         # Get actual class
         initialise_class = configuration.pop("_initialise_class", None)
@@ -171,33 +193,12 @@ def load_from_yaml(configuration_file, role, _container=None, _table=None):
                 (role, class_name, configuration_file, "%.1d" % load_time, msg1)
             )
             msg0 = "Done loading contents"
-        for role1, config_file in _objects.items():
-            fname, fext = os.path.splitext(config_file)
-            if fext == ".yml":
-                load_from_yaml(
-                    config_file, role=role1, _container=result, _table=_table
-                )
-            elif fext == ".xml":
-                msg1 = ""
-                time0 = time.time()
-                try:
-                    hwobj = _instance.get_hardware_object(fname)
-                    if hwobj is None:
-                        msg1 = "No object loaded"
-                        class_name1 = "None"
-                    else:
-                        class_name1 = hwobj.__class__.__name__
-                        if hasattr(result, role1):
-                            result.replace_object(role1, hwobj)
-                        else:
-                            msg1 = "No such role: %s.%s" % (class_name, role1)
-                except Exception as ex:
-                    msg1 = "Loading error (%s)" % str(ex)
-                    class_name = ""
-                load_time = 1000 * (time.time() - time0)
-                _table.append(
-                    (role1, class_name1, config_file, "%.1d" % load_time, msg1)
-                )
+        critical_path_time = _load_contents(result, class_name, _objects, _table)
+        if _container is None:
+            _instance.load_summary = {
+                "wall_clock": 1000 * (time.time() - start_time),
+                "critical_path": critical_path_time,
+            }
 
         # Set simple, miscellaneous properties.
         # NB the attribute must have been initialied in the class __init__ first.
@@ -237,6 +238,181 @@ def load_from_yaml(configuration_file, role, _container=None, _table=None):
     return result
 
 
+def _load_contents(container, class_name, objects, table):
+    """Load the contents of a container configured from a yaml file
+
+    Objects are loaded in dependency order: objects referenced with
+    <object href=...> in an xml file are loaded before it. With
+    MAX_CONCURRENT_LOADS > 1 the objects are loaded in greenlets, each one
+    waiting only for its own prerequisites and for a free loading slot.
+    The wait time of an object runs from the end of the loading of its
+    prerequisites (ready to load) to the start of its own loading.
+
+    Args:
+        container (ConfiguredObject): container object
+        class_name (str): class name of the container, for the report
+        objects (dict): role -> configuration file
+        table (list): summary output rows
+
+    Returns:
+        (float): loading time of the longest dependency chain [ms]
+    """
+    nodes, dependencies = _get_load_graph(objects)
+    concurrent = MAX_CONCURRENT_LOADS > 1
+    start_time = time.time()
+    finish_times = {}
+    # node -> time.time() at the end of its loading
+    end_times = {}
+    done = {}
+    # hardware objects are weakly referenced by the repository:
+    # keep the prerequisites alive until their dependants hold them
+    prerequisites = []
+
+    def load_node(node):
+        for dependency in dependencies[node]:
+            if dependency in done:
+                done[dependency].wait()
+        ready_time = max(
+            [
+                end_times[dependency]
+                for dependency in dependencies[node]
+                if dependency in end_times
+            ]
+            or [start_time]
+        )
+
+        if concurrent and node.startswith("/"):
+            # yaml containers do not take a slot: their contents do
+            with _load_semaphore:
+                # waiting for a free slot
+                wait_time = 1000 * (time.time() - ready_time)
+                load_time = _load_node(
+                    container, class_name, node, nodes[node], table, prerequisites
+                )
+        else:
+            # waiting for the objects loaded before
+            wait_time = 1000 * (time.time() - ready_time)
+            load_time = _load_node(
+                container, class_name, node, nodes[node], table, prerequisites
+            )
+        end_times[node] = time.time()
+
+        _instance.hwobj_wait_times[node] = wait_time
+        finish_times[node] = load_time + max(
+            [finish_times.get(dependency, 0) for dependency in dependencies[node]]
+            or [0]
+        )
+        if node in done:
+            done[node].set()
+
+    if concurrent:
+        done = dict((node, gevent.event.Event()) for node in nodes)
+        gevent.joinall([gevent.spawn(load_node, node) for node in nodes])
+    else:
+        for node in nodes:
+            load_node(node)
+
+    return max(list(finish_times.values()) or [0])
+
+
+def _get_load_graph(objects):
+    """Build the dependency graph of the contents of a container
+
+    Nodes are hardware object names ('/name') for xml files and file names
+    for yaml files. xml files referenced by a content object but not listed
+    in objects are added to the graph, so they are loaded before it.
+    Cyclic references are broken.
+
+    Args:
+        objects (dict): role -> configuration file
+
+    Returns:
+        (tuple): OrderedDict of node -> list of (role, configuration file)
+            in loading order, and dict of node -> list of prerequisite nodes
+    """
+    roles = OrderedDict()
+    for role, config_file in objects.items():
+        fname, fext = os.path.splitext(config_file)
+        if fext == ".xml":
+            node = fname if fname.startswith("/") else "/" + fname
+        else:
+            node = config_file
+        roles.setdefault(node, []).append((role, config_file))
+
+    references = {}
+    nodes = OrderedDict()
+    visiting = set()
+
+    def visit(node):
+        if node in nodes or node in visiting:
+            # already sorted, or a cyclic reference
+            return
+        visiting.add(node)
+        if node.startswith("/"):
+            references[node] = [
+                ref for ref in _instance.get_references(node) if ref not in visiting
+            ]
+        else:
+            references[node] = []
+        for reference in references[node]:
+            visit(reference)
+        visiting.remove(node)
+        nodes[node] = roles.get(node, [])
+
+    for node in roles:
+        visit(node)
+
+    return nodes, references
+
+
+def _load_node(container, class_name, node, roles, table, prerequisites):
+    """Load one node of a container contents graph
+
+    Args:
+        container (ConfiguredObject): container object
+        class_name (str): class name of the container, for the report
+        node (str): hardware object name, or yaml file name
+        roles (list): (role, configuration file) of the node in the container
+        table (list): summary output rows
+        prerequisites (list): loaded objects that are not part of the container
+
+    Returns:
+        (float): loading time [ms]
+    """
+    time0 = time.time()
+
+    if not roles:
+        # referenced by another object, but not part of the container
+        prerequisites.append(_instance.get_hardware_object(node))
+        return 1000 * (time.time() - time0)
+
+    for role, config_file in roles:
+        fname, fext = os.path.splitext(config_file)
+        if fext == ".yml":
+            load_from_yaml(config_file, role=role, _container=container, _table=table)
+        elif fext == ".xml":
+            msg1 = ""
+            time1 = time.time()
+            class_name1 = ""
+            try:
+                hwobj = _instance.get_hardware_object(fname)
+                if hwobj is None:
+                    msg1 = "No object loaded"
+                    class_name1 = "None"
+                else:
+                    class_name1 = hwobj.__class__.__name__
+                    if hasattr(container, role):
+                        container.replace_object(role, hwobj)
+                    else:
+                        msg1 = "No such role: %s.%s" % (class_name, role)
+            except Exception as ex:
+                msg1 = "Loading error (%s)" % str(ex)
+            load_time = 1000 * (time.time() - time1)
+            table.append((role, class_name1, config_file, "%.1d" % load_time, msg1))
+
+    return 1000 * (time.time() - time0)
+
+
 def add_hardware_objects_dirs(ho_dirs):
     """Adds directories with xml/yaml config files
 
@@ -272,6 +448,7 @@ def init_hardware_repository(configuration_path):
     """
     global _instance
     global beamline
+    global configuration_cache
 
     if _instance is not None or beamline is not None:
         raise RuntimeError(
@@ -287,6 +464,14 @@ def init_hardware_repository(configuration_path):
         configuration_path = lookup_path
 
     logging.getLogger("HWR").info("Hardware repository: %s", configuration_path)
+    if CONFIGURATION_CACHE_DIRECTORY:
+        from .ConfigurationCache import ConfigurationCache
+
+        configuration_cache = ConfigurationCache(
+            CONFIGURATION_CACHE_DIRECTORY
+        )
+    else:
+        configuration_cache = None
     _instance = __HardwareRepositoryClient(configuration_path)
     _instance.connect()
     beamline = load_from_yaml(BEAMLINE_CONFIG_FILE, role="beamline")
@@ -326,8 +511,12 @@ class __HardwareRepositoryClient:
         self.__connected = False
         self.server = None
         self.hwobj_info_list = []
+        self.hwobj_wait_times = {}
+        self.load_summary = {}
         self.invalid_hardware_objects = None
         self.hardware_objects = None
+        # name -> (loading greenlet, event set when loaded)
+        self._loading = {}
 
     def connect(self):
         if self.__connected:
@@ -378,6 +567,34 @@ class __HardwareRepositoryClient:
                 "Could not execute 'require' on Hardware Repository server"
             )
 
+    def get_references(self, hwobj_name):
+        """Return the names of the objects referenced in a Hardware Object file
+
+        Args:
+            hwobj_name (str): name of the Hardware Object, e.g. /motors/m0
+
+        Returns:
+            (list): referenced Hardware Object names, empty if the file
+                is not found or cannot be parsed
+        """
+        file_path = self.find_in_repository(hwobj_name + os.path.extsep + "xml")
+        if file_path is None:
+            return []
+        try:
+            with open(file_path, "r") as xml_file:
+                xml_data = xml_file.read()
+            events = None
+            if configuration_cache is not None:
+                events = configuration_cache.get_xml_events(file_path, xml_data)
+            return HardwareObjectFileParser.get_references(
+                xml_data, hwobj_name, events
+            )
+        except Exception:
+            logging.getLogger("HWR").exception(
+                "Cannot get references of Hardware Object %s", hwobj_name
+            )
+            return []
+
     def _load_hardware_object(self, hwobj_name=""):
         """
         Load a Hardware Object. Do NOT use externally,
@@ -391,6 +608,7 @@ class __HardwareRepositoryClient:
         class_name = ""
         hwobj_instance = None
         xml_data = ""
+        file_path = None
 
         for xml_files_path in self.server_address:
             file_name = (
@@ -410,7 +628,7 @@ class __HardwareRepositoryClient:
 
         if xml_data:
             try:
-                hwobj_instance = self.parse_xml(xml_data, hwobj_name)
+                hwobj_instance = self.parse_xml(xml_data, hwobj_name, file_path)
                 if isinstance(hwobj_instance, string_types):
                     # We have redirection to another file
                     # Enter in dictionaries also under original names
@@ -480,7 +698,7 @@ class __HardwareRepositoryClient:
             (
                 hwobj_name,
                 class_name,
-                "%d ms" % (time_delta.microseconds / 1000),
+                "%d ms" % (time_delta.total_seconds() * 1000),
                 comment,
             )
         )
@@ -511,18 +729,28 @@ class __HardwareRepositoryClient:
 
         dispatcher.send("hardwareObjectDiscarded", ho_name, self)
 
-    def parse_xml(self, xml_string, ho_name):
+    def parse_xml(self, xml_string, ho_name, file_path=None):
         """Load a Hardware Object from its XML string representation
 
         Parameters :
           xml_string -- the XML string
           ho_name -- the name of the Hardware Object to load (i.e. '/motors/m0')
+          file_path -- the file the XML string was read from, to use the
+            configuration cache
 
         Return :
           the Hardware Object, or None if it fails
         """
         try:
-            hardware_obj = HardwareObjectFileParser.parse_string(xml_string, ho_name)
+            if configuration_cache is None or file_path is None:
+                hardware_obj = HardwareObjectFileParser.parse_string(
+                    xml_string, ho_name
+                )
+            else:
+                events = configuration_cache.get_xml_events(file_path, xml_string)
+                hardware_obj = HardwareObjectFileParser.parse_events(
+                    events, xml_string, ho_name
+                )
         except Exception:
             logging.getLogger("HWR").exception(
                 "Cannot parse Hardware Repository file %s", ho_name
@@ -643,8 +871,23 @@ class __HardwareRepositoryClient:
 
                 if object_name in self.hardware_objects:
                     hardware_obj = self.hardware_objects[object_name]
+                elif object_name in self._loading:
+                    loading_greenlet, loaded = self._loading[object_name]
+                    if loading_greenlet is gevent.getcurrent():
+                        # cyclic reference
+                        return None
+                    # being loaded concurrently
+                    loaded.wait()
+                    hardware_obj = self.hardware_objects.get(object_name)
                 else:
-                    hardware_obj = self._load_hardware_object(object_name)
+                    self._loading[object_name] = (
+                        gevent.getcurrent(),
+                        gevent.event.Event(),
+                    )
+                    try:
+                        hardware_obj = self._load_hardware_object(object_name)
+                    finally:
+                        self._loading.pop(object_name)[1].set()
                 return hardware_obj
         except TypeError as err:
             logging.getLogger("HWR").exception(
@@ -880,22 +1123,36 @@ class __HardwareRepositoryClient:
             logging.getLogger("HWR").exception("an error occured inside the timerEvent")
 
     def print_report(self):
+        header = ("xml", "Class", "Load time", "Wait time", "Comment")
+        rows = []
+        for hwobj_name, class_name, load_time, comment in self.hwobj_info_list:
+            wait_time = self.hwobj_wait_times.get(hwobj_name)
+            wait_time = "" if wait_time is None else "%d ms" % wait_time
+            rows.append((hwobj_name, class_name, load_time, wait_time, comment))
+
         longest_cols = [
-            (max([len(str(row[i])) for row in self.hwobj_info_list]) + 3)
-            for i in range(len(self.hwobj_info_list[0]))
+            (max([len(str(row[i])) for row in rows + [header]]) + 3)
+            for i in range(len(header))
         ]
         row_format = "| ".join(
             ["{:<" + str(longest_col) + "}" for longest_col in longest_cols]
         )
 
         print("+", "=" * sum(longest_cols), "+")
-        print("| %s" % row_format.format(*("xml", "Class", "Load time", "Comment")))
+        print("| %s" % row_format.format(*header))
         print("+", "=" * sum(longest_cols), "+")
 
-        for row in sorted(self.hwobj_info_list):
+        for row in sorted(rows):
             print("| %s" % row_format.format(*row))
         print("+", "=" * sum(longest_cols), "+")
 
+        if self.load_summary:
+            print(
+                "| Wall clock time: %d ms, critical path: %d ms"
+                % (self.load_summary["wall_clock"], self.load_summary["critical_path"])
+            )
+            print("+", "=" * sum(longest_cols), "+")
+
     def reload_hardware_objects(self):
         """
         Reloads all modified modules.
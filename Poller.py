@@ -1,9 +1,23 @@
+"""Polling of callables at a given period
+
+All pollers are run by a shared polling scheduler: a small pool of native
+worker threads that picks the next poller to run from a heap ordered on
+next due time. A worker stuck in a slow call is replaced by a new one, so
+a hung read does not stop the other pollers. Results and errors are handed
+back to the gevent loop through the poller's async watcher, so callbacks
+are always executed in the main (gevent) thread.
+"""
+
 from dispatcher import saferef
 import gevent
 import gevent.monkey
 from gevent import _threading
-from gevent.queue import Queue, Empty
 from gevent.event import Event
+import collections
+import heapq
+import itertools
+import sys
+import time
 import numpy
 
 import logging
@@ -12,8 +26,17 @@ log = logging.getLogger("HWR")
 
 POLLERS = {}
 
+# number of native threads running the pollers
+POLLING_WORKERS = 4
+
+# a worker busy with one call for longer than this [s] is replaced
+SLOW_CALL_TIMEOUT = 5
+
 gevent_version = list(map(int,gevent.__version__.split('.')))
 
+# time.sleep may be patched by gevent, the workers are native threads
+_native_sleep = gevent.monkey.get_original("time", "sleep")
+
 class _NotInitializedValue:
     pass
 
@@ -64,6 +87,188 @@ def poll(
     return poller
 
 
+def _acquire(lock, timeout):
+    """Acquire a native lock, waiting at most timeout [s]
+
+    Python 2 locks have no timeout: the lock is then tried at short
+    intervals until the timeout expires.
+
+    Returns:
+        (bool): True if the lock was acquired
+    """
+    if sys.version_info[0] >= 3:
+        return lock.acquire(True, timeout)
+    end_time = time.time() + timeout
+    while not lock.acquire(False):
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            return False
+        _native_sleep(min(remaining, 0.002))
+    return True
+
+
+def get_scheduler():
+    """Return the polling scheduler shared by all pollers
+
+    Returns:
+        (_PollingScheduler): the scheduler, started on first use
+    """
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = _PollingScheduler(POLLING_WORKERS)
+    return _SCHEDULER
+
+
+def get_statistics():
+    """Return the timing statistics of all active pollers
+
+    Returns:
+        (dict): poller id -> statistics dictionary, see _Poller.get_statistics
+    """
+    return dict(
+        (poller_id, poller.get_statistics())
+        for poller_id, poller in list(POLLERS.items())
+    )
+
+
+class _PollingScheduler:
+    """Run pollers from a fixed pool of native threads
+
+    Pollers are kept in a heap of (due time, sequence number, poller).
+    A worker pops the first due poller, runs it once and pushes it back
+    with its next due time, unless the poller stopped. A poller is never
+    in the heap while it runs, so one poller is never run concurrently
+    by two workers.
+
+    A watchdog thread starts a new worker in place of each worker busy
+    with one call for longer than slow_call_timeout; the slow worker
+    exits once its call returns.
+    """
+
+    def __init__(self, nb_workers=1, slow_call_timeout=SLOW_CALL_TIMEOUT):
+        self.nb_workers = max(1, int(nb_workers))
+        self.slow_call_timeout = slow_call_timeout
+        self._heap = []
+        self._sequence = itertools.count()
+        self._lock = _threading.Lock()
+        # binary semaphore used to wake up sleeping workers
+        self._wakeup = _threading.Lock()
+        self._wakeup.acquire()
+        self._wakeup_pending = False
+        self._workers_started = False
+        self._worker_ids = itertools.count()
+        # worker id -> start time of its current call
+        self._busy = {}
+        self._replaced = set()
+        self._replaced_workers = 0
+
+    def add(self, poller, delay=0):
+        """Schedule a poller
+
+        Args:
+            poller (_Poller): poller to run
+            delay (float): delay before the first run [s]
+        """
+        self._push(poller, time.time() + delay)
+
+        if not self._workers_started:
+            self._workers_started = True
+            for _ in range(self.nb_workers):
+                self._start_worker()
+            _threading.start_new_thread(self._watch, ())
+
+    def get_queue_length(self):
+        """Return the number of pollers waiting to be run"""
+        return len(self._heap)
+
+    def get_replaced_workers(self):
+        """Return the number of workers replaced because of a slow call"""
+        return self._replaced_workers
+
+    def _start_worker(self):
+        _threading.start_new_thread(self._run, (next(self._worker_ids),))
+
+    def _watch(self):
+        while True:
+            _native_sleep(self.slow_call_timeout / 5.0)
+            slow_time = time.time() - self.slow_call_timeout
+            with self._lock:
+                slow_workers = [
+                    worker_id
+                    for worker_id, start_time in self._busy.items()
+                    if start_time < slow_time and worker_id not in self._replaced
+                ]
+                self._replaced.update(slow_workers)
+                self._replaced_workers += len(slow_workers)
+            for worker_id in slow_workers:
+                self._start_worker()
+
+    def _push(self, poller, due_time):
+        with self._lock:
+            earliest = self._heap[0][0] if self._heap else None
+            heapq.heappush(self._heap, (due_time, next(self._sequence), poller))
+        if earliest is None or due_time < earliest:
+            self._wake()
+
+    def _wake(self):
+        with self._lock:
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+        self._wakeup.release()
+
+    def _wait(self, timeout):
+        if timeout is None:
+            acquired = self._wakeup.acquire()
+        else:
+            acquired = _acquire(self._wakeup, timeout)
+        if acquired:
+            with self._lock:
+                self._wakeup_pending = False
+
+    def _run(self, worker_id):
+        while True:
+            poller = None
+            timeout = None
+            more_due = False
+
+            with self._lock:
+                if self._heap:
+                    due_time = self._heap[0][0]
+                    timeout = due_time - time.time()
+                    if timeout <= 0:
+                        poller = heapq.heappop(self._heap)[2]
+                        more_due = bool(self._heap) and self._heap[0][0] <= time.time()
+
+            if poller is None:
+                self._wait(timeout)
+                continue
+
+            if more_due and self.nb_workers > 1:
+                # let another worker take the next due poller
+                self._wake()
+
+            if poller.is_stopped():
+                continue
+
+            with self._lock:
+                self._busy[worker_id] = time.time()
+            next_due_time = poller.run_once(due_time)
+            with self._lock:
+                del self._busy[worker_id]
+                replaced = worker_id in self._replaced
+                self._replaced.discard(worker_id)
+
+            if next_due_time is not None and not poller.is_stopped():
+                self._push(poller, next_due_time)
+            if replaced:
+                # a new worker took over while this one was busy
+                return
+
+
+_SCHEDULER = None
+
+
 class _Poller:
     def __init__(
         self,
@@ -82,18 +287,32 @@ class _Poller:
         self.error_callback_ref = saferef.safe_ref(error_callback)
         self.compare = compare
         self.old_res = NotInitializedValue
-        self.queue = Queue()
+        # filled by the scheduler thread, emptied by the gevent loop
+        self.queue = collections.deque()
         self.delay = 0
         self.stop_event = Event()
+        self.name = getattr(polled_call, "__qualname__", repr(polled_call))
+        self._statistics = {
+            "calls": 0,
+            "errors": 0,
+            "overruns": 0,
+            "last_latency": 0,
+            "max_latency": 0,
+            "total_latency": 0,
+            "max_jitter": 0,
+            "total_jitter": 0,
+        }
 
         if gevent_version < [1,3,0]:
-            self.async_watcher = gevent.get_hub().loop.async()
+            # 'async' is a keyword from Python 3.7
+            self.async_watcher = getattr(gevent.get_hub().loop, "async")()
         else:
             self.async_watcher = gevent.get_hub().loop.async_()
 
     def start_delayed(self, delay):
         self.delay = delay
-        _threading.start_new_thread(self.run, ())
+        self.async_watcher.start(self.new_event)
+        get_scheduler().add(self, delay / 1000.0)
 
     def stop(self):
         self.stop_event.set()
@@ -111,6 +330,32 @@ class _Poller:
     def set_polling_period(self, polling_period):
         self.polling_period = polling_period
 
+    def get_statistics(self):
+        """Return timing statistics of the poller
+
+        Latency is the duration of the polled call, jitter the delay
+        between the due time and the actual start of the call, and
+        overruns the number of calls that could not start in time for
+        the next period. Times are in ms.
+
+        Returns:
+            (dict): statistics
+        """
+        stats = dict(self._statistics)
+        calls = stats.pop("calls")
+        total_latency = stats.pop("total_latency")
+        total_jitter = stats.pop("total_jitter")
+        stats.update(
+            {
+                "name": self.name,
+                "polling_period": self.polling_period,
+                "calls": calls,
+                "mean_latency": total_latency / calls if calls else 0,
+                "mean_jitter": total_jitter / calls if calls else 0,
+            }
+        )
+        return stats
+
     def restart(self, delay=0):
         self.stop()
 
@@ -132,8 +377,8 @@ class _Poller:
     def new_event(self):
         while True:
             try:
-                res = self.queue.get_nowait()
-            except Empty:
+                res = self.queue.popleft()
+            except IndexError:
                 break
 
             if isinstance(res, PollingException):
@@ -145,64 +390,78 @@ class _Poller:
                 if cb is not None:
                     gevent.spawn(cb, res)
 
-    def run(self):
-        sleep = gevent.monkey._get_original("time", ["sleep"])[0]
+    def run_once(self, due_time):
+        """Call the polled function once, from a scheduler thread
 
-        self.async_watcher.start(self.new_event)
-        err_callback_args = None
-        error_cb = None
-        first_run = True
-
-        while not self.stop_event.is_set():
-            if first_run and self.delay:
-                sleep(self.delay / 1000.0)
-            first_run = False
-
-            if self.stop_event.is_set():
-                break
+        Args:
+            due_time (float): time at which the call was scheduled
 
-            polled_call = self.polled_call_ref()
-            if polled_call is None:
-                break
+        Returns:
+            (float): time of the next call, or None if the poller has to stop
+        """
+        if self.stop_event.is_set():
+            return None
 
-            try:
-                res = polled_call(*self.args)
-            except Exception as e:
-                if self.stop_event.is_set():
-                    break
-                error_cb = self.error_callback_ref()
-                if error_cb is not None:
-                    self.queue.put(PollingException(e, self.get_id()))
-                break
-
-            del polled_call
+        polled_call = self.polled_call_ref()
+        if polled_call is None:
+            return None
 
+        start_time = time.time()
+        try:
+            res = polled_call(*self.args)
+        except Exception as e:
             if self.stop_event.is_set():
-                break
+                return None
+            self._statistics["errors"] += 1
+            error_cb = self.error_callback_ref()
+            if error_cb is not None:
+                self.queue.append(PollingException(e, self.get_id()))
+                self.async_watcher.send()
+            return None
+        finally:
+            del polled_call
+            self._update_statistics(due_time, start_time, time.time())
 
-            if isinstance(res, numpy.ndarray):  # for arrays
-                comparison = res == self.old_res
-                if isinstance(comparison, bool):
-                    is_equal = comparison
-                else:
-                    is_equal = all(comparison)
-            else:
-                is_equal = res == self.old_res
+        if self.stop_event.is_set():
+            return None
 
-            if self.compare and is_equal:
-                # do nothing: previous value is the same as "new" value
-                pass
+        if isinstance(res, numpy.ndarray):  # for arrays
+            comparison = res == self.old_res
+            if isinstance(comparison, bool):
+                is_equal = comparison
             else:
-                new_value = True
-                if self.compare:
-                    new_value = not is_equal
-
-                if new_value:
-                    self.old_res = res
-                    self.queue.put(res)
-                    self.async_watcher.send()
-
-            sleep(self.polling_period / 1000.0)
+                is_equal = all(comparison)
+        else:
+            is_equal = res == self.old_res
 
-        if error_cb is not None:
-            self.async_watcher.send()
+        if self.compare and is_equal:
+            # do nothing: previous value is the same as "new" value
+            pass
+        else:
+            new_value = True
+            if self.compare:
+                new_value = not is_equal
+
+            if new_value:
+                self.old_res = res
+                self.queue.append(res)
+                self.async_watcher.send()
+
+        next_due_time = due_time + self.polling_period / 1000.0
+        now = time.time()
+        if next_due_time < now:
+            # do not try to catch up missed periods
+            self._statistics["overruns"] += 1
+            next_due_time = now
+        return next_due_time
+
+    def _update_statistics(self, due_time, start_time, end_time):
+        stats = self._statistics
+        latency = (end_time - start_time) * 1000
+        jitter = max(0, (start_time - due_time) * 1000)
+        stats["calls"] += 1
+        stats["last_latency"] = latency
+        stats["max_latency"] = max(latency, stats["max_latency"])
+        stats["total_latency"] += latency
+        stats["max_jitter"] = max(jitter, stats["max_jitter"])
+        stats["total_jitter"] += jitter
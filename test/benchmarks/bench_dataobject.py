@@ -0,0 +1,109 @@
+"""Creation and mutation time of a DataObject of ~100 keys, compared to
+the former implementation (validation of the whole object with
+jsonschema.validate, deep copies of the whole dict)
+
+Usage:
+    python -m HardwareRepository.test.benchmarks.bench_dataobject
+"""
+
+from __future__ import division, print_function
+
+import copy
+import time
+
+import jsonschema
+
+from HardwareRepository.utils.dataobject import DataObject
+
+NB_KEYS = 100
+
+SCHEMA = {
+    "type": "object",
+    "properties": dict(
+        [("number_%d" % index, {"type": "number"}) for index in range(NB_KEYS // 2)]
+        + [("string_%d" % index, {"type": "string"}) for index in range(NB_KEYS // 4)]
+        + [
+            ("array_%d" % index, {"type": "array", "items": {"type": "number"}})
+            for index in range(NB_KEYS // 4)
+        ]
+    ),
+    "required": ["number_0"],
+}
+
+
+def make_parameters():
+    parameters = {}
+    for key, schema in SCHEMA["properties"].items():
+        if schema["type"] == "number":
+            parameters[key] = 1.5
+        elif schema["type"] == "string":
+            parameters[key] = "/data/visitor/mx1234/id30a1/20200101/RAW_DATA"
+        else:
+            parameters[key] = [0.1, 0.2, 0.3, 0.4]
+    return parameters
+
+
+class FormerDataObject(dict):
+    """The former DataObject core"""
+
+    _SCHEMA = SCHEMA
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.validate()
+        self._mutations = []
+        self._original = copy.deepcopy(dict(self))
+        self._previous = copy.deepcopy(dict(self))
+
+    def dangerously_set(self, key, value):
+        dict.__setitem__(self, key, value)
+        try:
+            self.validate()
+        except jsonschema.exceptions.ValidationError:
+            dict.__setitem__(self, key, self._previous[key])
+            raise
+        else:
+            self._mutations.append((key, value))
+            self._previous = copy.deepcopy(dict(self))
+
+    def validate(self):
+        jsonschema.validate(instance=self, schema=self._SCHEMA)
+
+
+class ParametersDataObject(DataObject):
+    VERBOSE = False
+    _SCHEMA = SCHEMA
+
+
+def run(data_object_class, parameters, nb_objects, nb_mutations):
+    start = time.time()
+    for _ in range(nb_objects):
+        data_object_class(parameters)
+    creation_time = (time.time() - start) / nb_objects
+
+    data_object = data_object_class(parameters)
+    start = time.time()
+    for index in range(nb_mutations):
+        data_object.dangerously_set("number_%d" % (index % 10), float(index))
+        data_object.dangerously_set("array_0", [float(index)] * 4)
+    mutation_time = (time.time() - start) / (2 * nb_mutations)
+    return creation_time, mutation_time
+
+
+def main():
+    parameters = make_parameters()
+    former = run(FormerDataObject, parameters, 50, 50)
+    new = run(ParametersDataObject, parameters, 50, 500)
+    print("%d keys" % len(parameters))
+    print("%-22s %-12s %-12s %s" % ("", "former [ms]", "new [ms]", "speedup"))
+    for name, former_time, new_time in zip(
+        ("creation", "dangerously_set"), former, new
+    ):
+        print(
+            "%-22s %-12.3f %-12.3f %.0fx"
+            % (name, former_time * 1000, new_time * 1000, former_time / new_time)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Throughput of the Exporter stream framing: byte loop v. FrameParser
+
+Usage:
+    python -m HardwareRepository.test.benchmarks.bench_exporter_framing
+"""
+
+from __future__ import division, print_function
+
+import time
+
+from HardwareRepository.Command.exporter.StandardClient import (
+    FrameParser,
+    MAX_SIZE_STREAM_MSG,
+    STX,
+    ETX,
+    empty_buffer,
+    _bytes,
+)
+
+
+class BytewiseParser(object):
+    """The byte by byte parser formerly used in StandardClient.recv_thread"""
+
+    def __init__(self):
+        self.buffer = empty_buffer()
+        self.received_stx = False
+
+    def feed(self, data):
+        frames = []
+        for b in data:
+            if b == STX:
+                self.buffer = empty_buffer()
+                self.received_stx = True
+            elif b == ETX:
+                if self.received_stx:
+                    frames.append(self.buffer)
+                    self.received_stx = False
+                    self.buffer = empty_buffer()
+            else:
+                if self.received_stx:
+                    self.buffer += _bytes([b])
+
+        if len(self.buffer) > MAX_SIZE_STREAM_MSG:
+            self.received_stx = False
+            self.buffer = empty_buffer()
+        return frames
+
+
+def make_stream(frame_size, nb_frames):
+    payload = b"RET:" + b"1.2345\x1f" * (frame_size // 7)
+    return (b"\x02" + payload + b"\x03") * nb_frames
+
+
+def run(parser, stream, chunk_size):
+    start = time.time()
+    nb_frames = 0
+    for pos in range(0, len(stream), chunk_size):
+        nb_frames += len(parser.feed(stream[pos : pos + chunk_size]))
+    return nb_frames, time.time() - start
+
+
+def main():
+    print(
+        "%-12s %-10s %-14s %-16s %s"
+        % ("frame size", "chunk", "bytewise MB/s", "FrameParser MB/s", "speedup")
+    )
+    for frame_size, nb_frames, chunk_size in (
+        (50, 20000, 4096),
+        (5000, 200, 4096),
+        (100000, 10, 4096),
+        (100000, 10, 65536),
+    ):
+        stream = make_stream(frame_size, nb_frames)
+        mbytes = len(stream) / 1e6
+        old_frames, old_time = run(BytewiseParser(), stream, chunk_size)
+        new_frames, new_time = run(FrameParser(), stream, chunk_size)
+        assert old_frames == new_frames == nb_frames
+        print(
+            "%-12d %-10d %-14.1f %-16.1f %.0fx"
+            % (
+                frame_size,
+                chunk_size,
+                mbytes / old_time,
+                mbytes / new_time,
+                old_time / new_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
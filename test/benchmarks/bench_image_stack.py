@@ -0,0 +1,123 @@
+"""Time to the first frame, playback time and peak memory of a flat field
+corrected imaging scan, compared to the former implementation (all frames
+read into lists, each displayed frame corrected in float64 and kept)
+
+Usage:
+    python -m HardwareRepository.test.benchmarks.bench_image_stack
+"""
+
+from __future__ import division, print_function
+
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from HardwareRepository.utils.image_stack import ImageStack
+
+FRAMES_NUM = 720
+FF_NUM = 10
+SHAPE = (512, 512)
+
+
+def write_scan(directory):
+    rng = np.random.RandomState(0)
+    raw_filename_list = []
+    ff_filename_list = []
+    for index in range(FF_NUM):
+        filename = os.path.join(directory, "ff_%05d.npy" % index)
+        np.save(filename, rng.randint(500, 1500, SHAPE).astype(np.uint16))
+        ff_filename_list.append(filename)
+    for index in range(FRAMES_NUM):
+        filename = os.path.join(directory, "raw_%05d.npy" % index)
+        np.save(filename, rng.randint(100, 4000, SHAPE).astype(np.uint16))
+        raw_filename_list.append(filename)
+    return raw_filename_list, ff_filename_list
+
+
+def former_play(raw_filename_list, ff_filename_list):
+    ff_image_list = [np.load(filename) for filename in ff_filename_list]
+    raw_image_list = [np.load(filename) for filename in raw_filename_list]
+    first_frame_time = time.time()
+    first = raw_image_list[0].astype(float)
+    corrected = np.divide(
+        first, ff_image_list[0], out=np.ones_like(first), where=ff_image_list[0] != 0
+    )
+    low, high = corrected[8:].min(), corrected[8:].max()
+
+    ff_corrected_list = [None] * len(raw_image_list)
+    for index, raw_image in enumerate(raw_image_list):
+        ff_image = ff_image_list[
+            int(index / len(raw_image_list) * len(ff_image_list))
+        ].astype(float)
+        ff_corrected_image = np.divide(
+            raw_image.astype(float),
+            ff_image,
+            out=np.ones_like(raw_image.astype(float)),
+            where=ff_image != 0,
+        )
+        im = 255.0 * (ff_corrected_image - low) / (high - low)
+        ff_corrected_list[index] = im.astype(np.uint16)
+        ff_corrected_list[index].astype(np.uint8)
+    return first_frame_time
+
+
+def new_play(raw_filename_list, ff_filename_list):
+    stack = ImageStack(raw_filename_list, np.load, ff_filename_list)
+    for index in range(len(stack)):
+        stack.read_ahead(index, ff_apply=True)
+        stack.get_frame(index, ff_apply=True)
+        if not index:
+            first_frame_time = time.time()
+    statistics = stack.get_statistics()
+    stack.close()
+    return first_frame_time, statistics
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        filename_lists = write_scan(directory)
+        print(
+            "%d frames of %d x %d, %d flat field images"
+            % ((FRAMES_NUM,) + SHAPE + (FF_NUM,))
+        )
+
+        for name, function in (("former", former_play), ("new", new_play)):
+            tracemalloc.start()
+            start = time.time()
+            result = function(*filename_lists)
+            end = time.time()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            first_frame_time = result[0] if name == "new" else result
+            print(
+                "%-8s first frame %6.0f ms, playback %6.0f ms, peak memory %6.1f MB"
+                % (
+                    name,
+                    (first_frame_time - start) * 1000,
+                    (end - start) * 1000,
+                    peak / 1e6,
+                )
+            )
+        statistics = result[1]
+        print(
+            "new stack: %d cached frames (%.1f MB), %.0f frames/s per thread, "
+            "%d hits, %d misses"
+            % (
+                statistics["cached_frames"],
+                statistics["cache_bytes"] / 1e6,
+                statistics["decode_rate"],
+                statistics["hits"],
+                statistics["misses"],
+            )
+        )
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
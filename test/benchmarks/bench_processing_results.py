@@ -0,0 +1,203 @@
+"""Online processing result update rate, in frames per second, and end of
+mesh processing time (realignment, best positions, csv file), compared to
+the former implementation (per frame and per key writes, grid lookup of
+each cell, numpy.append of streamed values, full sort, one csv line
+written per frame)
+
+Usage:
+    python -m HardwareRepository.test.benchmarks.bench_processing_results
+"""
+
+from __future__ import division, print_function
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from HardwareRepository.utils.processing_results import (
+    ProcessingResults,
+    get_best_indices,
+    get_col_row_index,
+    save_csv,
+)
+
+NB_COLS = 400
+NB_ROWS = 250
+NB_FRAMES = NB_COLS * NB_ROWS
+BATCH_SIZE = 100
+KEYS = ("spots_num", "spots_resolution", "score")
+
+
+class Grid(object):
+    """Mesh scanned line by line"""
+
+    def get_col_row_from_image(self, image_num):
+        row, col = divmod(image_num, NB_COLS)
+        return col, row
+
+    def get_col_row_from_image_serial(self, image_serial):
+        return self.get_col_row_from_image(image_serial - 1)
+
+
+def make_batches():
+    batches = []
+    for start in range(0, NB_FRAMES, BATCH_SIZE):
+        batches.append(
+            [
+                (frame, frame % 50, frame % 7 + 0.5, 2.5)
+                for frame in range(start, start + BATCH_SIZE)
+            ]
+        )
+    return batches
+
+
+def former(grid, batches):
+    results_raw = dict((key, np.zeros(NB_FRAMES)) for key in KEYS)
+    results_aligned = dict((key, np.zeros((NB_COLS, NB_ROWS))) for key in KEYS)
+    average_intensity = np.zeros(0)
+    start = time.time()
+    for batch in batches:
+        for image in batch:
+            frame_num = int(image[0])
+            results_raw["spots_num"][frame_num] = image[1]
+            results_raw["spots_resolution"][frame_num] = 1 / image[3]
+            results_raw["score"][frame_num] = image[2]
+            for score_key in results_raw.keys():
+                col, row = grid.get_col_row_from_image(frame_num)
+                results_aligned[score_key][col][row] = results_raw[score_key][
+                    frame_num
+                ]
+            average_intensity = np.append(average_intensity, image[2])
+    return time.time() - start
+
+
+def new(grid, batches):
+    results = ProcessingResults()
+    for key in KEYS:
+        results.allocate(key, NB_FRAMES, (NB_COLS, NB_ROWS))
+    results.allocate("average_intensity", 0)
+    start = time.time()
+    results.set_grid_index(
+        *get_col_row_index(grid.get_col_row_from_image, NB_FRAMES, (NB_COLS, NB_ROWS))
+    )
+    for batch in batches:
+        batch = np.array(batch, dtype=float)
+        results.set_values(
+            batch[:, 0].astype(int),
+            {
+                "spots_num": batch[:, 1],
+                "spots_resolution": 1 / batch[:, 3],
+                "score": batch[:, 2],
+            },
+        )
+        for value in batch[:, 2]:
+            results.append("average_intensity", value)
+    return time.time() - start
+
+
+def former_end_of_mesh(grid, results_raw, results_aligned, csv_path):
+    start = time.time()
+    for score_key in results_raw.keys():
+        for cell_index in range(NB_FRAMES):
+            col, row = grid.get_col_row_from_image_serial(cell_index + 1)
+            if (
+                col < results_aligned[score_key].shape[0]
+                and row < results_aligned[score_key].shape[1]
+            ):
+                results_aligned[score_key][col][row] = results_raw[score_key][
+                    cell_index
+                ]
+    best = [
+        index
+        for index in (-results_raw["score"]).argsort()[:10]
+        if results_raw["score"][index] > 0
+    ]
+    with open(csv_path, "w") as csv_file:
+        for index in range(NB_FRAMES):
+            csv_file.write(
+                "%d,%f,%d,%f\n"
+                % (
+                    index,
+                    results_raw["score"][index],
+                    results_raw["spots_num"][index],
+                    results_raw["spots_resolution"][index],
+                )
+            )
+    return time.time() - start, best
+
+
+def new_end_of_mesh(results, csv_path):
+    start = time.time()
+    results.align(np.arange(NB_FRAMES - BATCH_SIZE, NB_FRAMES))
+    best = get_best_indices(results.raw["score"], 10).tolist()
+    with open(csv_path, "w") as csv_file:
+        save_csv(
+            csv_file,
+            (
+                np.arange(NB_FRAMES),
+                results.raw["score"],
+                results.raw["spots_num"],
+                results.raw["spots_resolution"],
+            ),
+            ("%d", "%f", "%d", "%f"),
+        )
+    return time.time() - start, best
+
+
+def end_of_mesh(grid):
+    results = ProcessingResults()
+    for key in KEYS:
+        results.allocate(key, NB_FRAMES, (NB_COLS, NB_ROWS))
+    results.set_grid_index(
+        *get_col_row_index(
+            lambda index: grid.get_col_row_from_image_serial(index + 1),
+            NB_FRAMES,
+            (NB_COLS, NB_ROWS),
+        )
+    )
+    frames = np.arange(NB_FRAMES)
+    results.set_values(
+        frames,
+        {
+            "spots_num": frames % 50,
+            "spots_resolution": np.full(NB_FRAMES, 2.5),
+            "score": (frames * 7919) % 10007 / 100.0,
+        },
+    )
+    csv_path = tempfile.mktemp(suffix=".csv")
+    try:
+        former_time, former_best = former_end_of_mesh(
+            grid, results.raw, dict(results.aligned), csv_path
+        )
+        new_time, new_best = new_end_of_mesh(results, csv_path)
+    finally:
+        os.remove(csv_path)
+    assert [results.raw["score"][index] for index in former_best] == [
+        results.raw["score"][index] for index in new_best
+    ]
+    return former_time, new_time
+
+
+def main():
+    grid = Grid()
+    batches = make_batches()
+    former_time = former(grid, batches)
+    new_time = new(grid, batches)
+    print("%d frames, batches of %d" % (NB_FRAMES, BATCH_SIZE))
+    print("%-14s %-14s %s" % ("", "frames/s", "speedup"))
+    print("%-14s %-14.0f" % ("former", NB_FRAMES / former_time))
+    print("%-14s %-14.0f %.0fx" % ("new", NB_FRAMES / new_time, former_time / new_time))
+
+    former_time, new_time = end_of_mesh(grid)
+    print("%-14s %-14s %s" % ("", "end of mesh", "speedup"))
+    print("%-14s %-14s" % ("former", "%.0f ms" % (former_time * 1000)))
+    print(
+        "%-14s %-14s %.0fx"
+        % ("new", "%.0f ms" % (new_time * 1000), former_time / new_time)
+    )
+
+
+if __name__ == "__main__":
+    main()
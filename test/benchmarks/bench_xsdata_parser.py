@@ -0,0 +1,100 @@
+"""Parse and export time of a dozor result of 20000 images, compared to
+the former implementation (minidom DOM, one write per indentation level),
+and peak memory of the parse
+
+Usage:
+    python -m HardwareRepository.test.benchmarks.bench_xsdata_parser
+"""
+
+from __future__ import division, print_function
+
+import os
+import tempfile
+import time
+import tracemalloc
+from io import StringIO
+from xml.dom import minidom
+
+import XSDataCommon
+import XSDataControlDozorv1_1
+
+from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
+from HardwareRepository.test.pytest.test_xsdata_parser import make_dozor_result
+
+IMAGES_NUM = 20000
+
+BINDING_MODULES = (XSDataCommon, XSDataControlDozorv1_1)
+
+
+def former_show_indent(outfile, level):
+    for idx in range(level):
+        outfile.write(u"    ")
+
+
+def former_parse(xml):
+    result = xsdata.XSDataResultControlDozor()
+    result.build(minidom.parseString(xml).documentElement)
+    # as parseString, check that all minOccurs are obeyed
+    result.export(StringIO(), 0, name_="XSDataResultControlDozor")
+
+
+def new_parse(xml):
+    xsdata.XSDataResultControlDozor.parseString(xml)
+
+
+def former_export(result, file_path):
+    show_indents = [module.showIndent for module in BINDING_MODULES]
+    for module in BINDING_MODULES:
+        module.showIndent = former_show_indent
+    try:
+        result.exportToFile(file_path)
+    finally:
+        for module, show_indent in zip(BINDING_MODULES, show_indents):
+            module.showIndent = show_indent
+
+
+def new_export(result, file_path):
+    result.exportToFile(file_path)
+
+
+def measure(function, *args):
+    start = time.time()
+    function(*args)
+    duration = time.time() - start
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main():
+    result = make_dozor_result(IMAGES_NUM)
+    xml = result.marshal()
+    file_path = os.path.join(tempfile.mkdtemp(), "dozor.xml")
+    print("%d images, %.1f MB" % (IMAGES_NUM, len(xml) / 1e6))
+    print(
+        "%-8s %-12s %-12s %-14s %s"
+        % ("", "former [ms]", "new [ms]", "former [MB]", "new [MB]")
+    )
+    for name, former, new, args in (
+        ("parse", former_parse, new_parse, (xml,)),
+        ("export", former_export, new_export, (result, file_path)),
+    ):
+        former_time, former_peak = measure(former, *args)
+        new_time, new_peak = measure(new, *args)
+        print(
+            "%-8s %-12.0f %-12.0f %-14.1f %.1f"
+            % (
+                name,
+                former_time * 1000,
+                new_time * 1000,
+                former_peak / 1e6,
+                new_peak / 1e6,
+            )
+        )
+    os.remove(file_path)
+
+
+if __name__ == "__main__":
+    main()
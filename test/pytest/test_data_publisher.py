@@ -0,0 +1,114 @@
+import math
+
+import pytest
+
+# needs redis
+DataPublisher = pytest.importorskip("HardwareRepository.HardwareObjects.DataPublisher")
+
+
+class FakePipeline(object):
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def rpush(self, key, *values):
+        self.commands.append((key, values))
+
+    def execute(self):
+        self.redis.pipelines += 1
+        for key, values in self.commands:
+            self.redis.rpush(key, *values)
+
+
+class FakePubSub(object):
+    def __init__(self, messages):
+        self.messages = messages
+
+    def psubscribe(self, pattern):
+        pass
+
+    def listen(self):
+        for channel, data in list(self.messages):
+            if not isinstance(data, bytes):
+                data = data.encode()
+            yield {"channel": channel.encode(), "data": data}
+
+
+class FakeRedis(object):
+    """In memory redis, the published messages are kept for the listeners"""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+        self.messages = []
+        self.pipelines = 0
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def publish(self, channel, data):
+        self.messages.append((channel, data))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self.messages)
+
+
+@pytest.fixture
+def publisher():
+    publisher = DataPublisher.DataPublisher("data-publisher")
+    publisher._r = publisher._raw_r = FakeRedis()
+    return publisher
+
+
+@pytest.mark.parametrize("data_dim", [1, 2])
+def test_pack_frame(data_dim):
+    points = [{"x": 1.0, "y": 2.5, "z": -1.0}, {"x": 2.0, "y": 3.5}]
+    frame = DataPublisher.pack_frame(points, data_dim)
+    assert frame[:1] == DataPublisher.BINARY_FRAME_MARKER
+
+    columns = DataPublisher.unpack_frame(frame)
+    assert columns["x"] == [1.0, 2.0]
+    assert columns["y"] == [2.5, 3.5]
+    if data_dim == 1:
+        assert "z" not in columns
+    else:
+        assert columns["z"][0] == -1.0 and math.isnan(columns["z"][1])
+
+
+@pytest.mark.parametrize("binary_frames", [False, True])
+def test_batched_publish(publisher, binary_frames):
+    publisher._batch_size = 3
+    publisher._binary_frames = binary_frames
+    publisher.register("1", "scan", "channel")
+    publisher.start("1")
+    for index in range(4):
+        publisher.pub("1", {"x": index, "y": index * 2.0})
+    publisher.stop("1")
+    # start, 3 points, the last point (flushed on stop), stop
+    assert len(publisher._r.messages) == 4
+
+    emitted = []
+    publisher.emit = lambda signal, *args: emitted.append((signal,) + args)
+    publisher._handle_messages()
+
+    points = [args[1]["data"] for args in emitted if args[0] == "data"]
+    assert points == [{"x": index, "y": index * 2.0} for index in range(4)]
+    assert publisher.get_data("1") == {"x": [0, 1, 2, 3], "y": [0, 2, 4, 6]}
+    # the stored points are written by batches as well
+    assert publisher._r.pipelines == 2
+    assert [args[0] for args in emitted if args[0] != "data"] == ["start", "end"]
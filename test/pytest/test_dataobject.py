@@ -4,12 +4,23 @@ from HardwareRepository.utils.dataobject import DataObject
 
 
 class MockDataObject(DataObject):
+    VERBOSE = False
     _SCHEMA = {
         "type": "object",
         "properties": {"value": {"type": "number"}, "limit": {"type": "number"}},
     }
 
 
+class MockRangeDataObject(DataObject):
+    VERBOSE = False
+    _SCHEMA = {
+        "type": "object",
+        "properties": {"values": {"type": "array", "items": {"type": "number"}}},
+        "additionalProperties": False,
+        "minProperties": 1,
+    }
+
+
 def test_object_creation():
     do = MockDataObject({"value": 2, "limit": 4})
 
@@ -63,3 +74,45 @@ def test_to_mutable():
     do_mutable["value"] = 4
 
     assert do.value != do_mutable["value"]
+
+
+def test_dangerously_set_new_key_not_valid():
+    do = MockRangeDataObject({"values": [1, 2]})
+
+    try:
+        do.dangerously_set("other", 1)
+    except jsonschema.exceptions.ValidationError:
+        assert "other" not in do
+    else:
+        assert False
+
+
+def test_snapshots_and_changes():
+    values = [1, 2]
+    do = MockRangeDataObject({"values": values})
+
+    values.append(3)
+    do.dangerously_set("values", [4])
+    do["values"].append(5)
+
+    assert do._original == {"values": [1, 2]}
+    assert do._previous == {"values": [4]}
+    assert do.get_changes() == {"values": ([1, 2], [4])}
+
+    do.dangerously_set("values", [1, 2])
+    assert do.get_changes() == {}
+    assert do._mutations == [("values", [4]), ("values", [1, 2])]
+
+
+def test_validator_compiled_once():
+    MockDataObject({"value": 2, "limit": 2})
+    validator = MockDataObject._validator
+
+    do = MockDataObject({"value": 2, "limit": 2})
+    do.dangerously_set("limit", 3)
+
+    assert MockDataObject._validator is validator
+    assert MockDataObject._property_validators["limit"] is not None
+    assert "_validator" not in MockRangeDataObject.__dict__ or (
+        MockRangeDataObject._validator is not validator
+    )
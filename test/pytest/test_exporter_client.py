@@ -0,0 +1,156 @@
+import gevent
+import gevent.server
+import numpy
+import pytest
+
+from HardwareRepository.Command.Exporter import Exporter, to_numpy_array
+from HardwareRepository.Command.exporter.StandardClient import (
+    FrameParser,
+    SocketError,
+    TimeoutError,
+)
+
+STX = b"\x02"
+ETX = b"\x03"
+
+PROPERTIES = {
+    "OmegaPosition": "12.5",
+    "KappaPosition": "3",
+    "State": "Ready",
+    "ScanData": "\x1f1.5\x1f2\x1f-3e2\x1f",
+}
+
+
+def _handle(sock, address):
+    """Minimal exporter server: replies in order, with an event in between"""
+    buffer = b""
+    while True:
+        data = sock.recv(4096)
+        if not data:
+            break
+        buffer += data
+        while ETX in buffer:
+            frame, buffer = buffer.split(ETX, 1)
+            cmd = frame.lstrip(STX).decode()
+            name = cmd.split(" ", 1)[1]
+            if name == "Hung":
+                # never replied
+                continue
+            if name == "Slow":
+                gevent.sleep(0.5)
+            sock.sendall(STX + b"EVT:State\tRunning\t0" + ETX)
+            gevent.sleep(0.01)
+            reply = "RET:" + PROPERTIES[name] if name in PROPERTIES else "ERR:unknown"
+            sock.sendall(STX + reply.encode() + ETX)
+
+
+@pytest.fixture
+def server():
+    server = gevent.server.StreamServer(("127.0.0.1", 0), _handle)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_read_properties(server, pipelined):
+    exporter = Exporter("127.0.0.1", server.server_port, pipelined=pipelined)
+    events = []
+    exporter.register("State", events.append)
+    try:
+        values = exporter.read_properties(["OmegaPosition", "Unknown", "KappaPosition"])
+        assert values == [12.5, None, 3]
+        assert exporter.read_property("State") == "Ready"
+        gevent.sleep(0)
+        assert events and events[0] == "Running"
+    finally:
+        exporter.stop()
+
+
+def test_pipelined_concurrent_reads(server):
+    exporter = Exporter("127.0.0.1", server.server_port, pipelined=True)
+    try:
+        names = list(PROPERTIES) * 5
+        greenlets = [gevent.spawn(exporter.read_property, name) for name in names]
+        gevent.joinall(greenlets, raise_error=True)
+        assert [greenlet.value for greenlet in greenlets] == [
+            exporter._to_python_value(PROPERTIES[name]) for name in names
+        ]
+    finally:
+        exporter.stop()
+
+
+def test_pipelined_timeout(server):
+    exporter = Exporter("127.0.0.1", server.server_port, pipelined=True)
+    try:
+        hung = gevent.spawn(exporter.read_properties, ["Hung"], 0.1)
+        gevent.sleep(0.05)
+        waiting = gevent.spawn(exporter.read_properties, ["Slow"], 5)
+        with pytest.raises(TimeoutError):
+            hung.get()
+        # the connection is dropped with the requests waiting for a reply
+        with pytest.raises(SocketError):
+            waiting.get(timeout=1)
+        assert not exporter.is_connected()
+        assert exporter.read_property("KappaPosition") == 3
+    finally:
+        exporter.stop()
+
+
+def test_typed_values(server):
+    exporter = Exporter("127.0.0.1", server.server_port)
+    try:
+        assert exporter.read_property("ScanData") == [1.5, 2.0, -300.0]
+        assert exporter._property_decoders["ScanData"] is not None
+
+        exporter.set_property_dtype("ScanData", "float32")
+        data = exporter.read_property("ScanData")
+        assert isinstance(data, numpy.ndarray) and data.dtype == numpy.float32
+        assert data.tolist() == [1.5, 2.0, -300.0]
+    finally:
+        exporter.stop()
+
+
+def test_remembered_types():
+    exporter = Exporter("127.0.0.1", 0)
+    convert = exporter._to_python_value
+    assert convert("3", "Position") == 3
+    assert convert("3.5", "Position") == 3.5
+    assert convert("4.0", "Position") == 4.0
+    # never another type than the one guessed
+    assert type(convert("4", "Position")) is int
+    assert type(convert("4.5", "Position")) is float
+    assert convert("true", "Flag") is True
+    assert convert("false", "Flag") is False
+    assert convert("Ready", "Flag") == "Ready"
+    assert convert("\x1f1\x1f2\x1f", "Array") == [1, 2]
+    assert convert("\x1fa\x1fb\x1f", "Array") == ["a", "b"]
+    assert convert("\x1f", "Array") == []
+    assert convert("5", "Array") == 5
+    assert convert("\x1f1.5\x1f2\x1f", "Array") == [1.5, 2.0]
+    assert [type(item) for item in convert("\x1f1\x1f2\x1f", "Array")] == [int, int]
+    assert convert("\x1f1\x1f2\x1f", dtype=int).tolist() == [1, 2]
+    # malformed arrays are not truncated
+    assert convert("\x1f1.5\x1fa\x1f", dtype=float) == ["1.5", "a"]
+    assert convert("\x1f1.5\x1f2\x1f", dtype=int) == [1.5, 2.0]
+    with pytest.raises(ValueError):
+        to_numpy_array("\x1f1\x1f\x1f2\x1f", float)
+    assert convert("Running", dtype=int) == "Running"
+    assert convert(None, "Position") is None
+
+
+def test_frame_parser_chunks():
+    parser = FrameParser(max_size=100)
+    stream = (
+        b"junk\x03\x02RET:1\x03\x02RET:\x1f1\x1f2\x1f\x03"
+        b"\x02ignored\x02EVT:a\tb\t0\x03"
+    )
+    frames = []
+    for pos in range(len(stream)):
+        frames.extend(parser.feed(stream[pos : pos + 1]))
+    assert frames == [b"RET:1", b"RET:\x1f1\x1f2\x1f", b"EVT:a\tb\t0"]
+    assert parser.feed(stream) == frames
+
+    # frames larger than max_size are dropped
+    assert parser.feed(b"\x02" + b"x" * 200) == []
+    assert parser.feed(b"\x03\x02RET:2\x03") == [b"RET:2"]
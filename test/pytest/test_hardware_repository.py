@@ -0,0 +1,112 @@
+import os
+from collections import OrderedDict
+
+import gevent
+import gevent.lock
+
+from HardwareRepository import HardwareRepository as HWR
+from HardwareRepository import ConfigurationCache
+from HardwareRepository import HardwareObjectFileParser
+
+from HardwareRepository.test.pytest.conftest import HWR_DIR
+
+
+def _get_mockup_path():
+    return "%s%s%s" % (
+        os.path.join(HWR_DIR, "configuration/mockup"),
+        os.path.pathsep,
+        os.path.join(HWR_DIR, "configuration/mockup/test"),
+    )
+
+
+def test_get_references():
+    xml_string = """<object class="Dummy">
+  <object href="/motor" role="motor"/>
+  <object hwrid="./other" role="other"/>
+  <object href="/motor" role="motor_again"/>
+</object>"""
+    references = HardwareObjectFileParser.get_references(xml_string, "/dir/name")
+
+    assert references == ["/motor", "/dir/other"]
+
+
+def test_concurrent_loading(monkeypatch):
+    monkeypatch.setattr(HWR, "MAX_CONCURRENT_LOADS", 4)
+    HWR._instance = HWR.beamline = None
+    HWR.init_hardware_repository(_get_mockup_path())
+    hwr = HWR.get_hardware_repository()
+
+    assert HWR.beamline.diffractometer is not None
+    assert HWR.beamline.energy is not None
+    assert HWR.beamline.mock_procedure is not None
+    assert hwr.load_summary["critical_path"] <= hwr.load_summary["wall_clock"] + 1
+    # objects referenced from several places are loaded once
+    names = [row[0] for row in hwr.hwobj_info_list]
+    assert names.count("/diff-omega-mockup") == 1
+    assert names.count("/session") == 1
+
+
+def test_wait_times(monkeypatch):
+    class Repository(object):
+        hwobj_wait_times = {}
+
+    def load_node(container, class_name, node, roles, table, prerequisites):
+        gevent.sleep(0.05)
+        return 50
+
+    nodes = OrderedDict(("/object%d" % index, []) for index in range(4))
+    dependencies = dict((node, []) for node in nodes)
+    monkeypatch.setattr(HWR, "MAX_CONCURRENT_LOADS", 2)
+    monkeypatch.setattr(HWR, "_load_semaphore", gevent.lock.BoundedSemaphore(2))
+    monkeypatch.setattr(HWR, "_instance", Repository())
+    monkeypatch.setattr(HWR, "_get_load_graph", lambda objects: (nodes, dependencies))
+    monkeypatch.setattr(HWR, "_load_node", load_node)
+
+    assert HWR._load_contents(None, "Beamline", {}, []) == 50
+    # the last two objects wait for a free loading slot
+    wait_times = sorted(HWR._instance.hwobj_wait_times.values())
+    assert wait_times[1] < 40 <= wait_times[2]
+
+    # waiting for the prerequisites is not counted
+    dependencies["/object1"] = ["/object0"]
+    dependencies["/object3"] = ["/object2"]
+    HWR._instance.hwobj_wait_times.clear()
+    assert HWR._load_contents(None, "Beamline", {}, []) == 100
+    wait_times = HWR._instance.hwobj_wait_times
+    assert wait_times["/object1"] < 40 and wait_times["/object3"] < 40
+
+    # sequential loading: objects wait for the ones loaded before
+    monkeypatch.setattr(HWR, "MAX_CONCURRENT_LOADS", 1)
+    HWR._instance.hwobj_wait_times.clear()
+    HWR._load_contents(None, "Beamline", {}, [])
+    wait_times = HWR._instance.hwobj_wait_times
+    assert wait_times["/object1"] < 40 and wait_times["/object3"] < 40
+    assert 90 <= wait_times["/object2"] < 140
+
+
+def test_configuration_cache(tmpdir, monkeypatch):
+    cache = ConfigurationCache.ConfigurationCache(str(tmpdir))
+    config_dir = os.path.join(HWR_DIR, "configuration/mockup")
+    assert cache.warm([config_dir]) > 0
+
+    xml_path = os.path.join(config_dir, "diffractometer-mockup.xml")
+    with open(xml_path) as xml_file:
+        xml_string = xml_file.read()
+    events = cache.get_xml_events(xml_path)
+    assert cache.get_statistics()["hits"] == 1
+    assert events == HardwareObjectFileParser.get_events(xml_string)
+    assert HardwareObjectFileParser.get_references(
+        xml_string, "/diffractometer-mockup", events
+    ) == HardwareObjectFileParser.get_references(xml_string, "/diffractometer-mockup")
+
+    misses = cache.get_statistics()["misses"]
+    assert cache.invalidate([xml_path]) == 1
+    cache.get_xml_events(xml_path)
+    assert cache.get_statistics()["misses"] == misses + 1
+
+    monkeypatch.setattr(HWR, "CONFIGURATION_CACHE_DIRECTORY", str(tmpdir))
+    HWR._instance = HWR.beamline = None
+    HWR.init_hardware_repository(_get_mockup_path())
+
+    assert HWR.beamline.diffractometer is not None
+    assert HWR.configuration_cache.get_statistics()["misses"] == 0
@@ -0,0 +1,153 @@
+import time
+
+import numpy as np
+import pytest
+
+from HardwareRepository.utils.image_stack import ImageStack
+
+SHAPE = (64, 48)
+
+
+@pytest.fixture
+def images():
+    rng = np.random.RandomState(0)
+    images = {}
+    for index in range(20):
+        images["raw_%d" % index] = rng.randint(100, 4000, SHAPE).astype(np.uint16)
+    for index in range(2):
+        ff_image = rng.randint(500, 1500, SHAPE).astype(np.uint16)
+        ff_image[10, 10] = 0
+        images["ff_%d" % index] = ff_image
+    return images
+
+
+def make_stack(images, **kwargs):
+    raw_filename_list = sorted(
+        (name for name in images if name.startswith("raw")),
+        key=lambda name: int(name.split("_")[1]),
+    )
+    ff_filename_list = sorted(name for name in images if name.startswith("ff"))
+    return ImageStack(raw_filename_list, images.get, ff_filename_list, **kwargs)
+
+
+def expected_frame(images, index, ff_apply):
+    raw_image = images["raw_%d" % index].astype(float)
+    first = images["raw_0"].astype(float)
+    if ff_apply:
+        ff_index = index * 2 // 20
+        ff_image = images["ff_%d" % ff_index].astype(float)
+        image = np.divide(
+            raw_image, ff_image, out=np.ones_like(raw_image), where=ff_image != 0
+        )
+        ff_first = images["ff_0"].astype(float)
+        first = np.divide(first, ff_first, out=np.ones_like(first), where=ff_first != 0)
+    else:
+        image = raw_image
+    low, high = first[8:].min(), first[8:].max()
+    return np.clip(255.0 * (image - low) / (high - low), 0, 255).astype(np.uint8)
+
+
+def wait_decoded(stack, decoded, timeout=5):
+    end_time = time.time() + timeout
+    while stack.get_statistics()["decoded"] < decoded and time.time() < end_time:
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize("ff_apply", [False, True])
+def test_display_frames(images, ff_apply):
+    stack = make_stack(images, workers_num=0)
+    for index in (0, 7, 19):
+        frame = stack.get_frame(index, ff_apply)
+        assert frame.dtype == np.uint8
+        assert frame.shape == SHAPE
+        # float32 instead of float64 computation
+        difference = frame.astype(int) - expected_frame(images, index, ff_apply)
+        assert np.abs(difference).max() <= 1
+    assert stack.get_frame(3, ff_apply) is stack.get_frame(3, ff_apply)
+
+
+def test_lru_cache(images):
+    stack = make_stack(images, cache_size=4, workers_num=0)
+    for index in range(10):
+        stack.get_frame(index)
+    stack.get_frame(6)
+    stack.get_frame(10)
+
+    statistics = stack.get_statistics()
+    assert statistics["cached_frames"] == 4
+    assert statistics["cache_bytes"] == 4 * SHAPE[0] * SHAPE[1]
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 11
+    assert statistics["decoded"] == 11
+    assert statistics["decode_rate"] > 0
+    # 7 was dropped, 6 was used again
+    assert stack.get_frame(6) is not None
+    assert stack.get_statistics()["hits"] == 2
+    stack.get_frame(7)
+    assert stack.get_statistics()["misses"] == 12
+
+
+def test_read_ahead(images):
+    stack = make_stack(images, workers_num=2)
+    stack.read_ahead(10, step=-3, count=4, ff_apply=True)
+    wait_decoded(stack, 3)
+    statistics = stack.get_statistics()
+    # 7, 4, 1 (the stack ends before -2)
+    assert statistics["decoded"] == 3
+    assert statistics["buffer_bytes"] > 0
+    for index in (7, 4, 1):
+        stack.get_frame(index, ff_apply=True)
+    assert stack.get_statistics()["hits"] == 3
+
+    stack.read_ahead(18, step=2, count=3, wrap=True)
+    wait_decoded(stack, 6)
+    for index in (0, 2, 4):
+        stack.get_frame(index)
+    assert stack.get_statistics()["hits"] == 6
+    stack.close()
+    for worker in stack._workers:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+
+def test_missing_frames(images):
+    stack = make_stack(images, workers_num=0)
+    del images["raw_5"]
+    assert stack.get_frame(5) is None
+    assert stack.get_frame(6) is not None
+
+    stack = make_stack(images, workers_num=0)
+    del images["raw_0"]
+    # no normalisation levels without the first frame
+    assert stack.get_frame(6) is None
+
+    # a missing flat field image
+    images["raw_0"] = images["raw_5"] = images["raw_1"]
+    stack = make_stack(images, workers_num=0)
+    ff_images = dict(images)
+    stack.read_function = ff_images.get
+    del ff_images["ff_1"]
+    assert stack.get_frame(15, ff_apply=True) is None
+    assert stack.get_frame(5, ff_apply=True) is not None
+    stack = make_stack(images, workers_num=0)
+    stack.read_function = ff_images.get
+    del ff_images["ff_0"]
+    # no normalisation levels without the first flat field image
+    assert stack.get_frame(5, ff_apply=True) is None
+
+
+def test_decode_errors(images):
+    def read_function(filename):
+        if filename == "raw_3":
+            raise IOError("cannot read %s" % filename)
+        return images.get(filename)
+
+    stack = make_stack(images, workers_num=1)
+    stack.read_function = read_function
+    stack.read_ahead(2, count=3)
+    wait_decoded(stack, 2)
+    # the worker went on after the error, and the frame can be asked again
+    assert stack.get_statistics()["decoded"] == 2
+    assert not stack._pending
+    assert stack._workers[0].is_alive()
+    stack.close()
@@ -0,0 +1,156 @@
+import logging
+import os
+
+import gevent
+import pytest
+
+from HardwareRepository.HardwareObjects import ISPyBClient
+from HardwareRepository.HardwareObjects.ISPyBClient import WebServiceClients
+
+WSDL = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions name="ToolsForTestWebService"
+    targetNamespace="http://test.ispyb/"
+    xmlns:tns="http://test.ispyb/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns="http://schemas.xmlsoap.org/wsdl/">
+  <types>
+    <xsd:schema targetNamespace="http://test.ispyb/" elementFormDefault="qualified">
+      <xsd:complexType name="workflow3VO">
+        <xsd:sequence>
+          <xsd:element name="workflowId" type="xsd:int" minOccurs="0"/>
+          <xsd:element name="comments" type="xsd:string" minOccurs="0"/>
+        </xsd:sequence>
+      </xsd:complexType>
+      <xsd:element name="storeOrUpdateWorkflow">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="workflow" type="tns:workflow3VO"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+      <xsd:element name="storeOrUpdateWorkflowResponse">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="return" type="xsd:int"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+    </xsd:schema>
+  </types>
+  <message name="storeOrUpdateWorkflow">
+    <part name="parameters" element="tns:storeOrUpdateWorkflow"/>
+  </message>
+  <message name="storeOrUpdateWorkflowResponse">
+    <part name="parameters" element="tns:storeOrUpdateWorkflowResponse"/>
+  </message>
+  <portType name="ToolsForTest">
+    <operation name="storeOrUpdateWorkflow">
+      <input message="tns:storeOrUpdateWorkflow"/>
+      <output message="tns:storeOrUpdateWorkflowResponse"/>
+    </operation>
+  </portType>
+  <binding name="ToolsForTestBinding" type="tns:ToolsForTest">
+    <soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>
+    <operation name="storeOrUpdateWorkflow">
+      <soap:operation soapAction=""/>
+      <input><soap:body use="literal"/></input>
+      <output><soap:body use="literal"/></output>
+    </operation>
+  </binding>
+  <service name="ToolsForTestWebService">
+    <port name="ToolsForTestPort" binding="tns:ToolsForTestBinding">
+      <soap:address location="http://localhost:1/ToolsForTestWebService"/>
+    </port>
+  </service>
+</definitions>
+"""
+
+
+def test_web_service_clients(tmp_path):
+    wsdl_path = tmp_path / "ToolsForTestWebService.wsdl"
+    wsdl_path.write_text(WSDL)
+    url = "file://%s" % wsdl_path
+    cache_directory = str(tmp_path / "cache")
+
+    clients = WebServiceClients(cache_directory=cache_directory, cache_version=2)
+    client = clients.get_client(url)
+    assert clients.get_client(url) is client
+    assert os.listdir(os.path.join(cache_directory, "2"))
+
+    workflow = client.factory.create("workflow3VO")
+    workflow.comments = "first"
+    assert client.factory.create("workflow3VO").comments is None
+
+    # a new process reads the parsed WSDL from the cache
+    os.remove(str(wsdl_path))
+    other_client = WebServiceClients(cache_directory, cache_version=2).get_client(url)
+    assert other_client.factory.create("workflow3VO").workflowId is None
+
+    # nothing listens on the service port
+    with pytest.raises(Exception):
+        client.service.storeOrUpdateWorkflow(workflow)
+    stats = clients.get_statistics()["ToolsForTestWebService.wsdl.storeOrUpdateWorkflow"]
+    assert stats["calls"] == 1
+    assert stats["errors"] == 1
+    assert stats["max_time"] >= stats["mean_time"] >= 0
+
+
+class Formatted:
+    formatted = 0
+
+    def __repr__(self):
+        Formatted.formatted += 1
+        return "x" * 10000
+
+
+class Client:
+    @ISPyBClient.trace
+    def get_samples(self, arg):
+        return [Formatted()] * arg
+
+    @ISPyBClient.in_greenlet
+    def store(self, arg):
+        raise RuntimeError("store failed")
+
+
+def test_trace(caplog):
+    client = Client()
+    logging.getLogger("ispyb_client").setLevel(logging.INFO)
+    client.get_samples(3)
+    assert Formatted.formatted == 0
+
+    caplog.set_level(logging.DEBUG, logger="ispyb_client")
+    client.get_samples(1000)
+    assert 0 < Formatted.formatted < 1000
+    messages = [record.getMessage() for record in caplog.records]
+    assert all(len(message) < ISPyBClient.TRACE_MAX_LENGTH + 100 for message in messages)
+
+    client.store(1, wait=False)
+    gevent.sleep(0.01)
+    records = ISPyBClient.get_trace_records()
+    assert [record.name for record in records[-3:]] == ["get_samples"] * 2 + ["store"]
+    assert records[-2].result_size == 1000
+    assert records[-1].error
+    stats = ISPyBClient.get_trace_statistics()["get_samples"]
+    assert stats["calls"] >= 2
+    assert stats["max_result_size"] == 1000
+
+
+def test_trace_buffer_size(monkeypatch):
+    client = Client()
+    for _ in range(5):
+        client.get_samples(1)
+    ISPyBClient.set_trace_buffer_size(3)
+    assert len(ISPyBClient.get_trace_records()) == 3
+    client.get_samples(2)
+    records = ISPyBClient.get_trace_records()
+    assert len(records) == 3 and records[-1].result_size == 2
+
+    monkeypatch.setattr(ISPyBClient, "TRACE_BUFFER_SIZE", 10)
+    ISPyBClient.set_trace_buffer_size()
+    for _ in range(20):
+        client.get_samples(1)
+    assert len(ISPyBClient.get_trace_records()) == 10
+    monkeypatch.undo()
+    ISPyBClient.set_trace_buffer_size()
@@ -0,0 +1,151 @@
+import os
+import sys
+
+import gevent
+import pytest
+
+from HardwareRepository.HardwareObjects import JobRunner
+from HardwareRepository.utils import job_mockup
+
+JOB_MOCKUP = os.path.splitext(os.path.abspath(job_mockup.__file__))[0] + ".py"
+
+
+def mockup_command(*args):
+    return [sys.executable, JOB_MOCKUP] + [str(arg) for arg in args]
+
+
+@pytest.fixture
+def job_runner(beamline):
+    return beamline.job_runner
+
+
+def test_configuration(job_runner):
+    assert job_runner.get_pool_size("characterisation") == 2
+    assert job_runner.get_pool_size("autoprocessing") == 1
+    assert job_runner.get_pool_size("thumbnails") == 2
+    assert job_runner.get_pool_size("online_processing") is None
+    assert job_runner.get_pool_size("crystfel") == 1
+    assert job_runner.max_jobs == 3
+
+
+def test_resource_usage(job_runner, tmp_path):
+    output = str(tmp_path / "result.txt")
+    job = job_runner.run(
+        mockup_command("--cpu", 0.3, "--memory", 100, "--output", output),
+        "characterisation",
+        JobRunner.PRIORITY_INTERACTIVE,
+    )
+    assert job.state.value == "success"
+    assert job.returncode == 0
+    assert os.path.exists(output)
+    assert job.wall_time >= 0.3
+    assert job.cpu_time >= 0.25
+    assert job.max_rss >= 100 * 1024
+    assert job.as_dict()["state"] == "success"
+
+
+def test_failure_and_shell_command(job_runner, tmp_path):
+    job = job_runner.run(mockup_command("--exit-code", 3), "characterisation")
+    assert job.state.value == "failed"
+    assert job.returncode == 3
+
+    log_file = str(tmp_path / "job.log")
+    job = job_runner.run(
+        "echo $PWD", "characterisation", cwd=str(tmp_path), log_file=log_file
+    )
+    assert job.state.value == "success"
+    with open(log_file) as log:
+        assert log.read().strip() == str(tmp_path)
+
+
+def test_pool_size_and_priority(job_runner):
+    first = job_runner.submit(mockup_command("--sleep", 0.3), "autoprocessing")
+    background = job_runner.submit(
+        mockup_command(), "autoprocessing", JobRunner.PRIORITY_BACKGROUND
+    )
+    interactive = job_runner.submit(
+        mockup_command(), "autoprocessing", JobRunner.PRIORITY_INTERACTIVE
+    )
+    assert first.state.value == "running"
+    assert background.state.value == interactive.state.value == "queued"
+
+    for job in (first, background, interactive):
+        assert job.wait(timeout=10) == 0
+    assert first.end_time <= interactive.start_time
+    assert interactive.end_time <= background.start_time
+
+
+def test_priority_across_pools(job_runner):
+    job_runner.max_jobs = 1
+    first = job_runner.submit(mockup_command("--sleep", 0.3), "characterisation")
+    background = job_runner.submit(
+        mockup_command(), "autoprocessing", JobRunner.PRIORITY_BACKGROUND
+    )
+    interactive = job_runner.submit(
+        mockup_command(), "characterisation", JobRunner.PRIORITY_INTERACTIVE
+    )
+    # the characterisation pool has a free slot, not the beamline
+    assert first.state.value == "running"
+    assert background.state.value == interactive.state.value == "queued"
+
+    # dozor is never queued
+    dozor = job_runner.submit(mockup_command(), "online_processing")
+    assert dozor.state.value == "running"
+
+    for job in (first, background, interactive, dozor):
+        assert job.wait(timeout=10) == 0
+    assert first.end_time <= interactive.start_time
+    assert interactive.end_time <= background.start_time
+
+
+def test_concurrent_jobs(job_runner):
+    jobs = [
+        job_runner.submit(mockup_command("--sleep", 0.5), "characterisation")
+        for _ in range(3)
+    ]
+    assert [job.state.value for job in jobs] == ["running", "running", "queued"]
+    # the other greenlets keep running meanwhile
+    greenlet = gevent.spawn(gevent.sleep, 0.1)
+    greenlet.join(timeout=0.3)
+    assert greenlet.successful()
+    for job in jobs:
+        job.wait(timeout=10)
+    assert jobs[2].start_time >= min(jobs[0].end_time, jobs[1].end_time)
+
+
+def test_cancel(job_runner):
+    running = job_runner.submit(mockup_command("--sleep", 30), "autoprocessing")
+    queued = job_runner.submit(mockup_command(), "autoprocessing")
+
+    assert queued.cancel()
+    assert queued.state.value == "cancelled"
+    assert queued.is_finished()
+
+    assert running.cancel()
+    running.wait(timeout=10)
+    assert running.state.value == "cancelled"
+    assert running.wall_time < 10
+    assert not running.cancel()
+    # the cancelled job is never started
+    gevent.sleep(0.1)
+    assert queued.start_time is None
+
+
+def test_history_and_statistics(job_runner):
+    job_runner.run(mockup_command(), "characterisation")
+    job_runner.run(mockup_command("--exit-code", 1), "characterisation")
+    job = job_runner.submit(mockup_command("--sleep", 30), "autoprocessing")
+    job.cancel()
+    job.wait(timeout=10)
+
+    assert len(job_runner.get_jobs()) == 3
+    assert len(job_runner.get_jobs(tool="characterisation")) == 2
+    assert len(job_runner.get_jobs(state=JobRunner.JobState.CANCELLED)) == 1
+    assert len(job_runner.get_jobs(state="success")) == 1
+
+    statistics = job_runner.get_statistics()
+    assert statistics["characterisation"]["success"] == 1
+    assert statistics["characterisation"]["failed"] == 1
+    assert statistics["characterisation"]["pool_size"] == 2
+    assert statistics["characterisation"]["mean_wall_time"] > 0
+    assert statistics["autoprocessing"]["cancelled"] == 1
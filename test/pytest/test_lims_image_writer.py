@@ -0,0 +1,90 @@
+import gevent
+
+from HardwareRepository.HardwareObjects.ISPyBClient import ISPyBClient, URLError
+from HardwareRepository.HardwareObjects.abstract.AbstractMultiCollect import (
+    LimsImageWriter,
+)
+
+
+class Lims:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.images = []
+
+    def store_image(self, image_dict, raise_errors=False):
+        gevent.sleep(0.001)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("LIMS not responding")
+        self.images.append(image_dict["imageNumber"])
+
+
+def test_images_stored_in_order():
+    lims = Lims(failures=2)
+    writer = LimsImageWriter(lims, backoff=0.001)
+    for frame in range(1, 21):
+        writer.put({"imageNumber": frame})
+    assert writer.get_queue_depth() == 20
+
+    assert writer.flush(5)
+    assert lims.images == list(range(1, 21))
+    stats = writer.get_statistics()
+    assert stats["stored"] == 20
+    assert stats["retries"] == 2
+    assert stats["failed"] == stats["dropped"] == stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] == 20
+
+
+def test_images_batched_and_bounded():
+    lims = Lims()
+    writer = LimsImageWriter(lims, max_queue_size=15, batch_size=10)
+    for frame in range(1, 21):
+        writer.put({"imageNumber": frame})
+
+    assert writer.flush(5)
+    assert lims.images == list(range(6, 21))
+    stats = writer.get_statistics()
+    assert stats["dropped"] == 5
+    assert stats["flushes"] == 2
+
+
+def test_failed_images():
+    lims = Lims(failures=10)
+    writer = LimsImageWriter(lims, retries=1, backoff=0.001)
+    writer.put({"imageNumber": 1})
+    assert writer.flush(5)
+    assert writer.get_statistics()["failed"] == 1
+    assert lims.images == []
+
+
+class CollectionService(object):
+    """ISPyB collection web service failing the first calls"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.images = []
+
+    def storeOrUpdateImage(self, image_dict):
+        if self.failures:
+            self.failures -= 1
+            raise URLError("connection refused")
+        self.images.append(image_dict["imageNumber"])
+        return len(self.images)
+
+
+def test_ispyb_client_errors():
+    lims = ISPyBClient("lims")
+    lims._collection = type("Collection", (object,), {})()
+    lims._collection.service = CollectionService(failures=3)
+    # the client logs and swallows the errors when called on its own
+    assert lims.store_image({"dataCollectionId": 1, "imageNumber": 0}) is None
+
+    writer = LimsImageWriter(lims, retries=1, backoff=0.001)
+    writer.put({"dataCollectionId": 1, "imageNumber": 1})
+    writer.put({"dataCollectionId": 1, "imageNumber": 2})
+    writer.put({"imageNumber": 3})
+    assert writer.flush(5)
+    stats = writer.get_statistics()
+    assert stats["stored"] == 1
+    assert stats["failed"] == 2
+    assert lims._collection.service.images == [2]
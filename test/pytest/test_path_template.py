@@ -0,0 +1,56 @@
+import random
+
+from HardwareRepository.HardwareObjects.queue_model_objects import (
+    FileRangeIndex,
+    PathTemplate,
+)
+
+
+def make_path_template(directory="/data/test", prefix="test", start_num=1, num_files=10):
+    path_template = PathTemplate()
+    path_template.directory = directory
+    path_template.base_prefix = prefix
+    path_template.run_number = 2
+    path_template.precision = "04"
+    path_template.suffix = "cbf"
+    path_template.start_num = start_num
+    path_template.num_files = num_files
+    return path_template
+
+
+def test_files_to_be_written():
+    path_template = make_path_template(num_files=3600)
+    assert path_template.get_files_to_be_written() == [
+        "/data/test/test_2_%04d.cbf" % image_num for image_num in range(1, 3601)
+    ]
+
+
+def test_file_range_index():
+    path_templates = []
+    file_ranges = FileRangeIndex()
+    random.seed(1)
+    for _ in range(200):
+        path_template = make_path_template(
+            start_num=random.randint(1, 5000), num_files=random.randint(0, 100)
+        )
+        path_templates.append(path_template)
+        file_ranges.add(
+            path_template, path_template.start_num, path_template.num_files
+        )
+    for path_template in path_templates[::3]:
+        file_ranges.remove(path_template, path_template.start_num)
+    remaining = [pt for index, pt in enumerate(path_templates) if index % 3]
+    assert len(file_ranges) == len(remaining)
+
+    for start_num in range(-50, 5200, 7):
+        new = make_path_template(start_num=start_num, num_files=random.randint(1, 50))
+        expected = any(new.intersection(pt) for pt in remaining)
+        found = file_ranges.get_overlapping(new.start_num, new.num_files)
+        assert (found is not None) == expected
+        if found is not None:
+            assert new.intersection(found)
+
+    path_template = remaining[0]
+    assert file_ranges.get_overlapping(
+        path_template.start_num, path_template.num_files, exclude=path_template
+    ) is not path_template
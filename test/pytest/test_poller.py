@@ -0,0 +1,110 @@
+import gevent
+
+from HardwareRepository import Poller
+
+
+class Counter:
+    def __init__(self, fail_at=None):
+        self.count = 0
+        self.fail_at = fail_at
+        self.values = []
+        self.errors = []
+
+    def read(self):
+        self.count += 1
+        if self.count == self.fail_at:
+            raise RuntimeError("read failed")
+        return self.count
+
+    def value_changed(self, value):
+        self.values.append(value)
+
+    def error(self, exception, poller_id):
+        self.errors.append((exception, poller_id))
+
+
+def test_poll_value_changed():
+    counter = Counter()
+    poller = Poller.poll(counter.read, (), 10, counter.value_changed, counter.error)
+    try:
+        gevent.sleep(0.2)
+    finally:
+        poller.stop()
+
+    assert len(counter.values) > 2
+    assert counter.values == sorted(counter.values)
+    assert not counter.errors
+
+
+def test_poll_same_call_is_merged():
+    counter = Counter()
+    poller = Poller.poll(counter.read, (), 100, counter.value_changed, counter.error)
+    try:
+        merged = Poller.poll(counter.read, (), 50, counter.value_changed, counter.error)
+        assert merged is poller
+        assert poller.get_polling_period() == 50
+    finally:
+        poller.stop()
+
+
+def test_poll_error_stops_poller():
+    counter = Counter(fail_at=3)
+    poller = Poller.poll(counter.read, (), 10, counter.value_changed, counter.error)
+    try:
+        gevent.sleep(0.2)
+    finally:
+        poller.stop()
+
+    assert counter.values == [1, 2]
+    assert len(counter.errors) == 1
+    assert counter.errors[0][1] == poller.get_id()
+
+
+def test_poller_statistics():
+    counter = Counter()
+    poller = Poller.poll(counter.read, (), 10, counter.value_changed, counter.error)
+    try:
+        gevent.sleep(0.1)
+        stats = Poller.get_statistics()[poller.get_id()]
+    finally:
+        poller.stop()
+
+    assert stats["calls"] > 2
+    assert stats["errors"] == 0
+    assert stats["polling_period"] == 10
+    assert stats["max_latency"] >= stats["mean_latency"] >= 0
+
+
+def test_acquire_timeout(monkeypatch):
+    lock = Poller._threading.Lock()
+    lock.acquire()
+    assert not Poller._acquire(lock, 0.01)
+    # Python 2 locks have no timeout
+    monkeypatch.setattr(Poller.sys, "version_info", (2, 7, 18))
+    assert not Poller._acquire(lock, 0.01)
+    lock.release()
+    assert Poller._acquire(lock, 0.01)
+
+
+def test_hung_call_does_not_block_pollers(monkeypatch):
+    scheduler = Poller._PollingScheduler(1, slow_call_timeout=0.05)
+    monkeypatch.setattr(Poller, "_SCHEDULER", scheduler)
+    hung_call = Poller._threading.Lock()
+    hung_call.acquire()
+
+    def hung_read():
+        hung_call.acquire()
+        hung_call.release()
+        return 0
+
+    counter = Counter()
+    hung = Poller.poll(hung_read, (), 10, counter.value_changed, counter.error)
+    poller = Poller.poll(counter.read, (), 10, counter.value_changed, counter.error)
+    try:
+        gevent.sleep(0.3)
+        assert scheduler.get_replaced_workers() == 1
+        assert len(counter.values) > 2 and 0 not in counter.values
+    finally:
+        hung.stop()
+        poller.stop()
+        hung_call.release()
@@ -0,0 +1,86 @@
+import numpy as np
+
+from HardwareRepository.utils import processing_results
+from HardwareRepository.utils.processing_results import (
+    ProcessingResults,
+    get_col_row_index,
+)
+
+
+def snake_col_row(frame, cols=4):
+    """Mesh scanned line by line, every other line reversed"""
+    row, col = divmod(frame, cols)
+    if row % 2:
+        col = cols - 1 - col
+    return col, row
+
+
+def test_mesh_batch():
+    results = ProcessingResults()
+    for key in ("score", "spots_num"):
+        results.allocate(key, 12, (4, 3))
+    cols, rows = get_col_row_index(snake_col_row, 12, (4, 3))
+    results.set_grid_index(cols, rows)
+
+    frames = np.array([3, 4, 5])
+    results.set_values(frames, {"score": [1.0, 2.0, 3.0], "spots_num": [4, 5, 6]})
+    assert results.raw["score"][3:6].tolist() == [1.0, 2.0, 3.0]
+    assert results.aligned["score"][3, 0] == 1.0
+    assert results.aligned["score"][3, 1] == 2.0
+    assert results.aligned["spots_num"][2, 1] == 6
+    assert results.aligned["score"].sum() == 6.0
+
+    # frames outside of the grid are not aligned
+    cols, rows = get_col_row_index(snake_col_row, 12, (4, 2))
+    assert (cols[8:] == -1).all() and (rows[8:] == -1).all()
+    results.set_grid_index(cols, rows)
+    results.set_values([10], {"score": [7.0]})
+    assert results.raw["score"][10] == 7.0
+    assert results.aligned["score"].sum() == 6.0
+
+
+def test_line_and_streamed_values():
+    results = ProcessingResults()
+    results.allocate("score", 5)
+    results.allocate("average_intensity", 0)
+    results.set_values([0, 4], {"score": [1.0, 2.0]})
+    assert results.aligned["score"].tolist() == [1.0, 0, 0, 0, 2.0]
+
+    expected = []
+    for value in range(processing_results.MIN_CAPACITY * 3):
+        results.append("average_intensity", value)
+        expected.append(value)
+    results.append("average_intensity", [1.0, 2.0])
+    expected.extend([1.0, 2.0])
+    assert results.raw["average_intensity"].tolist() == expected
+    assert results.aligned["average_intensity"] is results.raw["average_intensity"]
+
+
+def test_smooth():
+    values = np.arange(20, dtype=float) ** 2
+    step = 3
+    expected = [
+        np.mean(values[max(index - step, 0) : index + step])
+        for index in range(values.size)
+    ]
+    assert np.allclose(processing_results.smooth(values, step), expected)
+    assert processing_results.smooth([], step).size == 0
+
+
+def test_best_indices():
+    values = np.array([0.0, 5.0, -1.0, 7.0, 5.0, 0.5])
+    assert processing_results.get_best_indices(values, 3).tolist() == [3, 1, 4]
+    assert processing_results.get_best_indices(values, 10).tolist() == [3, 1, 4, 5]
+    assert processing_results.get_best_indices(np.zeros(4), 2).size == 0
+
+
+def test_save_csv(tmp_path):
+    csv_path = str(tmp_path / "results.csv")
+    with open(csv_path, "w") as csv_file:
+        processing_results.save_csv(
+            csv_file,
+            (np.arange(2), np.array([1.5, 2.0]), np.array([3.0, 4.0])),
+            ("%d", "%f", "%d"),
+        )
+    with open(csv_path) as csv_file:
+        assert csv_file.read() == "0,1.500000,3\n1,2.000000,4\n"
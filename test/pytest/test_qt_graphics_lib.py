@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+import pytest
+
+# needs the mxcube gui package and Qt
+QtGraphicsLib = pytest.importorskip("HardwareRepository.HardwareObjects.QtGraphicsLib")
+QtImport = QtGraphicsLib.QtImport
+
+
+@pytest.fixture(scope="module")
+def scene():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtImport.QApplication.instance() or QtImport.QApplication([])
+    yield QtImport.QGraphicsScene()
+    del app
+
+
+def test_line_display_overlay(scene):
+    line = QtGraphicsLib.GraphicsItemLine(
+        QtGraphicsLib.GraphicsItemPoint(), QtGraphicsLib.GraphicsItemPoint()
+    )
+    scene.addItem(line)
+    line.set_display_overlay(True)
+    line.set_display_overlay(False)
+
+
+def test_grid_display_overlay(scene):
+    beam_info = {"shape": "rectangular", "size_x": 0.01, "size_y": 0.01}
+    grid = QtGraphicsLib.GraphicsItemGrid(None, beam_info, (0, 0), (100, 100))
+    scene.addItem(grid)
+    grid._GraphicsItemGrid__num_cols = 2
+    grid._GraphicsItemGrid__num_rows = 3
+    grid.set_score(np.arange(1, 7).reshape(2, 3))
+    assert grid._GraphicsItemGrid__cell_colors.any()
+
+    # the cell colors follow the overlay at once
+    grid.set_display_overlay(False)
+    assert not grid._GraphicsItemGrid__cell_colors.any()
+    grid.set_display_overlay(True)
+    assert grid._GraphicsItemGrid__cell_colors.all()
+
+    # grids not added to a scene yet
+    beam_info = {"shape": "rectangular", "size_x": 0.01, "size_y": 0.01}
+    grid = QtGraphicsLib.GraphicsItemGrid(None, beam_info, (0, 0), (100, 100))
+    grid.set_display_overlay(False)
@@ -0,0 +1,141 @@
+import copy
+
+from HardwareRepository.HardwareObjects import queue_model_objects
+from HardwareRepository.HardwareObjects.QueueModel import QueueModel
+
+
+def make_data_collection(directory="/data/test", prefix="test", run_number=1):
+    data_collection = queue_model_objects.DataCollection()
+    path_template = data_collection.acquisitions[0].path_template
+    path_template.directory = directory
+    path_template.base_prefix = prefix
+    path_template.run_number = run_number
+    path_template.start_num = 1
+    path_template.num_files = 100
+    return data_collection
+
+
+def make_queue():
+    queue_model = QueueModel("queue-model")
+    sample = queue_model_objects.Sample()
+    group = queue_model_objects.TaskGroup()
+    queue_model.add_child(queue_model.get_model_root(), sample)
+    queue_model.add_child(sample, group)
+    return queue_model, sample, group
+
+
+def test_get_node():
+    queue_model, sample, group = make_queue()
+    data_collection = make_data_collection()
+    node_id = queue_model.add_child_at_id(group._node_id, data_collection)
+    assert queue_model.get_node(node_id) is data_collection
+    assert queue_model.get_node(sample._node_id) is sample
+
+    # subtrees are indexed with their children
+    new_group = queue_model_objects.TaskGroup()
+    child = make_data_collection()
+    child._node_id = 1000
+    new_group._children.append(child)
+    child._parent = new_group
+    queue_model.add_child(sample, new_group)
+    assert queue_model.get_node(1000) is child
+
+    queue_model.del_child(sample, new_group)
+    assert queue_model.get_node(new_group._node_id) is None
+    assert queue_model.get_node(1000) is None
+
+    # nodes added without the queue model are still found
+    orphan = queue_model_objects.TaskGroup()
+    orphan._node_id = 2000
+    orphan._parent = sample
+    sample._children.append(orphan)
+    assert queue_model.get_node(2000) is orphan
+
+
+def test_set_parent():
+    queue_model, sample, group = make_queue()
+    data_collection = make_data_collection()
+    queue_model.add_child(group, data_collection)
+    other_group = queue_model_objects.TaskGroup()
+    queue_model.add_child(sample, other_group)
+
+    signals = []
+    queue_model.emit = lambda signal, *args: signals.append((signal,) + args)
+    queue_model.set_parent(other_group, data_collection)
+    assert data_collection.get_parent() is other_group
+    assert data_collection in other_group.get_children()
+    assert data_collection not in group.get_children()
+    assert queue_model.get_node(data_collection._node_id) is data_collection
+    assert signals == [
+        ("child_removed", (group, data_collection)),
+        ("child_added", (other_group, data_collection)),
+    ]
+
+
+def test_run_numbers_and_collisions():
+    queue_model, sample, group = make_queue()
+    first = make_data_collection(run_number=1)
+    second = make_data_collection(run_number=3)
+    other = make_data_collection(prefix="other", run_number=7)
+    for data_collection in (first, second, other):
+        queue_model.add_child(group, data_collection)
+
+    new = make_data_collection(directory="/data/test/", run_number=1)
+    new_path_template = new.get_path_template()
+    assert queue_model.get_next_run_number(new_path_template) == 4
+    assert queue_model.check_for_path_collisions(new_path_template)
+    new_path_template.start_num = 101
+    assert not queue_model.check_for_path_collisions(new_path_template)
+
+    # templates changed after being added are re-indexed
+    second.get_path_template().base_prefix = "renamed"
+    assert queue_model.get_next_run_number(new_path_template) == 2
+    first.get_path_template().run_number = 5
+    assert queue_model.get_next_run_number(new_path_template) == 6
+    assert queue_model.get_next_run_number(first.get_path_template()) == 1
+    assert (
+        queue_model.get_next_run_number(first.get_path_template(), False) == 6
+    )
+
+    # copies do not belong to the index
+    copied = queue_model.copy_node(first)
+    assert copied.get_path_template().run_number == 6
+    assert queue_model.get_next_run_number(new_path_template) == 6
+    assert "_index" not in copy.copy(first.get_path_template()).__getstate__()
+
+    queue_model.del_child(group, first)
+    assert queue_model.get_next_run_number(new_path_template) == 1
+    first.get_path_template().run_number = 9
+    assert queue_model.get_next_run_number(new_path_template) == 1
+
+
+def test_range_changes():
+    queue_model, sample, group = make_queue()
+    first = make_data_collection()
+    queue_model.add_child(group, first)
+    new_path_template = make_data_collection().get_path_template()
+
+    new_path_template.start_num = 101
+    assert not queue_model.check_for_path_collisions(new_path_template)
+    first.get_path_template().num_files = 101
+    assert queue_model.check_for_path_collisions(new_path_template)
+    first.get_path_template().start_num = 201
+    assert not queue_model.check_for_path_collisions(new_path_template)
+
+
+def test_path_template_replaced():
+    queue_model, sample, group = make_queue()
+    first = make_data_collection(run_number=1)
+    queue_model.add_child(group, first)
+    new_path_template = make_data_collection(run_number=1).get_path_template()
+    assert queue_model.check_for_path_collisions(new_path_template)
+
+    # path template replaced, as done by the characterisation and workflows
+    old_path_template = first.acquisitions[0].path_template
+    first.acquisitions[0].path_template = copy.deepcopy(old_path_template)
+    first.get_path_template().run_number = 4
+    assert not queue_model.check_for_path_collisions(new_path_template)
+    assert queue_model.get_next_run_number(new_path_template) == 5
+    old_path_template.run_number = 7
+    assert queue_model.get_next_run_number(new_path_template) == 5
+    assert "_index" not in old_path_template.__dict__
@@ -0,0 +1,66 @@
+from HardwareRepository.HardwareObjects.abstract.sample_changer.Container import (
+    Basket,
+    Container,
+    Pin,
+)
+
+
+def make_dewar(baskets_num=29, samples_num=16):
+    dewar = Container("SC3", None, "dewar", True)
+    for number in range(1, baskets_num + 1):
+        dewar._add_component(Basket(dewar, number, samples_num=samples_num))
+    return dewar
+
+
+def test_component_lookup():
+    dewar = make_dewar()
+    basket = dewar.get_component_by_address("3")
+    sample = dewar.get_component_by_address(Pin.get_sample_address(3, 16))
+    assert basket.get_address() == "3"
+    assert sample.get_container() is basket
+    assert dewar.has_component_address("29:01")
+    assert not dewar.has_component_address("30:01")
+    assert basket.get_component_by_address("3:02").get_vial_no() == 2
+
+    sample._set_info(True, "DM0001", True)
+    assert dewar.get_component_by_id("DM0001") is sample
+    sample._set_info(True, "DM0002", True)
+    assert not dewar.has_component_id("DM0001")
+    assert dewar.get_component_by_id("DM0002") is sample
+    sample.clear_info()
+    assert not dewar.has_component_id("DM0002")
+
+    extra = Basket(dewar, 30, samples_num=2)
+    dewar._add_component(extra)
+    assert dewar.get_component_by_address("30:02") is extra.get_components()[1]
+    assert len(dewar.get_sample_list()) == 29 * 16 + 2
+    dewar._remove_component(extra)
+    assert not dewar.has_component_address("30:02")
+    assert len(dewar.get_sample_list()) == 29 * 16
+
+
+def test_present_samples():
+    dewar = make_dewar(3, 4)
+    assert dewar.is_empty()
+    assert dewar.get_present_samples() == []
+
+    basket = dewar.get_components()[1]
+    basket._set_info_many(0b0101)
+    present = dewar.get_present_samples()
+    assert [sample.get_address() for sample in present] == ["2:01", "2:03"]
+    assert basket._is_dirty() and dewar._is_dirty()
+    assert not dewar.is_empty()
+
+    # returned lists are copies
+    present.pop()
+    assert len(dewar.get_present_samples()) == 2
+
+    assert not basket._set_info_many([True, False, True, False], scanned=True)
+    assert basket._set_info_many([False] * 4, ids=[None, "DM", None, None])
+    assert [sample.get_address() for sample in dewar.get_present_samples()] == [
+        "2:02"
+    ]
+    assert dewar.get_component_by_id("DM").get_address() == "2:02"
+
+    dewar._set_info_many(0b111)
+    assert all(basket.is_present() for basket in dewar.get_components())
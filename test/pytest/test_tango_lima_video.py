@@ -0,0 +1,41 @@
+import pytest
+
+# needs PyTango and gipc
+TangoLimaVideo = pytest.importorskip(
+    "HardwareRepository.HardwareObjects.TangoLimaVideo"
+)
+
+
+class FakeLimaDevice(object):
+    def __init__(self):
+        self.video_last_image_counter = 0
+        self.frame_number = 0
+        self.fail = False
+
+    @property
+    def video_last_image(self):
+        if self.fail:
+            raise RuntimeError("cannot read image")
+        header = TangoLimaVideo.VIDEO_HEADER.pack(
+            0, 0, 0, self.frame_number, 2, 1, 0, 0, 0, 0
+        )
+        return "VIDEO_IMAGE", header + b"\x01\x02"
+
+
+def test_read_new_image():
+    video = TangoLimaVideo.TangoLimaVideo("video")
+    video.device = FakeLimaDevice()
+
+    data, width, height = video._read_new_image()
+    assert isinstance(data, bytes)
+    assert (data, width, height) == (b"\x01\x02", 2, 1)
+    assert video._read_new_image() is None
+
+    # the frame is read again after a failure
+    video.device.video_last_image_counter = 1
+    video.device.frame_number = 1
+    video.device.fail = True
+    with pytest.raises(RuntimeError):
+        video._read_new_image()
+    video.device.fail = False
+    assert video._read_new_image() is not None
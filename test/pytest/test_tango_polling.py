@@ -0,0 +1,219 @@
+import types
+
+import gevent
+import pytest
+
+from HardwareRepository.Command import Tango
+
+
+class DevFailed(Exception):
+    pass
+
+
+class DeviceAttribute(object):
+    class ExtractAs(object):
+        String = "string"
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.has_failed = error is not None
+        self._error = error
+
+    def get_err_stack(self):
+        return (self._error,)
+
+
+class AttributeInfo(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeDevice(object):
+    """Stands for both the gevent and the raw PyTango DeviceProxy"""
+
+    def __init__(self, device_name):
+        self.device_name = device_name
+        self.timeout = None
+        self.attribute_names = {"position", "state"}
+        self.values = {}
+        self.errors = {}
+        self.read_calls = []
+
+    def ping(self):
+        return 1
+
+    def set_timeout_millis(self, timeout):
+        self.timeout = timeout
+
+    def attribute_list_query(self):
+        return [AttributeInfo(name) for name in self.attribute_names]
+
+    def read_attribute(self, attribute_name, *args):
+        if attribute_name not in self.attribute_names:
+            raise DevFailed({"desc": "no attribute %s" % attribute_name})
+        return DeviceAttribute(
+            self.values.get(attribute_name), self.errors.get(attribute_name)
+        )
+
+    def read_attributes(self, attribute_names, *args):
+        self.read_calls.append(tuple(attribute_names))
+        # like PyTango, an unknown attribute fails the whole call
+        return [self.read_attribute(name) for name in attribute_names]
+
+
+class FakeChannel(object):
+    def __init__(self, device_name, attribute_name, polling=10):
+        self.device_name = device_name
+        self.attribute_name = attribute_name
+        self.polling = polling
+        self.read_as_str = False
+        self.values = []
+        self.errors = []
+
+    def update(self, value):
+        self.values.append(value)
+
+    def poll_failed(self, e, poller_id):
+        self.errors.append(e)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake_tango = types.ModuleType("PyTango")
+    fake_tango.DevFailed = DevFailed
+    fake_tango.ConnectionFailed = DevFailed
+    fake_tango.DeviceAttribute = DeviceAttribute
+    monkeypatch.setattr(Tango, "PyTango", fake_tango, raising=False)
+    monkeypatch.setattr(Tango, "DeviceProxy", FakeDevice, raising=False)
+    monkeypatch.setattr(Tango, "RawDeviceProxy", FakeDevice, raising=False)
+
+    pool = Tango.DeviceProxyPool()
+    monkeypatch.setattr(Tango, "device_pool", pool)
+    monkeypatch.setattr(Tango._TangoPollingGroup, "_groups", {})
+    yield pool
+    for group in list(Tango._TangoPollingGroup._groups.values()):
+        group.stop()
+
+
+def test_proxy_reuse(pool):
+    device = pool.get_device("id00/motor/1")
+    assert pool.get_device("ID00/Motor/1") is device
+    assert pool.get_device("id00/motor/1", 3000) is not device
+    assert pool.get_device("id00/motor/1", 3000).timeout == 3000
+
+    raw_device = pool.get_raw_device("id00/motor/1")
+    assert pool.get_raw_device("ID00/MOTOR/1") is raw_device
+    assert raw_device is not device
+
+    statistics = pool.get_statistics()
+    assert statistics["proxies"] == 3
+    assert statistics["misses"] == 3
+    assert statistics["hits"] == 3
+
+    pool.invalidate("id00/motor/1")
+    assert pool.get_device("id00/motor/1") is not device
+    assert pool.get_raw_device("id00/motor/1") is not raw_device
+    assert pool.get_statistics()["reconnects"] == 1
+
+
+def test_command_timeout(pool):
+    command = Tango.TangoCommand("prepare", "prepareAcq", "id00/limaccd/1")
+    command.init_device()
+    channel_device = pool.get_device("id00/limaccd/1")
+    assert command.device is channel_device
+
+    command.set_device_timeout(300000)
+    assert command.device.timeout == 300000
+    # the other users of the device keep their proxy and timeout
+    assert channel_device.timeout is None
+    assert pool.get_device("id00/limaccd/1") is channel_device
+
+
+def test_one_read_per_group(pool):
+    position = FakeChannel("id00/motor/1", "position")
+    position_bis = FakeChannel("id00/motor/1", "position")
+    state = FakeChannel("id00/motor/1", "state")
+    other_period = FakeChannel("id00/motor/1", "state", polling=20)
+
+    group = Tango._TangoPollingGroup.register(position)
+    assert Tango._TangoPollingGroup.register(position_bis) is group
+    assert Tango._TangoPollingGroup.register(state) is group
+    other_group = Tango._TangoPollingGroup.register(other_period)
+    assert other_group is not group
+
+    device = group.raw_device
+    device.values.update(position=1.5, state="ON")
+    gevent.sleep(0.1)
+
+    # the 20 ms group reads "state" through the same pooled proxy
+    assert other_group.raw_device is device
+    assert set(device.read_calls) == {("position", "state"), ("state",)}
+    assert position.values == position_bis.values == [1.5]
+    assert state.values == ["ON"]
+
+    # only changed values are handed to the channels
+    device.values["position"] = 2.5
+    gevent.sleep(0.1)
+    assert position.values == [1.5, 2.5]
+    assert state.values == ["ON"]
+
+
+def test_error_fan_out(pool):
+    position = FakeChannel("id00/motor/2", "position")
+    state = FakeChannel("id00/motor/2", "state")
+    group = Tango._TangoPollingGroup.register(position)
+    Tango._TangoPollingGroup.register(state)
+
+    group.raw_device.values.update(position=1.5, state="ON")
+    group.raw_device.errors["position"] = {"desc": "no position"}
+    gevent.sleep(0.1)
+
+    assert len(position.errors) == 1
+    assert isinstance(position.errors[0], DevFailed)
+    assert not position.values
+    assert state.values == ["ON"] and not state.errors
+    # the failed attribute is not read anymore, the others still are
+    assert group.attribute_names == ("state",)
+    assert group.raw_device.read_calls[-1] == ("state",)
+    assert not group.poller.is_stopped()
+
+
+def test_missing_attribute(pool):
+    position = FakeChannel("id00/motor/4", "position")
+    missing = FakeChannel("id00/motor/4", "missing")
+    group = Tango._TangoPollingGroup.register(position)
+    Tango._TangoPollingGroup.register(missing)
+
+    group.raw_device.values["position"] = 1.5
+    gevent.sleep(0.1)
+
+    # only the channel of the missing attribute fails
+    assert position.values == [1.5] and not position.errors
+    assert len(missing.errors) == 1
+    assert group.attribute_names == ("position",)
+    assert not group.poller.is_stopped()
+    assert pool.get_statistics()["reconnects"] == 0
+
+    # a channel on a missing attribute does not join the group
+    channel = Tango.TangoChannel("missing", "missing", "id00/motor/4", polling=10)
+    assert channel.device is None
+    assert channel.polling_group is None
+    assert group.attribute_names == ("position",)
+
+
+def test_remove_channel(pool):
+    position = FakeChannel("id00/motor/3", "position")
+    state = FakeChannel("id00/motor/3", "state")
+    group = Tango._TangoPollingGroup.register(position)
+    Tango._TangoPollingGroup.register(state)
+
+    group.remove(position)
+    assert group.attribute_names == ("state",)
+    gevent.sleep(0.1)
+    assert set(group.raw_device.read_calls) == {("state",)}
+
+    group.remove(state)
+    assert group.poller.is_stopped()
+    assert not Tango._TangoPollingGroup._groups
+    # a new channel gets a new group
+    assert Tango._TangoPollingGroup.register(state) is not group
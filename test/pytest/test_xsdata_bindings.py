@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import HardwareRepository
+from HardwareRepository.HardwareObjects import edna_test_data
+from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
+
+
+def test_registry():
+    registry = xsdata.get_registry()
+    assert registry["XSDataDouble"] == "XSDataCommon"
+    assert registry["XSDataInputControlDozor"] == "XSDataControlDozorv1_1"
+    # defined in both MXCuBE binding modules
+    assert registry["XSDataResultMXCuBE"] == "XSDataMXCuBEv1_4"
+    assert "XSDataDouble" in dir(xsdata)
+
+
+def test_resolve():
+    import XSDataCommon
+
+    assert xsdata.XSDataDouble is XSDataCommon.XSDataDouble
+    assert xsdata.XSDataDouble(1.5).value == 1.5
+    assert "XSDataCommon" in xsdata.get_loaded_modules()
+
+    result = xsdata.XSDataMXCuBEv1_3.XSDataResultMXCuBE.parseString(
+        edna_test_data.EDNA_RESULT_DATA
+    )
+    assert type(result).__module__ == "XSDataMXCuBEv1_3"
+    assert xsdata.XSDataResultMXCuBE.__module__ == "XSDataMXCuBEv1_4"
+
+    with pytest.raises(AttributeError):
+        xsdata.XSDataUnknown
+
+
+def test_lazy_import():
+    script = (
+        "import sys\n"
+        "import HardwareRepository.HardwareObjects.EDNACharacterisation\n"
+        "import HardwareRepository.HardwareObjects.EMBL.EMBLOfflineProcessing\n"
+        "print([name for name in sys.modules if 'XSData' in name])\n"
+    )
+    # run from the directory containing the HardwareRepository package
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(HardwareRepository.__file__)))
+    output = subprocess.check_output([sys.executable, "-c", script], cwd=cwd)
+    assert output.strip() == b"[]"
@@ -0,0 +1,62 @@
+from xml.dom import minidom
+
+import pytest
+
+from HardwareRepository.HardwareObjects import edna_test_data
+from HardwareRepository.HardwareObjects import xsdata_bindings as xsdata
+
+
+def make_dozor_result(images_num):
+    result = xsdata.XSDataResultControlDozor()
+    for index in range(images_num):
+        image = xsdata.XSDataControlImageDozor()
+        image.setNumber(xsdata.XSDataInteger(index))
+        image.setScore(xsdata.XSDataDouble(index * 0.5))
+        image.setSpots_num_of(xsdata.XSDataInteger(index % 50))
+        image.setSpots_resolution(xsdata.XSDataDouble(2.5))
+        result.addImageDozor(image)
+    return result
+
+
+@pytest.mark.parametrize(
+    "class_name,text",
+    [
+        ("XSDataResultMXCuBE", edna_test_data.EDNA_RESULT_DATA),
+        ("XSDataInputMXCuBE", edna_test_data.EDNA_DEFAULT_INPUT),
+    ],
+)
+def test_same_as_minidom(class_name, text):
+    cls = getattr(xsdata, class_name)
+    former = cls()
+    former.build(minidom.parseString(text).documentElement)
+    assert cls.parseString(text).marshal() == former.marshal()
+    assert cls.parseString(text.encode("utf-8")).marshal() == former.marshal()
+
+
+def test_round_trip(tmp_path):
+    result = make_dozor_result(1000)
+    xml = result.marshal()
+    parsed = xsdata.XSDataResultControlDozor.parseString(xml)
+    assert len(parsed.imageDozor) == 1000
+    assert parsed.imageDozor[-1].score.value == 999 * 0.5
+    assert parsed.copy().marshal() == xml
+
+    file_path = str(tmp_path / "dozor.xml")
+    result.exportToFile(file_path)
+    with open(file_path) as xml_file:
+        assert xml_file.read() == xml
+    assert xsdata.XSDataResultControlDozor.parseFile(file_path).marshal() == xml
+
+
+def test_values():
+    text = (
+        '<?xml version="1.0" ?>'
+        '<edna:XSDataString xmlns:edna="urn:edna">'
+        "<edna:value>a &lt; b</edna:value>"
+        "</edna:XSDataString>"
+    )
+    assert xsdata.XSDataString.parseString(text).value == "a < b"
+    assert xsdata.XSDataString.parseString("<s><value/></s>").value == ""
+
+    with pytest.raises(ValueError):
+        xsdata.XSDataDouble.parseString("<d><value>x</value></d>")
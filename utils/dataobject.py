@@ -24,6 +24,47 @@ import copy
 __copyright__ = """ Copyright © 2019 by the MXCuBE collaboration """
 __license__ = "LGPLv3+"
 
+# Values shared, instead of copied, by the snapshots
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# Schema keywords that only constrain the value of each property separately:
+# with only these at the top level, a changed key is validated on its own
+_PER_PROPERTY_KEYWORDS = frozenset(
+    (
+        "$schema",
+        "$id",
+        "id",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "definitions",
+        "$defs",
+        "type",
+        "properties",
+        "required",
+        "additionalProperties",
+    )
+)
+
+
+def _copy_value(value):
+    """Copy of a value, for a snapshot. Immutable values are shared"""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
+def _snapshot(data):
+    return dict((key, _copy_value(value)) for key, value in data.items())
+
+
+def _raise_best_error(validator, instance):
+    # same error as reported by jsonschema.validate
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
 
 class DataObject(dict):
     """
@@ -38,8 +79,10 @@ class DataObject(dict):
         dict.__init__(self, *args, **kwargs)
         self.validate()
         self._intset("_mutations", [])
-        self._intset("_original", copy.deepcopy(dict(self)))
-        self._intset("_previous", copy.deepcopy(dict(self)))
+        self._intset("_original", _snapshot(self))
+        # shallow copy: the values are shared with _original, a mutation
+        # replaces the value of its key in _previous, never in _original
+        self._intset("_previous", dict(self._original))
 
     def _immutable(self, *args, **kwargs):
         raise TypeError(
@@ -48,6 +91,7 @@ class DataObject(dict):
 
     _intset = dict.__setattr__
     _setitem = dict.__setitem__
+    _delitem = dict.__delitem__
     clear = _immutable
     update = _immutable
     setdefault = _immutable
@@ -61,6 +105,45 @@ class DataObject(dict):
     def __hash__(self):
         return id(self)
 
+    @classmethod
+    def _get_validator(cls):
+        """
+        Returns:
+            The jsonschema validator of _SCHEMA, compiled once per class
+        """
+        validator = cls.__dict__.get("_validator")
+        if validator is None or validator.schema is not cls._SCHEMA:
+            validator_class = jsonschema.validators.validator_for(cls._SCHEMA)
+            validator_class.check_schema(cls._SCHEMA)
+            validator = validator_class(cls._SCHEMA)
+            # set on the class itself, subclasses have their own schema
+            cls._validator = validator
+            cls._property_validators = {}
+        return validator
+
+    @classmethod
+    def _get_property_validator(cls, key):
+        """
+        Returns:
+            The validator of the value of property <key>, or None if the
+            property can not be validated separately from the others
+        """
+        validator = cls._get_validator()
+        property_validators = cls.__dict__["_property_validators"]
+        if key not in property_validators:
+            schema = cls._SCHEMA
+            properties = schema.get("properties", {})
+            property_validator = None
+            if key in properties and _PER_PROPERTY_KEYWORDS.issuperset(schema):
+                if hasattr(validator, "evolve"):
+                    property_validator = validator.evolve(schema=properties[key])
+                else:
+                    property_validator = type(validator)(
+                        properties[key], resolver=validator.resolver
+                    )
+            property_validators[key] = property_validator
+        return property_validators[key]
+
     def dangerously_set(self, key, value):
         """
         Sets the attribute name <key> to value
@@ -78,23 +161,52 @@ class DataObject(dict):
                 % (str(self), key, value)
             )
 
+        is_new = key not in self
         self._setitem(key, value)
 
         try:
-            self.validate()
+            self.validate(key)
         except jsonschema.exceptions.ValidationError:
-            self._setitem(key, self._previous[key])
+            if is_new:
+                self._delitem(key)
+            else:
+                self._setitem(key, self._previous[key])
             raise
         else:
+            value = _copy_value(value)
             self._mutations.append((key, value))
-            self._intset("_previous", copy.deepcopy(dict(self)))
+            self._previous[key] = value
 
-    def validate(self):
+    def validate(self, key=None):
         """
         Validates the attributes against the schema defined in _SCHEMA
+
+        Args:
+            key (str): Only validate this attribute, if its schema allows it
         """
         if self._SCHEMA:
-            jsonschema.validate(instance=self, schema=self._SCHEMA)
+            validator = None
+            if key is not None:
+                validator = self._get_property_validator(key)
+            if validator is None:
+                _raise_best_error(self._get_validator(), self)
+            else:
+                _raise_best_error(validator, self[key])
+
+    def get_changes(self):
+        """
+        Returns:
+            (dict): attribute name -> (original value, current value) of
+                    the attributes changed since creation
+        """
+        changes = {}
+        for key, value in self._mutations:
+            original = self._original.get(key)
+            if original != value:
+                changes[key] = (original, value)
+            else:
+                changes.pop(key, None)
+        return changes
 
     def to_mutable(self):
         """
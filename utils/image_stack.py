@@ -0,0 +1,324 @@
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""Image stack of an X-ray imaging scan, for display
+
+Frames are decoded on demand, never all at once: only the flat field
+images and a bounded LRU cache of display frames (normalised to uint8, with
+or without flat field correction) are kept in memory. Worker threads decode
+the frames ahead of the playback cursor (read_ahead). The flat field
+correction and the normalisation are computed with numpy ufuncs into
+buffers allocated once per worker thread.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+__copyright__ = """ Copyright © 2020 by the MXCuBE collaboration """
+__license__ = "LGPLv3+"
+
+# Number of display frames kept in memory (4 MB each for 2048 x 2048 frames)
+CACHE_SIZE = 256
+
+# Number of frames decoded ahead of the playback cursor
+READ_AHEAD = 32
+
+# Number of decoding threads
+WORKERS_NUM = 4
+
+# First rows of the frames are not used for the normalisation levels
+LEVELS_FIRST_ROW = 8
+
+# Saturated flat field pixels are not used for the normalisation levels
+FF_SATURATED = pow(2, 16) - 1
+
+
+class ImageStack(object):
+    """Frames of an imaging scan, with their optional flat field images
+
+    Args:
+        raw_filename_list (list): frame files
+        read_function (function): file name -> 2D numpy array, or None
+            if the file cannot be read (e.g. not written yet)
+        ff_filename_list (list): flat field files
+        ff_ssim (list): for each frame, (.., .., flat field number) of the
+            most similar flat field image; if None, flat field images are
+            spread evenly over the frames
+        cache_size (int): number of display frames kept in memory
+        workers_num (int): number of decoding threads, 0 to only decode
+            on demand
+    """
+
+    def __init__(
+        self,
+        raw_filename_list,
+        read_function,
+        ff_filename_list=(),
+        ff_ssim=None,
+        cache_size=CACHE_SIZE,
+        workers_num=WORKERS_NUM,
+    ):
+        self.raw_filename_list = list(raw_filename_list)
+        self.ff_filename_list = list(ff_filename_list)
+        self.ff_ssim = ff_ssim
+        self.read_function = read_function
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        # (index, ff_apply) -> uint8 frame, least recently used first
+        self._cache = OrderedDict()
+        self._ff_images = [None] * len(self.ff_filename_list)
+        self._raw_levels = None
+        self._corrected_levels = None
+        self._buffers = threading.local()
+
+        # frames to decode, next first
+        self._tasks = deque()
+        self._pending = set()
+        self._tasks_available = threading.Condition(self._lock)
+        self._stopped = False
+
+        self._hits = 0
+        self._misses = 0
+        self._decoded = 0
+        self._decode_time = 0
+        self._buffer_bytes = 0
+
+        self._workers = []
+        for _ in range(workers_num):
+            worker = threading.Thread(target=self._decode_tasks)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def __len__(self):
+        return len(self.raw_filename_list)
+
+    def close(self):
+        """Stop the decoding threads and release the frames"""
+        with self._lock:
+            self._stopped = True
+            self._tasks.clear()
+            self._pending.clear()
+            self._cache.clear()
+            self._tasks_available.notify_all()
+
+    def get_raw_image(self, index):
+        """Returns the decoded frame (not cached), None if it cannot be read"""
+        return self.read_function(self.raw_filename_list[index])
+
+    def get_ff_index(self, index):
+        """Returns the index of the flat field image of a frame"""
+        if self.ff_ssim:
+            return self.ff_ssim[index][2] - 1
+        return int(index / float(len(self.raw_filename_list)) * len(self._ff_images))
+
+    def get_ff_image(self, index):
+        """Returns the flat field image of a frame, decoded once"""
+        ff_index = self.get_ff_index(index)
+        ff_image = self._ff_images[ff_index]
+        if ff_image is None:
+            ff_image = self.read_function(self.ff_filename_list[ff_index])
+            self._ff_images[ff_index] = ff_image
+        return ff_image
+
+    def get_frame(self, index, ff_apply=False):
+        """Returns a display frame, decoded now if it is not in the cache
+
+        Args:
+            index (int): frame index
+            ff_apply (bool): apply the flat field correction (if the scan
+                has flat field images)
+
+        Returns:
+            (numpy.array): uint8 frame, None if the frame cannot be read
+        """
+        ff_apply = bool(ff_apply and self.ff_filename_list)
+        key = (index, ff_apply)
+        with self._lock:
+            frame = self._cache.get(key)
+            if frame is not None:
+                self._hits += 1
+                # most recently used
+                del self._cache[key]
+                self._cache[key] = frame
+                return frame
+            self._misses += 1
+        return self._decode(index, ff_apply)
+
+    def read_ahead(self, index, step=1, count=READ_AHEAD, ff_apply=False, wrap=False):
+        """Decode, in the worker threads, the frames following the playback
+        cursor. Frames requested by previous calls and not started yet are
+        dropped.
+
+        Args:
+            index (int): playback cursor
+            step (int): index increment between displayed frames (negative
+                when playing backwards)
+            count (int): number of frames
+            ff_apply (bool): apply the flat field correction
+            wrap (bool): continue from the other end of the stack
+        """
+        if not step or not self._workers:
+            return
+        ff_apply = bool(ff_apply and self.ff_filename_list)
+        frames_num = len(self.raw_filename_list)
+        count = min(count, self.cache_size // 2)
+
+        with self._lock:
+            # frames being decoded stay pending
+            self._pending.difference_update(self._tasks)
+            self._tasks.clear()
+            for position in range(1, count + 1):
+                next_index = index + position * step
+                if wrap:
+                    next_index %= frames_num
+                elif not 0 <= next_index < frames_num:
+                    break
+                key = (next_index, ff_apply)
+                if key not in self._cache and key not in self._pending:
+                    self._pending.add(key)
+                    self._tasks.append(key)
+            self._tasks_available.notify_all()
+
+    def get_statistics(self):
+        """Returns the memory used by the stack, and the cache and decoding
+        statistics
+
+        Returns:
+            (dict): frames, cached_frames, cache_size, cache_bytes, ff_bytes,
+                buffer_bytes, hits, misses, decoded, decode_rate (frames/s
+                per thread)
+        """
+        with self._lock:
+            return {
+                "frames": len(self.raw_filename_list),
+                "cached_frames": len(self._cache),
+                "cache_size": self.cache_size,
+                "cache_bytes": sum(frame.nbytes for frame in self._cache.values()),
+                "ff_bytes": sum(
+                    ff_image.nbytes
+                    for ff_image in self._ff_images
+                    if ff_image is not None
+                ),
+                "buffer_bytes": self._buffer_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "decoded": self._decoded,
+                "decode_rate": (
+                    self._decoded / self._decode_time if self._decode_time else 0
+                ),
+            }
+
+    def _decode_tasks(self):
+        while True:
+            with self._lock:
+                while not self._tasks and not self._stopped:
+                    self._tasks_available.wait()
+                if self._stopped:
+                    return
+                key = self._tasks.popleft()
+            try:
+                self._decode(*key)
+            except Exception:
+                logging.getLogger("HWR").exception(
+                    "Could not decode frame %d of the image stack", key[0]
+                )
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+    def _decode(self, index, ff_apply):
+        start_time = time.time()
+        raw_image = self.get_raw_image(index)
+        if raw_image is None:
+            return None
+        levels = self._get_levels()
+        if levels is None:
+            return None
+
+        buffers = self._get_buffers(raw_image.shape)
+        image = buffers.image
+        if ff_apply:
+            ff_image = self.get_ff_image(index)
+            if ff_image is None:
+                return None
+            # pixels with a null flat field are set to 1
+            np.not_equal(ff_image, 0, out=buffers.mask)
+            image.fill(1)
+            np.divide(
+                raw_image, ff_image, out=image, where=buffers.mask, dtype=np.float32
+            )
+            low, high = levels[1]
+        else:
+            image[...] = raw_image
+            low, high = levels[0]
+
+        image -= low
+        image *= 255.0 / ((high - low) or 1)
+        np.clip(image, 0, 255, out=image)
+        frame = image.astype(np.uint8)
+
+        with self._lock:
+            if not self._stopped:
+                self._cache[(index, ff_apply)] = frame
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            self._decoded += 1
+            self._decode_time += time.time() - start_time
+        return frame
+
+    def _get_buffers(self, shape):
+        buffers = self._buffers
+        if getattr(buffers, "image", None) is None or buffers.image.shape != shape:
+            buffers.image = np.empty(shape, dtype=np.float32)
+            buffers.mask = np.empty(shape, dtype=bool)
+            with self._lock:
+                self._buffer_bytes += buffers.image.nbytes + buffers.mask.nbytes
+        return buffers
+
+    def _get_levels(self):
+        """Normalisation levels (min, max) of the raw and flat field corrected
+        frames, from the first frame"""
+        if self._raw_levels is None:
+            raw_image = self.get_raw_image(0)
+            if raw_image is None:
+                return None
+            raw_image = raw_image[LEVELS_FIRST_ROW:]
+            raw_levels = (float(raw_image.min()), float(raw_image.max()))
+            corrected_levels = raw_levels
+            if self.ff_filename_list:
+                ff_image = self.get_ff_image(0)
+                if ff_image is None:
+                    return None
+                ff_image = ff_image[LEVELS_FIRST_ROW:]
+                corrected = np.ones(raw_image.shape, dtype=np.float32)
+                valid = (ff_image != 0) & (ff_image != FF_SATURATED)
+                np.divide(
+                    raw_image, ff_image, out=corrected, where=valid, dtype=np.float32
+                )
+                corrected_levels = (float(corrected.min()), float(corrected.max()))
+            self._corrected_levels = corrected_levels
+            self._raw_levels = raw_levels
+        return self._raw_levels, self._corrected_levels
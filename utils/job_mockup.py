@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""Stand-in for the external processing programs (EDNA, dozor, autoproc),
+to run the JobRunner offline: burns CPU, holds memory, sleeps, then writes
+an output file and exits with the requested code.
+
+Usage:
+    python job_mockup.py [--cpu S] [--memory MB] [--sleep S]
+                         [--output FILE] [--exit-code N]
+"""
+
+import argparse
+import sys
+import time
+
+__copyright__ = """ Copyright © 2020 by the MXCuBE collaboration """
+__license__ = "LGPLv3+"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in processing program")
+    parser.add_argument("--cpu", type=float, default=0, help="CPU time [s]")
+    parser.add_argument("--memory", type=int, default=0, help="memory held [MB]")
+    parser.add_argument("--sleep", type=float, default=0, help="idle time [s]")
+    parser.add_argument("--output", help="file written at the end")
+    parser.add_argument("--exit-code", type=int, default=0, help="exit code")
+    args = parser.parse_args(argv)
+
+    # touch every page, so that it counts in the resident set size
+    memory = bytearray(args.memory * 1024 * 1024)
+    for index in range(0, len(memory), 4096):
+        memory[index] = 1
+
+    end_time = time.time() + args.cpu
+    while time.time() < end_time:
+        pass
+
+    time.sleep(args.sleep)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write("done\n")
+    return args.exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""Runs a command of the JobRunner and records its resource usage
+
+The gevent hub reaps the processes started from MXCuBE, so their resource
+usage cannot be read with wait4 there. This script runs the command, waits
+for it with wait4, and writes the CPU time and the maximum resident set size
+of the command (and of the processes it waited for) to a JSON file.
+Standard library only: it is run as a script with the MXCuBE interpreter.
+
+Usage:
+    python job_wrapper.py USAGE_FILE COMMAND [ARGUMENT ...]
+"""
+
+import errno
+import json
+import os
+import signal
+import subprocess
+import sys
+
+__copyright__ = """ Copyright © 2020 by the MXCuBE collaboration """
+__license__ = "LGPLv3+"
+
+
+def run(usage_file, command):
+    """Run a command, write its resource usage
+
+    Args:
+        usage_file (str): JSON output file
+        command (list): command and arguments
+
+    Returns:
+        (int): exit code of the command, 128 + signal number if killed
+    """
+    process = subprocess.Popen(command)
+    # the process group is terminated on cancel: the command exits,
+    # the usage is still written
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    while True:
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+            break
+        except OSError as ex:
+            if ex.errno != errno.EINTR:
+                raise
+
+    if os.WIFSIGNALED(status):
+        returncode = 128 + os.WTERMSIG(status)
+    else:
+        returncode = os.WEXITSTATUS(status)
+
+    usage = {
+        "returncode": returncode,
+        "cpu_time": rusage.ru_utime + rusage.ru_stime,
+        # kB on Linux
+        "max_rss": rusage.ru_maxrss,
+    }
+    with open(usage_file, "w") as json_file:
+        json.dump(usage, json_file)
+    return returncode
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        sys.stderr.write(__doc__)
+        sys.exit(2)
+    sys.exit(run(sys.argv[1], sys.argv[2:]))
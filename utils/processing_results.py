@@ -0,0 +1,245 @@
+# encoding: utf-8
+#
+#  Project: MXCuBE
+#  https://github.com/mxcube
+#
+#  This file is part of MXCuBE software.
+#
+#  MXCuBE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  MXCuBE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with MXCuBE. If not, see <http://www.gnu.org/licenses/>.
+
+"""Storage of online processing results
+
+Raw results are one dimensional arrays, indexed on the frame number.
+Aligned results are the same values, either as a copy (line and serial
+scans) or placed on the (col, row) cells of a mesh grid. Arrays of a known
+size are allocated once per scan, and batches of frames are written with
+fancy indexing. Arrays of an unknown size (streamed values) grow by
+doubling their capacity. Realignment and the selection of the best frames
+only touch the frames of each new batch, or use partial sorting.
+"""
+
+import numpy as np
+
+__copyright__ = """ Copyright © 2020 by the MXCuBE collaboration """
+__license__ = "LGPLv3+"
+
+# Initial capacity of the arrays of streamed values
+MIN_CAPACITY = 256
+
+# Number of lines formatted at once by save_csv
+CSV_CHUNK_SIZE = 10000
+
+
+def get_col_row_index(get_col_row, frames_num, shape=None):
+    """Precompute the (col, row) grid cell of each frame
+
+    Args:
+        get_col_row (function): frame index -> (col, row), called once per frame
+        frames_num (int): number of frames
+        shape (tuple): (number of cols, number of rows); frames outside of
+            it are marked with -1
+
+    Returns:
+        (tuple): cols, rows (numpy int arrays of size frames_num)
+    """
+    index = np.array(
+        [get_col_row(frame) for frame in range(frames_num)], dtype=np.intp
+    ).reshape(frames_num, 2)
+    cols = index[:, 0].copy()
+    rows = index[:, 1].copy()
+    if shape is not None:
+        outside = (cols < 0) | (cols >= shape[0]) | (rows < 0) | (rows >= shape[1])
+        cols[outside] = -1
+        rows[outside] = -1
+    return cols, rows
+
+
+def smooth(values, step):
+    """Mean of each value over the window [index - step, index + step[,
+    truncated at the edges of the array
+
+    Args:
+        values (numpy.array): one dimensional values
+        step (int): half width of the window
+
+    Returns:
+        (numpy.array): smoothed values, a new array
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0 or step < 1:
+        return values.copy()
+    kernel = np.ones(2 * step)
+    end = step - 1 + values.size
+    sums = np.convolve(values, kernel)[step - 1 : end]
+    counts = np.convolve(np.ones(values.size), kernel)[step - 1 : end]
+    return sums / counts
+
+
+def get_best_indices(values, count):
+    """Indices of the largest positive values, best first
+
+    Args:
+        values (numpy.array): one dimensional values
+        count (int): maximum number of indices
+
+    Returns:
+        (numpy.array): indices
+    """
+    values = np.asarray(values)
+    if values.size > count:
+        indices = np.argpartition(-values, count - 1)[:count]
+    else:
+        indices = np.arange(values.size)
+    indices = indices[values[indices] > 0]
+    return indices[np.argsort(-values[indices], kind="stable")]
+
+
+def save_csv(csv_file, columns, formats):
+    """Write columns of values, one line per index, formatted in chunks of
+    CSV_CHUNK_SIZE lines
+
+    Args:
+        csv_file (file): opened text file
+        columns (list): numpy arrays of the same size
+        formats (list): format of each column, e.g. "%d"
+    """
+    rows = np.column_stack(columns)
+    line_format = ",".join(formats) + "\n"
+    for start in range(0, len(rows), CSV_CHUNK_SIZE):
+        chunk = rows[start : start + CSV_CHUNK_SIZE]
+        csv_file.write((line_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+class ProcessingResults(object):
+    """Raw and aligned results of one online processing
+
+    Attributes:
+        raw (dict): key -> one dimensional numpy array
+        aligned (dict): key -> numpy array, two dimensional for a mesh
+    """
+
+    def __init__(self):
+        self.raw = {}
+        self.aligned = {}
+        self._buffers = {}
+        self._sizes = {}
+        self._cols = None
+        self._rows = None
+
+    def allocate(self, key, size, shape=None):
+        """Allocate the arrays of a result
+
+        Args:
+            key (str): result key
+            size (int): number of frames, 0 for streamed values
+            shape (tuple): (number of cols, number of rows) of a mesh
+        """
+        if size:
+            self.raw[key] = np.zeros(size)
+            if shape is not None:
+                self.aligned[key] = np.zeros(shape)
+            else:
+                self.aligned[key] = np.zeros(size)
+        else:
+            self._buffers[key] = np.zeros(MIN_CAPACITY)
+            self._sizes[key] = 0
+            self.raw[key] = self.aligned[key] = self._buffers[key][:0]
+
+    def set_grid_index(self, cols, rows):
+        """Set the (col, row) cell of each frame, see get_col_row_index
+
+        Args:
+            cols (numpy.array): col of each frame, -1 if outside of the grid
+            rows (numpy.array): row of each frame, -1 if outside of the grid
+        """
+        self._cols = np.asarray(cols, dtype=np.intp)
+        self._rows = np.asarray(rows, dtype=np.intp)
+
+    def has_grid_index(self):
+        """Returns True if a grid index is set"""
+        return self._cols is not None
+
+    def get_col_row(self, frame):
+        """Returns the (col, row) cell of a frame, (-1, -1) if outside of the
+        grid, None if no grid index is set
+        """
+        if self._cols is None:
+            return None
+        return int(self._cols[frame]), int(self._rows[frame])
+
+    def set_values(self, frames, values, align=True):
+        """Write the results of a batch of frames
+
+        Args:
+            frames (numpy.array): frame indices
+            values (dict): key -> values, one per frame
+            align (bool): write the aligned results as well
+        """
+        frames = np.asarray(frames, dtype=np.intp)
+        for key, key_values in values.items():
+            self.raw[key][frames] = key_values
+        if align:
+            self.align(frames)
+
+    def align(self, frames):
+        """Copy the raw results of some frames to the aligned results, for
+        all results of a fixed size
+
+        Args:
+            frames (numpy.array): frame indices
+        """
+        frames = np.asarray(frames, dtype=np.intp)
+        for key, raw in self.raw.items():
+            if key in self._buffers:
+                continue
+            aligned = self.aligned[key]
+            if aligned.ndim == 2:
+                if self._cols is None:
+                    continue
+                cols = self._cols[frames]
+                rows = self._rows[frames]
+                inside = cols >= 0
+                aligned[cols[inside], rows[inside]] = raw[frames[inside]]
+            else:
+                inside = frames[frames < aligned.size]
+                aligned[inside] = raw[inside]
+
+    def append(self, key, values):
+        """Append streamed values, in amortised constant time
+
+        Args:
+            key (str): result key, allocated with size 0
+            values (float or list): value(s) to append
+        """
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        buffer = self._buffers[key]
+        size = self._sizes[key]
+        new_size = size + values.size
+        if new_size > buffer.size:
+            new_buffer = np.zeros(max(new_size, 2 * buffer.size))
+            new_buffer[:size] = buffer[:size]
+            buffer = self._buffers[key] = new_buffer
+        buffer[size:new_size] = values
+        self._sizes[key] = new_size
+        self.raw[key] = self.aligned[key] = buffer[:new_size]
+
+    def smooth(self, keys, step):
+        """Replace raw results with their moving mean, see smooth
+
+        Args:
+            keys (list): result keys
+            step (int): half width of the window
+        """
+        for key in keys:
+            self.raw[key][:] = smooth(self.raw[key], step)